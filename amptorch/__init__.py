@@ -1,2 +1,2 @@
-from .ase_utils import AmpTorch
+from .ase_utils import AmpTorch, IncrementalEnergy
 from .trainer import AtomsTrainer
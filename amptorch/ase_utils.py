@@ -1,26 +1,168 @@
-from ase.calculators.calculator import Calculator
+import numpy as np
+import torch
+from ase.calculators.calculator import Calculator, PropertyNotImplementedError
+from ase.geometry import get_distances
+
+from .descriptor.neighbor_list import NeighborList
 
 
 class AmpTorch(Calculator):
     """
-    Create an ase.calculators.calculator.Calculator class to compute the energy (and forces) for the given ase.Atoms object.
+    Create an ase.calculators.calculator.Calculator class to compute the energy (and forces and stress) for the given ase.Atoms object.
+
+    Args:
+    ------------
+    trainer : the trained AtomsTrainer.
+
+    skin : float (default to None)
+        Skin distance of a Verlet neighbor list kept between calls, so that the neighbors are not searched again at every step of a molecular dynamics run or a geometry optimization. The neighbors are searched at every call when None.
 
     Method:
     ------------
-    calculate : Calculates the corresponding energy (and forces) with loaded parameters in the model.
+    calculate : Calculates the corresponding energy (and forces) with loaded parameters in the model. The stress of periodic structures is computed together with the forces when it is requested.
     """
 
-    implemented_properties = ["energy", "forces"]
+    implemented_properties = ["energy", "forces", "stress"]
 
-    def __init__(self, trainer):
+    def __init__(self, trainer, skin=None):
         Calculator.__init__(self)
 
         self.trainer = trainer
+        self.neighbor_list = None if skin is None else NeighborList(skin)
 
     def calculate(self, atoms, properties, system_changes):
         Calculator.calculate(self, atoms, properties, system_changes)
 
-        predictions = self.trainer.predict([atoms])
+        get_stress = "stress" in properties
+        if get_stress and not atoms.pbc.all():
+            raise PropertyNotImplementedError("Stress requires a periodic structure!")
+
+        predictions = self.trainer.predict(
+            [atoms], neighbor_lists=[self.neighbor_list], get_stress=get_stress
+        )
 
         self.results["energy"] = predictions["energy"][0]
         self.results["forces"] = predictions["forces"][0]
+        if get_stress:
+            self.results["stress"] = predictions["stress"][0]
+
+
+class IncrementalState:
+    """
+    Energy of a structure evaluated by IncrementalEnergy, with the atomic
+    energies and the atoms it was computed from.
+
+    Attributes:
+    ------------
+    energy : float
+        Predicted energy of the structure.
+
+    atomic_energies : np.ndarray
+        Energy of each atom, before the target scaling.
+    """
+
+    def __init__(self, atoms, atomic_energies, total, energy):
+        self.positions = atoms.get_positions()
+        self.numbers = atoms.get_atomic_numbers()
+        self.cell = atoms.cell.array.copy()
+        self.pbc = atoms.pbc.copy()
+        self.atomic_energies = atomic_energies
+        self.total = total
+        self.energy = energy
+
+
+class IncrementalEnergy:
+    """
+    Energy of a structure updated incrementally along Monte Carlo or basin-hopping moves displacing a few atoms.
+
+    Only the atoms within the cutoff of the descriptor of a moved atom (before or after the move) have new fingerprints. A trial fingerprints these atoms only, runs the network on them only, and updates the energy of the previous state by the difference of their atomic energies, so that its cost scales with the number of neighbors of the moved atoms instead of the number of atoms of the cell.
+
+    Args:
+    ------------
+    trainer : the trained AtomsTrainer.
+
+    skin : float (default to None)
+        Skin distance of a Verlet neighbor list kept between the trials, see AmpTorch.
+
+    Method:
+    ------------
+    evaluate : Evaluates the state of a structure from all its atoms.
+
+    update : Evaluates the state of a structure from a previous state, of the same cell and atoms, and the atoms moved since then. The previous state is left unchanged, so that a rejected trial is simply discarded.
+    """
+
+    def __init__(self, trainer, skin=None):
+        self.trainer = trainer
+        self.neighbor_list = None if skin is None else NeighborList(skin)
+        # the descriptor and the data converter of the predictions of the
+        # trainer, so that the energies are the ones of predict
+        self.descriptor = trainer._predict_descriptor()
+        self.cutoff = self.descriptor.get_cutoff()
+        self.a2d = trainer._predict_converter(save_fps=False, fprimes=False)
+
+    def _atomic_energies(self, atoms, center_atoms=None):
+        # energies of the center atoms (all the atoms by default), before the
+        # target scaling. The scaled fingerprints are taken from the cache of
+        # the trainer when it has one
+        data = self.trainer._predict_data(
+            self.a2d,
+            [atoms],
+            True,
+            [self.neighbor_list],
+            center_atoms=None if center_atoms is None else [center_atoms],
+        )[0]
+        model = self.trainer.net.module
+        model.eval()
+        with torch.no_grad():
+            data = data.to(self.trainer.device)
+            energies = model.atomic_energies(data, data.fingerprint)
+        return energies.cpu().numpy().astype(np.float64)
+
+    def _state(self, atoms, atomic_energies, total):
+        energy = self.trainer.target_scaler.denorm(
+            torch.tensor(total), pred="energy"
+        ).item()
+        return IncrementalState(atoms, atomic_energies, total, energy)
+
+    def evaluate(self, atoms):
+        atomic_energies = self._atomic_energies(atoms)
+        return self._state(atoms, atomic_energies, atomic_energies.sum())
+
+    def update(self, state, atoms, moved_atoms=None):
+        """
+        moved_atoms (list of int): Atoms displaced, or whose element changed,
+        since state. They are found by comparing atoms with state when None.
+        """
+        numbers = atoms.get_atomic_numbers()
+        if (
+            len(numbers) != len(state.numbers)
+            or not np.array_equal(atoms.cell.array, state.cell)
+            or not np.array_equal(atoms.pbc, state.pbc)
+        ):
+            raise ValueError(
+                "The cell and the number of atoms must be the ones of the previous state!"
+            )
+        positions = atoms.get_positions()
+        if moved_atoms is None:
+            moved_atoms = np.flatnonzero(
+                (positions != state.positions).any(axis=1) | (numbers != state.numbers)
+            )
+        moved_atoms = np.asarray(moved_atoms, dtype=int).reshape(-1)
+        if len(moved_atoms) == 0:
+            return state
+
+        # the atoms with a moved atom within the cutoff, before or after the
+        # move, the minimum image is the closest of the periodic images
+        _, distances = get_distances(
+            np.concatenate([state.positions[moved_atoms], positions[moved_atoms]]),
+            positions,
+            cell=atoms.cell,
+            pbc=atoms.pbc,
+        )
+        center_atoms = np.flatnonzero((distances <= self.cutoff).any(axis=0))
+
+        energies = self._atomic_energies(atoms, center_atoms=center_atoms)
+        atomic_energies = state.atomic_energies.copy()
+        total = state.total + energies.sum() - atomic_energies[center_atoms].sum()
+        atomic_energies[center_atoms] = energies
+        return self._state(atoms, atomic_energies, total)
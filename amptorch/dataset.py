@@ -29,6 +29,8 @@ class AtomsDataset(Dataset):
 
         cores (int): The number of cores to use for parallel processing (default is 1).
 
+        environment_tolerance (float): Tolerance (in Angstrom) within which the fingerprints of the atoms with the same environment up to a translation are computed once (default is None, every atom is fingerprinted).
+
         process (bool): Whether to process the data during initialization (default is True).
 
     """
@@ -42,6 +44,7 @@ class AtomsDataset(Dataset):
         scaling={"type": "normalize", "range": (0, 1), "threshold": 1e-6},
         cores=1,
         process=True,
+        environment_tolerance=None,
     ):
         self.images = images
         self.forcetraining = forcetraining
@@ -55,6 +58,7 @@ class AtomsDataset(Dataset):
             save_fps=save_fps,
             fprimes=forcetraining,
             cores=cores,
+            environment_tolerance=environment_tolerance,
         )
 
         self.data_list = self.process() if process else None
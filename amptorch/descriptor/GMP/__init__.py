@@ -1,11 +1,16 @@
 import hashlib
 
 import numpy as np
-from scipy import sparse
 
 from ..base_descriptor import BaseDescriptor
 from ..constants import ATOM_SYMBOL_TO_INDEX_DICT
-from ..util import _gen_2Darray_for_ffi, list_symbols_to_indices
+from ..util import (
+    _flat_array_for_ffi,
+    _ImageBatch,
+    _neighbor_pairs,
+    list_symbols_to_indices,
+)
+from ..GMPOrderNorm import GMPOrderNorm
 from ._libgmp import ffi, lib
 
 
@@ -19,6 +24,8 @@ class GMP(BaseDescriptor):
     elements [dict] : a dictionary of string of chemical elements in the system.
     """
 
+    supports_force_contraction = True
+
     def __init__(
         self,
         MCSHs,
@@ -151,7 +158,7 @@ class GMP(BaseDescriptor):
         self.params_set["ngaussians"] = ngaussian_list
         self.params_set["ngaussians_p"] = ffi.cast("int *", ngaussian_list.ctypes.data)
         self.params_set["gaussian_params"] = overall_gaussian_params
-        self.params_set["gaussian_params_p"] = _gen_2Darray_for_ffi(
+        self.params_set["gaussian_params_p"] = _flat_array_for_ffi(
             overall_gaussian_params, ffi
         )
         self.params_set["element_index_to_order"] = element_index_to_order_list
@@ -171,15 +178,34 @@ class GMP(BaseDescriptor):
         self.params_set["i"] = params_i
         self.params_set["d"] = params_d
 
-        self.params_set["ip"] = _gen_2Darray_for_ffi(self.params_set["i"], ffi, "int")
-        self.params_set["dp"] = _gen_2Darray_for_ffi(self.params_set["d"], ffi)
+        self.params_set["ip"] = _flat_array_for_ffi(self.params_set["i"], ffi, "int")
+        self.params_set["dp"] = _flat_array_for_ffi(self.params_set["d"], ffi)
         self.params_set["total"] = np.concatenate(
             (self.params_set["i"], self.params_set["d"]), axis=1
         )
         self.params_set["num"] = len(self.params_set["total"])
 
-        if "prime_threshold" in self.MCSHs:
-            self.params_set["prime_threshold"] = float(self.MCSHs["prime_threshold"])
+        # derivatives smaller than the threshold are dropped by the kernels.
+        # When the threshold is given, the overlaps changing the components
+        # or their derivatives by less than it are also screened out, as by
+        # GMPOrderNorm whose components are the surface harmonics of GMP
+        self.params_set["prime_threshold"] = float(
+            self.MCSHs.get("prime_threshold", 0.0)
+        )
+        self.params_set["screening_threshold"] = self.params_set["prime_threshold"]
+        radii_sqr = GMPOrderNorm._screening_radii_sqr(
+            self.params_set,
+            False,
+            GMPOrderNorm._gaussian_overlap_coefficients(
+                params_d, overall_gaussian_params
+            ),
+            self.params_set["screening_threshold"],
+        )
+        # row element_order * nmcsh + probe holds the squared screening radii
+        # of the gaussians of the element
+        radii_sqr = np.ascontiguousarray(radii_sqr.reshape(-1, radii_sqr.shape[-1]))
+        self.params_set["screening_radii_sqr"] = radii_sqr
+        self.params_set["screening_radii_sqr_p"] = _flat_array_for_ffi(radii_sqr, ffi)
 
         self.params_set["square"] = self.MCSHs.get("square", False)
 
@@ -193,6 +219,11 @@ class GMP(BaseDescriptor):
         for desc in self.descriptor_setup:
             for num in desc:
                 string += "%.15f" % num
+        if "prime_threshold" in self.MCSHs:
+            # the screened overlaps change the fingerprints, and the dropped
+            # derivatives differ from the default ones
+            string += "screened%.15e" % self.params_set["screening_threshold"]
+            string += "prime%.15e" % self.params_set["prime_threshold"]
         md5 = hashlib.md5(string.encode("utf-8"))
         hash_result = md5.hexdigest()
         self.descriptor_setup_hash = hash_result
@@ -212,185 +243,142 @@ class GMP(BaseDescriptor):
                     )
                 )
 
-    def calculate_fingerprints(self, atoms, element, calc_derivatives, log):
-        element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
+    def get_num_descriptors(self, element):
+        return self.params_set["num"]
 
-        symbols = np.array(atoms.get_chemical_symbols())
-        atom_num = len(symbols)
-        atom_indices = list_symbols_to_indices(symbols)
-        unique_atom_indices = np.unique(atom_indices)
-
-        type_num = dict()
-        type_idx = dict()
-
-        for atom_index in unique_atom_indices:
-            tmp = atom_indices == atom_index
-            type_num[atom_index] = np.sum(tmp).astype(np.int64)
-            # if atom indexs are sorted by atom type,
-            # indexs are sorted in this part.
-            # if not, it could generate bug in training process for force training
-            type_idx[atom_index] = np.arange(atom_num)[tmp]
-
-        atom_indices_p = ffi.cast("int *", atom_indices.ctypes.data)
-
-        cart = np.copy(atoms.get_positions(wrap=True), order="C")
-        scale = np.copy(atoms.get_scaled_positions(wrap=True), order="C")
-        cell = np.copy(atoms.cell, order="C")
-        pbc = np.copy(atoms.get_pbc()).astype(np.intc)
-
-        cart_p = _gen_2Darray_for_ffi(cart, ffi)
-        scale_p = _gen_2Darray_for_ffi(scale, ffi)
-        cell_p = _gen_2Darray_for_ffi(cell, ffi)
-        pbc_p = ffi.cast("int *", pbc.ctypes.data)
-
-        cal_atoms = np.asarray(type_idx[element_index], dtype=np.intc, order="C")
-        cal_num = len(cal_atoms)
-        # print("calculate atom length: {}\ttotal:{}".format(cal_num, atom_num))
-        cal_atoms_p = ffi.cast("int *", cal_atoms.ctypes.data)
-
-        # print(self.params_set['i'])
-        # print(self.params_set['d'])
-        # print(self.params_set['gaussian_params'])
-        # print(self.params_set['ngaussians'])
-        # print(self.params_set['element_index_to_order'])
-        # print(self.params_set['num'])
-        # print(atom_indices)
-
-        size_info = np.array([atom_num, cal_num, self.params_set["num"]])
+    def get_cutoff(self):
+        return float(np.max(self.descriptor_setup[:, 6]))
 
-        if calc_derivatives:
-            x = np.zeros([cal_num, self.params_set["num"]], dtype=np.float64, order="C")
-            dx = np.zeros(
-                [cal_num * self.params_set["num"], atom_num * 3],
-                dtype=np.float64,
-                order="C",
-            )
+    def _neighbor_pairs(self, image, cutoff):
+        return _neighbor_pairs(image, cutoff, ffi, lib)
 
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-            dx_p = _gen_2Darray_for_ffi(dx, ffi)
-
-            if self.params_set["square"]:
-                errno = lib.calculate_gmp_square(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                    dx_p,
-                )
-            else:
-                errno = lib.calculate_gmp(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                    dx_p,
-                )
+    def calculate_fingerprints_batch(
+        self,
+        images,
+        element,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+    ):
+        """
+        Compute the fingerprints of the atoms of an element in a list of images
+        with a single kernel call, the results are returned per image.
+        """
+        element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
+        batch = _ImageBatch(images, element_index, ffi, lib, neighbor_lists, dtype)
+        return self._calculate_batch(batch, calc_derivatives, cores)
 
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
-            fp = np.array(x, dtype=np.float64)
-            fp_prime = np.array(dx, dtype=np.float64)
-
-            # if "prime_threshold" in self.params_set:
-            #     threshold = self.params_set["prime_threshold"]
-            #     super_threshold_indices = np.abs(fp_prime) < threshold
-            #     print("threshhold: {} \tnum points set to zero:{} \t outof: {}".format(threshold, np.sum(super_threshold_indices), fp_prime.shape[0] * fp_prime.shape[1]))
-            #     fp_prime[super_threshold_indices] = 0.0
-
-            # threshold = 1e-9
-            # super_threshold_indices_prime = np.abs(fp_prime) < threshold
-            # print("threshhold: {} \tnum points set to zero:{} \t outof: {}".format(threshold, np.sum(super_threshold_indices_prime), fp_prime.shape[0] * fp_prime.shape[1]))
-            # fp_prime[super_threshold_indices_prime] = 0.0
-
-            scipy_sparse_fp_prime = sparse.coo_matrix(fp_prime)
-            # print(fp)
-            # print(fp.shape)
-            # print(np.sum(super_threshold_indices))
-            # print(np.min(np.abs(scipy_sparse_fp_prime.data)))
-            # print("density: {}% \n\n----------------------".format(100*len(scipy_sparse_fp_prime.data) / (fp_prime.shape[0] * fp_prime.shape[1])))
-            if self.params_set["log"]:
-                raise NotImplementedError
+    def calculate_image_fingerprints_batch(
+        self,
+        images,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+    ):
+        """
+        Compute the fingerprints of all the atoms of a list of images with a
+        single kernel call, the MCSH parameters are shared by all the elements.
+        The results are returned per image. center_atoms and free_atoms
+        optionally restrict the center atoms and the derivative columns of
+        each image, see _ImageBatch.
+        """
+        batch = _ImageBatch(
+            images,
+            None,
+            ffi,
+            lib,
+            neighbor_lists,
+            dtype,
+            center_atoms=center_atoms,
+            free_atoms=free_atoms,
+        )
+        return self._calculate_batch(batch, calc_derivatives, cores)
 
-            return (
-                size_info,
-                fp,
-                scipy_sparse_fp_prime.data,
-                scipy_sparse_fp_prime.row,
-                scipy_sparse_fp_prime.col,
-                np.array(fp_prime.shape),
-            )
+    def calculate_image_forces_batch(
+        self,
+        images,
+        fingerprint_grads,
+        cores=1,
+        neighbor_lists=None,
+        calc_virial=False,
+        free_atoms=None,
+    ):
+        """
+        Forces of each image of a list from the gradient of the energy with
+        respect to the fingerprints of its atoms (one [# of atoms, num] array
+        per image). The kernels contract the fingerprint derivatives with the
+        gradient as they are computed, without storing them. With calc_virial
+        the virial of each image (-dE/dstrain, [3, 3]) is returned as well.
+        The forces of the atoms not in free_atoms (per image, optional) are
+        left at zero.
+        """
+        batch = _ImageBatch(
+            images, None, ffi, lib, neighbor_lists, free_atoms=free_atoms
+        )
+        self._calculate_batch(batch, False, cores, fingerprint_grads, calc_virial)
+        return batch.force_results(calc_virial)
 
+    def _calculate_batch(
+        self, batch, calc_derivatives, cores, fingerprint_grads=None, calc_virial=False
+    ):
+        num = self.params_set["num"]
+        x = np.zeros([batch.cal_total, num], dtype=np.float64, order="C")
+        x_p = _flat_array_for_ffi(x, ffi)
+        if fingerprint_grads is not None:
+            if self.params_set["log"]:
+                raise NotImplementedError
+            dx = batch.new_force_buffers(ffi, fingerprint_grads, calc_virial)
+        elif calc_derivatives:
+            dx = batch.new_fp_prime_buffers(ffi)
         else:
-            x = np.zeros([cal_num, self.params_set["num"]], dtype=np.float64, order="C")
-
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-
-            if self.params_set["square"]:
-                errno = lib.calculate_gmp_square_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                )
-            else:
-                errno = lib.calculate_gmp_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                )
-
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
+            dx = ffi.NULL
+
+        errno = lib.calculate_gmp_batch(
+            batch.cell_p,
+            batch.cart_p,
+            batch.scale_p,
+            batch.pbc_p,
+            batch.atom_indices_p,
+            batch.num_images,
+            batch.atom_offsets_p,
+            batch.cal_atoms_p,
+            batch.cal_offsets_p,
+            self.params_set["ip"],
+            self.params_set["i"].shape[1],
+            self.params_set["dp"],
+            self.params_set["d"].shape[1],
+            num,
+            self.params_set["gaussian_params_p"],
+            *self.params_set["gaussian_params"].shape,
+            self.params_set["ngaussians_p"],
+            self.params_set["element_index_to_order_p"],
+            self.params_set["screening_radii_sqr_p"],
+            int(self.params_set["square"]),
+            x_p,
+            dx,
+            self.params_set["prime_threshold"],
+            batch.neighbor_lists_p,
+            cores,
+        )
 
-            fp = np.array(x, dtype=np.float64)
-            if self.params_set["log"]:
-                fp = np.abs(fp)
-                fp[fp < 1e-8] = 1e-8
-                fp = np.log10(fp)
+        fp_primes = None
+        if calc_derivatives:
+            fp_primes = batch.fp_prime_buffers_to_numpy(dx, ffi, lib)
+        if errno == 1:
+            raise NotImplementedError("Descriptor not implemented!")
+        if fingerprint_grads is not None:
+            return
+        if self.params_set["log"]:
+            if calc_derivatives:
+                raise NotImplementedError
+            x = np.abs(x)
+            x[x < 1e-8] = 1e-8
+            x = np.log10(x)
 
-            return size_info, fp, None, None, None, None
+        return batch.fingerprint_results(x, fp_primes)
@@ -1,23 +1,30 @@
 #include <math.h>
 //#include "mpi.h"
+#include "fp_prime.h"
+#include "neighbor_list.h"
 #include "gmp.h"
 
 extern "C" int calculate_gmp(double **, double **, double **, int*,
                                         int *, int, int*, int,
-                                        int**, double **, int, double **, int *, int *,
-                                        double**, double**);
+                                        int**, double **, int, double **, int *, int *, double **,
+                                        double**, FpPrimeBuffer*, double, NeighborList*, int);
 
 extern "C" int calculate_gmp_noderiv(double **, double **, double **, int*,
                                         int *, int, int*, int,
-                                        int**, double **, int, double **, int *, int *,
-                                        double**);
+                                        int**, double **, int, double **, int *, int *, double **,
+                                        double**, NeighborList*, int);
 
 extern "C" int calculate_gmp_square(double **, double **, double **, int*,
                                         int *, int, int*, int,
-                                        int**, double **, int, double **, int *, int *,
-                                        double**, double**);
+                                        int**, double **, int, double **, int *, int *, double **,
+                                        double**, FpPrimeBuffer*, double, NeighborList*, int);
 
 extern "C" int calculate_gmp_square_noderiv(double **, double **, double **, int*,
                                         int *, int, int*, int,
-                                        int**, double **, int, double **, int *, int *,
-                                        double**);
+                                        int**, double **, int, double **, int *, int *, double **,
+                                        double**, NeighborList*, int);
+
+extern "C" int calculate_gmp_batch(double *, double *, double *, int*,
+                                        int *, int, int*, int*, int*,
+                                        int*, int, double *, int, int, double *, int, int, int *, int *, double *,
+                                        int, double*, FpPrimeBuffer*, double, NeighborList**, int);
@@ -1,11 +1,16 @@
 import hashlib
+import time
 
 import numpy as np
-from scipy import sparse
 
 from ..base_descriptor import BaseDescriptor
 from ..constants import ATOM_SYMBOL_TO_INDEX_DICT
-from ..util import _gen_2Darray_for_ffi, list_symbols_to_indices
+from ..util import (
+    _flat_array_for_ffi,
+    _ImageBatch,
+    _neighbor_pairs,
+    list_symbols_to_indices,
+)
 from ._libgmpordernorm import ffi, lib
 
 
@@ -19,6 +24,8 @@ class GMPOrderNorm(BaseDescriptor):
         elements [dict] : a dictionary of string of chemical elements in the system.
     """
 
+    supports_force_contraction = True
+
     def __init__(
         self,
         MCSHs,
@@ -31,7 +38,7 @@ class GMPOrderNorm(BaseDescriptor):
         self.elements = elements
         self.element_indices = list_symbols_to_indices(elements)
 
-        if "cutoff" not in self.MCSHs:
+        if "cutoff" not in self.MCSHs and "cutoff_tolerance" not in self.MCSHs:
             self.default_cutoff()
 
         self.prepare_descriptor_parameters()
@@ -69,9 +76,57 @@ class GMPOrderNorm(BaseDescriptor):
 
         return
 
+    def probe_cutoffs(self, tolerance):
+        """
+        Cutoff of each probe such that a neighbor beyond it changes the MCSH
+        components of the probe by less than tolerance times the largest
+        contribution of a neighbor, for the gaussians of the pseudo-densities
+        of all the elements. The overlap of a component of order n with a
+        gaussian of a neighbor at distance r is bounded by
+            |C1| exp(C2 r^2) (s (lambda r + sqrt(n / (2 gamma))))^n
+        up to a factor of the order, with s = 1 for solid harmonics and 1 / rs
+        for surface harmonics. The probes of a sigma share the cutoff of their
+        highest order, so that they are still evaluated together by the
+        kernels.
+        """
+        setup = self.descriptor_setup
+        orders = setup[:, 0].astype(int)
+        sigmas = setup[:, 3]
+        gaussians = np.concatenate(
+            [params.reshape(-1, 2) for params in self.atomic_gaussian_setup.values()]
+        )
+        B = np.abs(gaussians[:, 0])
+        beta = gaussians[:, 1]
+        # distances scanned for the bound, the cutoffs are rounded up to 0.01 A
+        r = np.arange(0.0, 50.0, 0.01)
+
+        cutoffs = np.zeros(len(setup))
+        for sigma in np.unique(sigmas):
+            probes = sigmas == sigma
+            m = np.flatnonzero(probes)[0]
+            n = orders[probes].max()
+            A, alpha, inv_rs = setup[m, 5], setup[m, 6], setup[m, 8]
+            gamma = alpha + beta
+            C1 = A * B * (np.pi / gamma) ** 1.5
+            C2 = -alpha * beta / gamma
+            lambda_ = beta / gamma
+            scale = 1.0 if self.solid_harmonic else inv_rs
+            spread = lambda_[:, None] * r[None, :] + np.sqrt(n / (2.0 * gamma))[:, None]
+            bound = (
+                C1[:, None]
+                * np.exp(C2[:, None] * r[None, :] ** 2)
+                * (scale * spread) ** n
+            ).max(axis=0)
+            above = np.flatnonzero(bound >= tolerance * bound.max())
+            cutoff = r[min(above[-1] + 1, len(r) - 1)] if len(above) else r[1]
+            cutoffs[probes] = round(cutoff, 2)
+        return cutoffs
+
     def prepare_descriptor_parameters(self):
         descriptor_setup = []
-        cutoff = self.MCSHs["cutoff"]
+        # with a cutoff tolerance, the cutoff is only an upper bound of the
+        # cutoffs of the probes
+        cutoff = self.MCSHs.get("cutoff", np.inf)
         self.solid_harmonic = self.MCSHs.get("solid_harmonics", True)
         solid_harmonic_i = 1 if self.solid_harmonic else 0
         square = self.MCSHs.get("square", True)
@@ -147,6 +202,12 @@ class GMPOrderNorm(BaseDescriptor):
 
         self.atomic_gaussian_setup = atomic_gaussian_setup
 
+        if "cutoff_tolerance" in self.MCSHs:
+            cutoffs = self.probe_cutoffs(self.MCSHs["cutoff_tolerance"])
+            self.descriptor_setup[:, 7] = np.minimum(
+                cutoffs, self.descriptor_setup[:, 7]
+            )
+
         max_gaussian_count = 0
         ngaussian_list = list()
         self.params_set = dict()
@@ -184,9 +245,6 @@ class GMPOrderNorm(BaseDescriptor):
         self.params_set["ngaussians"] = ngaussian_list
         self.params_set["ngaussians_p"] = ffi.cast("int *", ngaussian_list.ctypes.data)
         self.params_set["gaussian_params"] = overall_gaussian_params
-        self.params_set["gaussian_params_p"] = _gen_2Darray_for_ffi(
-            overall_gaussian_params, ffi
-        )
         self.params_set["element_index_to_order"] = element_index_to_order_list
         self.params_set["element_index_to_order_p"] = ffi.cast(
             "int *", element_index_to_order_list.ctypes.data
@@ -204,20 +262,121 @@ class GMPOrderNorm(BaseDescriptor):
         self.params_set["i"] = params_i
         self.params_set["d"] = params_d
 
-        self.params_set["ip"] = _gen_2Darray_for_ffi(self.params_set["i"], ffi, "int")
-        self.params_set["dp"] = _gen_2Darray_for_ffi(self.params_set["d"], ffi)
+        self.params_set["ip"] = _flat_array_for_ffi(self.params_set["i"], ffi, "int")
+        self.params_set["dp"] = _flat_array_for_ffi(self.params_set["d"], ffi)
+
+        # derivatives smaller than the threshold are dropped by the kernels.
+        # When the threshold is given, the overlaps changing the components
+        # or their derivatives by less than it are also screened out
+        self.params_set["prime_threshold"] = float(
+            self.MCSHs.get("prime_threshold", 1e-5)
+        )
+        self.params_set["screening_threshold"] = float(
+            self.MCSHs.get("prime_threshold", 0.0)
+        )
+
+        # overlap coefficients of each probe with each gaussian of the
+        # pseudo-densities, only the position dependent terms are left to
+        # the kernels
+        coefs = self._gaussian_overlap_coefficients(params_d, overall_gaussian_params)
+        radii_sqr = self._screening_radii_sqr(
+            self.params_set,
+            self.solid_harmonic,
+            coefs,
+            self.params_set["screening_threshold"],
+        )
+        gaussian_coefs = np.ascontiguousarray(
+            np.concatenate([coefs, radii_sqr[..., None]], axis=-1).reshape(
+                coefs.shape[0] * coefs.shape[1], -1
+            )
+        )
+        self.params_set["gaussian_coefs"] = gaussian_coefs
+        self.params_set["gaussian_coefs_p"] = _flat_array_for_ffi(gaussian_coefs, ffi)
         self.params_set["total"] = np.concatenate(
             (self.params_set["i"], self.params_set["d"]), axis=1
         )
         self.params_set["num"] = len(self.params_set["total"])
 
-        if "prime_threshold" in self.MCSHs:
-            self.params_set["prime_threshold"] = float(self.MCSHs["prime_threshold"])
-
         self.params_set["log"] = self.MCSHs.get("log", False)
 
         return
 
+    @staticmethod
+    def _gaussian_overlap_coefficients(params_d, gaussian_params):
+        """
+        C1, C2, lambda and gamma of the product of each probe (A, alpha in
+        params_d) with each gaussian (B, beta in gaussian_params) of each
+        element, as an array [# of elements, nmcsh, # of gaussians, 4].
+        """
+        A = params_d[None, :, 2, None]
+        alpha = params_d[None, :, 3, None]
+        B = gaussian_params[:, None, 0::2]
+        beta = gaussian_params[:, None, 1::2]
+
+        gamma = alpha + beta
+        temp = np.sqrt(np.pi / gamma)
+        C1 = A * B * temp * temp * temp
+        C2 = -1.0 * (alpha * beta / gamma)
+        lambda_ = beta / gamma
+
+        return np.stack(np.broadcast_arrays(C1, C2, lambda_, gamma), axis=-1)
+
+    @staticmethod
+    def _screening_radii_sqr(params_set, solid, coefs, threshold):
+        """
+        Squared distance beyond which a gaussian of an element changes the
+        components of a probe and their derivatives by less than threshold,
+        for the probes of params_set (solid or surface harmonics) and their
+        overlap coefficients coefs. With W the largest sum of the monomial
+        coefficients of a component of order n, the component of a gaussian
+        at distance r is bounded by
+            |C1| exp(C2 r^2) W B^n,  B = max(1, lambda r + sqrt(n / (2 gamma)))
+        and its derivatives by
+            |C1| exp(C2 r^2) W (2 |C2| r B^n + n lambda B^(n-1)).
+        The probes of a sigma are computed together and share the largest
+        radius. No overlap is screened out when threshold is 0.
+        """
+        nelements, nmcsh, ngaussians = coefs.shape[:3]
+        radii_sqr = np.full((nelements, nmcsh, ngaussians), np.inf)
+        bounds = np.zeros(nmcsh)
+        errno = lib.mcsh_coefficient_bounds(
+            nmcsh,
+            params_set["ip"],
+            params_set["i"].shape[1],
+            params_set["dp"],
+            params_set["d"].shape[1],
+            int(solid),
+            ffi.from_buffer("double[]", bounds),
+        )
+        if threshold <= 0.0 or errno != 0:
+            return radii_sqr
+
+        params_i, params_d = params_set["i"], params_set["d"]
+        for A, alpha in np.unique(params_d[:, 2:4], axis=0):
+            probes = (params_d[:, 2] == A) & (params_d[:, 3] == alpha)
+            n = params_i[probes, 0].max()
+            W = bounds[probes].max()
+            r = np.arange(0.0, params_d[probes, 4].max() + 0.01, 0.01)
+
+            C1, C2, lambda_, gamma = np.moveaxis(
+                coefs[:, np.flatnonzero(probes)[0], :, :, None], 2, 0
+            )
+            B = np.maximum(1.0, lambda_ * r + np.sqrt(n / (2.0 * gamma)))
+            bound = (
+                np.abs(C1)
+                * np.exp(C2 * r * r)
+                * W
+                * (B**n + 2.0 * np.abs(C2) * r * B**n + n * lambda_ * B ** (n - 1))
+            )
+            above = bound >= threshold
+            last = len(r) - 1 - np.argmax(above[..., ::-1], axis=-1)
+            radius = np.where(
+                last == len(r) - 1, np.inf, r[np.minimum(last + 1, len(r) - 1)]
+            )
+            radius[~above.any(axis=-1)] = 0.0
+            radii_sqr[:, probes, :] = (radius * radius)[:, None, :]
+        return radii_sqr
+
     def load_pseudo_densities(self, elements):
         import os
 
@@ -237,6 +396,11 @@ class GMPOrderNorm(BaseDescriptor):
         for desc in self.descriptor_setup:
             for num in desc:
                 string += "%.15f" % num
+        if "prime_threshold" in self.MCSHs:
+            # the screened overlaps change the fingerprints, and the dropped
+            # derivatives differ from the default ones
+            string += "screened%.15e" % self.params_set["screening_threshold"]
+            string += "prime%.15e" % self.params_set["prime_threshold"]
         md5 = hashlib.md5(string.encode("utf-8"))
         hash_result = md5.hexdigest()
         self.descriptor_setup_hash = hash_result
@@ -256,183 +420,195 @@ class GMPOrderNorm(BaseDescriptor):
                     )
                 )
 
-    def calculate_fingerprints(self, atoms, element, calc_derivatives, log):
-        element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
-
-        symbols = np.array(atoms.get_chemical_symbols())
-        atom_num = len(symbols)
-        atom_indices = list_symbols_to_indices(symbols)
-        unique_atom_indices = np.unique(atom_indices)
-
-        type_num = dict()
-        type_idx = dict()
-
-        for atom_index in unique_atom_indices:
-            tmp = atom_indices == atom_index
-            type_num[atom_index] = np.sum(tmp).astype(np.int64)
-            # if atom indexs are sorted by atom type,
-            # indexs are sorted in this part.
-            # if not, it could generate bug in training process for force training
-            type_idx[atom_index] = np.arange(atom_num)[tmp]
-
-        atom_indices_p = ffi.cast("int *", atom_indices.ctypes.data)
-
-        cart = np.copy(atoms.get_positions(wrap=True), order="C")
-        scale = np.copy(atoms.get_scaled_positions(wrap=True), order="C")
-        cell = np.copy(atoms.cell, order="C")
-        pbc = np.copy(atoms.get_pbc()).astype(np.intc)
-
-        cart_p = _gen_2Darray_for_ffi(cart, ffi)
-        scale_p = _gen_2Darray_for_ffi(scale, ffi)
-        cell_p = _gen_2Darray_for_ffi(cell, ffi)
-        pbc_p = ffi.cast("int *", pbc.ctypes.data)
-
-        cal_atoms = np.asarray(type_idx[element_index], dtype=np.intc, order="C")
-        cal_num = len(cal_atoms)
-        # print("calculate atom length: {}\ttotal:{}".format(cal_num, atom_num))
-        cal_atoms_p = ffi.cast("int *", cal_atoms.ctypes.data)
-
-        # print(self.params_set['i'])
-        # print(self.params_set['d'])
-        # print(self.params_set['gaussian_params'])
-        # print(self.params_set['ngaussians'])
-        # print(self.params_set['element_index_to_order'])
-        # print(self.params_set['num'])
-        # print(atom_indices)
-
-        size_info = np.array([atom_num, cal_num, self.params_set["num"]])
+    def get_num_descriptors(self, element):
+        return self.params_set["num"]
 
-        if calc_derivatives:
-            x = np.zeros([cal_num, self.params_set["num"]], dtype=np.float64, order="C")
-            dx = np.zeros(
-                [cal_num * self.params_set["num"], atom_num * 3],
-                dtype=np.float64,
-                order="C",
-            )
+    def get_cutoff(self):
+        return float(np.max(self.descriptor_setup[:, 7]))
 
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-            dx_p = _gen_2Darray_for_ffi(dx, ffi)
-
-            if self.solid_harmonic:
-                errno = lib.calculate_solid_gmpordernorm(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                    dx_p,
-                )
+    def _neighbor_pairs(self, image, cutoff):
+        return _neighbor_pairs(image, cutoff, ffi, lib)
 
-            else:
-                errno = lib.calculate_gmpordernorm(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                    dx_p,
-                )
-
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
-            fp = np.array(x, dtype=np.float64)
-            fp_prime = np.array(dx, dtype=np.float64)
+    def calculate_fingerprints_batch(
+        self,
+        images,
+        element,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+    ):
+        """
+        Compute the fingerprints of the atoms of an element in a list of images
+        with a single kernel call, the results are returned per image.
+        """
+        element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
+        batch = _ImageBatch(images, element_index, ffi, lib, neighbor_lists, dtype)
+        return self._calculate_batch(batch, calc_derivatives, cores)
 
-            fp_prime[np.abs(fp_prime) < 1e-5] = 0.0
+    def calculate_image_fingerprints_batch(
+        self,
+        images,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+    ):
+        """
+        Compute the fingerprints of all the atoms of a list of images with a
+        single kernel call, the MCSH parameters are shared by all the elements.
+        The results are returned per image. center_atoms and free_atoms
+        optionally restrict the center atoms and the derivative columns of
+        each image, see _ImageBatch.
+        """
+        batch = _ImageBatch(
+            images,
+            None,
+            ffi,
+            lib,
+            neighbor_lists,
+            dtype,
+            center_atoms=center_atoms,
+            free_atoms=free_atoms,
+        )
+        return self._calculate_batch(batch, calc_derivatives, cores)
 
-            # threshold = 1e-9
-            # super_threshold_indices_prime = np.abs(fp_prime) < threshold
-            # print("threshold: {} \tnum points set to zero:{} \t outof: {}".format(threshold, np.sum(super_threshold_indices_prime), fp_prime.shape[0] * fp_prime.shape[1]))
-            # fp_prime[super_threshold_indices_prime] = 0.0
+    def calculate_image_forces_batch(
+        self,
+        images,
+        fingerprint_grads,
+        cores=1,
+        neighbor_lists=None,
+        calc_virial=False,
+        free_atoms=None,
+    ):
+        """
+        Forces of each image of a list from the gradient of the energy with
+        respect to the fingerprints of its atoms (one [# of atoms, num] array
+        per image). The kernels contract the fingerprint derivatives with the
+        gradient as they are computed, without storing them. With calc_virial
+        the virial of each image (-dE/dstrain, [3, 3]) is returned as well.
+        The forces of the atoms not in free_atoms (per image, optional) are
+        left at zero.
+        """
+        batch = _ImageBatch(
+            images, None, ffi, lib, neighbor_lists, free_atoms=free_atoms
+        )
+        self._calculate_batch(batch, False, cores, fingerprint_grads, calc_virial)
+        return batch.force_results(calc_virial)
 
-            scipy_sparse_fp_prime = sparse.coo_matrix(fp_prime)
-            # print(fp)
-            # print(fp.shape)
-            # print(np.sum(super_threshold_indices))
-            # print(np.min(np.abs(scipy_sparse_fp_prime.data)))
-            # print("density: {}% \n\n----------------------".format(100*len(scipy_sparse_fp_prime.data) / (fp_prime.shape[0] * fp_prime.shape[1])))
+    def _calculate_batch(
+        self, batch, calc_derivatives, cores, fingerprint_grads=None, calc_virial=False
+    ):
+        num = self.params_set["num"]
+        x = np.zeros([batch.cal_total, num], dtype=np.float64, order="C")
+        x_p = _flat_array_for_ffi(x, ffi)
+        if fingerprint_grads is not None:
             if self.params_set["log"]:
                 raise NotImplementedError
-
-            return (
-                size_info,
-                fp,
-                scipy_sparse_fp_prime.data,
-                scipy_sparse_fp_prime.row,
-                scipy_sparse_fp_prime.col,
-                np.array(fp_prime.shape),
-            )
-
+            dx = batch.new_force_buffers(ffi, fingerprint_grads, calc_virial)
+        elif calc_derivatives:
+            dx = batch.new_fp_prime_buffers(ffi)
         else:
-            x = np.zeros([cal_num, self.params_set["num"]], dtype=np.float64, order="C")
-
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-
-            if self.solid_harmonic:
-                errno = lib.calculate_solid_gmpordernorm_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                )
+            dx = ffi.NULL
+
+        errno = lib.calculate_gmpordernorm_batch(
+            batch.cell_p,
+            batch.cart_p,
+            batch.scale_p,
+            batch.pbc_p,
+            batch.atom_indices_p,
+            batch.num_images,
+            batch.atom_offsets_p,
+            batch.cal_atoms_p,
+            batch.cal_offsets_p,
+            self.params_set["ip"],
+            self.params_set["i"].shape[1],
+            self.params_set["dp"],
+            self.params_set["d"].shape[1],
+            num,
+            self.params_set["gaussian_coefs_p"],
+            *self.params_set["gaussian_coefs"].shape,
+            self.params_set["ngaussians_p"],
+            self.params_set["element_index_to_order_p"],
+            int(self.solid_harmonic),
+            x_p,
+            dx,
+            self.params_set["prime_threshold"],
+            batch.neighbor_lists_p,
+            cores,
+        )
 
-            else:
-                errno = lib.calculate_gmpordernorm_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set["ip"],
-                    self.params_set["dp"],
-                    self.params_set["num"],
-                    self.params_set["gaussian_params_p"],
-                    self.params_set["ngaussians_p"],
-                    self.params_set["element_index_to_order_p"],
-                    x_p,
-                )
+        fp_primes = None
+        if calc_derivatives:
+            fp_primes = batch.fp_prime_buffers_to_numpy(dx, ffi, lib)
+        if errno == 1:
+            raise NotImplementedError("Descriptor not implemented!")
+        if fingerprint_grads is not None:
+            return
+        if self.params_set["log"]:
+            if calc_derivatives:
+                raise NotImplementedError
+            x = np.abs(x)
+            x[x < 1e-8] = 1e-8
+            x = np.log10(x)
 
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
+        return batch.fingerprint_results(x, fp_primes)
 
-            fp = np.array(x, dtype=np.float64)
-            if self.params_set["log"]:
-                fp = np.abs(fp)
-                fp[fp < 1e-8] = 1e-8
-                fp = np.log10(fp)
 
-            return size_info, fp, None, None, None, None
+def tune_cutoffs(
+    MCSHs, elements, images, tolerances=(1e-4, 1e-6, 1e-8), sample_size=10, seed=0
+):
+    """
+    Per-probe cutoffs of GMPOrderNorm for each tolerance, compared with the
+    default cutoff (or the cutoff of MCSHs) on a random sample of images.
+
+    Returns one dict per tolerance with the cutoff of each sigma ("cutoffs"),
+    the largest absolute error of the fingerprints ("max_abs_error"), that
+    error relative to the largest fingerprint ("max_rel_error") and the
+    speedup of the fingerprinting ("speedup").
+    """
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(len(images), min(sample_size, len(images)), replace=False)
+    sample = [images[i] for i in sorted(sample)]
+
+    def fingerprints(params):
+        descriptor = GMPOrderNorm(dict(params), elements)
+        start = time.perf_counter()
+        results = descriptor.calculate_image_fingerprints_batch(sample, False, None)
+        elapsed = time.perf_counter() - start
+        return descriptor, np.concatenate([res[1] for res in results]), elapsed
+
+    MCSHs = {key: value for key, value in MCSHs.items() if key != "cutoff_tolerance"}
+    _, reference, reference_time = fingerprints(MCSHs)
+    scale = max(np.abs(reference).max(), np.finfo(np.float64).tiny)
+
+    report = []
+    for tolerance in tolerances:
+        descriptor, fps, elapsed = fingerprints(dict(MCSHs, cutoff_tolerance=tolerance))
+        setup = descriptor.descriptor_setup
+        error = np.abs(fps - reference).max()
+        report.append(
+            {
+                "tolerance": tolerance,
+                "cutoffs": dict(zip(setup[:, 3], setup[:, 7])),
+                "max_abs_error": error,
+                "max_rel_error": error / scale,
+                "speedup": reference_time / elapsed,
+            }
+        )
+        print(
+            "tolerance {:.1e}: max cutoff {:.2f} A, max error {:.2e} "
+            "(relative {:.2e}), speedup {:.2f}x".format(
+                tolerance,
+                setup[:, 7].max(),
+                error,
+                error / scale,
+                reference_time / elapsed,
+            )
+        )
+    return report
@@ -1,42 +1,68 @@
+import sys
+
 import cffi
 
 ffibuilder = cffi.FFI()
 ffibuilder.cdef(
-    """int calculate_gmpordernorm(double **, double **, double **, int*,
+    """typedef struct {
+            void* val;
+            int* row;
+            int* col;
+            long nnz;
+            long capacity;
+            int single;
+            const double* grad;
+            double* forces;
+            double* virial;
+            const int* free_atoms;
+            int error;
+        } FpPrimeBuffer;
+
+        void free_fp_prime_buffer(FpPrimeBuffer*);
+
+        typedef struct NeighborList NeighborList;
+        NeighborList* new_neighbor_list(double);
+        void free_neighbor_list(NeighborList*);
+        int neighbor_list_num_builds(NeighborList*);
+        long neighbor_pairs(double*, double*, double*, int*, int, double,
+                            int*, int*, double*, long);
+
+        int mcsh_coefficient_bounds(int, int*, int, double*, int, int, double*);
+
+        int calculate_gmpordernorm(double **, double **, double **, int*,
                         int *, int, int*, int,
                         int**, double **, int, double **, int*, int*,
-                        double**, double**);
+                        int, double**, FpPrimeBuffer*, double, NeighborList*, int);
 
         int calculate_gmpordernorm_noderiv(double **, double **, double **, int*,
                                     int *, int, int*, int,
                                     int**, double **, int, double **, int*, int*,
-                                    double**);
-
-        int calculate_solid_gmpordernorm(double **, double **, double **, int*,
-                                    int *, int, int*, int,
-                                    int**, double **, int, double **, int*, int*,
-                                    double**, double**);
-
-        int calculate_solid_gmpordernorm_noderiv(double **, double **, double **, int*,
-                                    int *, int, int*, int,
-                                    int**, double **, int, double **, int*, int*,
-                                    double**);
-
+                                    int, double**, NeighborList*, int);
 
+        int calculate_gmpordernorm_batch(double *, double *, double *, int*,
+                        int *, int, int*, int*, int*,
+                        int*, int, double *, int, int, double *, int, int, int*, int*,
+                        int, double*, FpPrimeBuffer*, double, NeighborList**, int);
     """
 )
+# the kernels are parallelized over center atoms with OpenMP, the default
+# compiler on macOS does not support it and the kernels then run serially
+openmp_args = [] if sys.platform == "darwin" else ["-fopenmp"]
+
 ffibuilder.set_source(
     "amptorch.descriptor.GMPOrderNorm._libgmpordernorm",
     '#include "calculate_gmpordernorm.h"',
     sources=[
         "amptorch/descriptor/GMPOrderNorm/calculate_gmpordernorm.cpp",
         # "amptorch/descriptor/GMPOrderNorm/gmpordernorm.cpp",
-        "amptorch/descriptor/GMPOrderNorm/helper.cpp",
-        "amptorch/descriptor/GMPOrderNorm/surface_harmonics.cpp",
-        "amptorch/descriptor/GMPOrderNorm/solid_harmonics.cpp",
+        "amptorch/descriptor/GMPOrderNorm/mcsh.cpp",
+        "amptorch/descriptor/neighbor_list.cpp",
+        "amptorch/descriptor/fp_prime.cpp",
     ],
     source_extension=".cpp",
-    include_dirs=["amptorch/descriptor/GMPOrderNorm/"],
+    include_dirs=["amptorch/descriptor/GMPOrderNorm/", "amptorch/descriptor/"],
+    extra_compile_args=openmp_args,
+    extra_link_args=openmp_args,
 )
 
 if __name__ == "__main__":
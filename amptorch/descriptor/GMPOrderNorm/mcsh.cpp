@@ -0,0 +1,244 @@
+#include <math.h>
+#include "mcsh.h"
+#include "flat_array.h"
+
+
+static double factorial(int n) {
+    double result = 1.0;
+    for (int k = 2; k <= n; ++k) result *= k;
+    return result;
+}
+
+static double double_factorial(int n) {
+    // n!! for odd n >= -1
+    double result = 1.0;
+    for (int k = n; k > 1; k -= 2) result *= k;
+    return result;
+}
+
+// coefficient of x^(a-2i) r^(2i) in (-1)^a r^(2a+1) d^a/dx^a (1/r), without the
+// (2n-2m-1)!! factor shared by the three directions
+static double hermite_coef(int a, int i) {
+    return factorial(a) / (pow(2.0, i) * factorial(i) * factorial(a - 2 * i));
+}
+
+// monomial coefficients of the component (a, b, c), poly[(p * (n+1) + q) * (n+1) + r]
+// is the coefficient of x^p y^q z^r
+static void component_polynomial(int a, int b, int c, int solid, double inv_rs,
+                                 std::vector<double>& poly) {
+    int n = a + b + c, dim = n + 1;
+    poly.assign(dim * dim * dim, 0.0);
+    for (int i = 0; 2 * i <= a; ++i) {
+        for (int j = 0; 2 * j <= b; ++j) {
+            for (int k = 0; 2 * k <= c; ++k) {
+                int m = i + j + k;
+                double coef = ((m % 2) ? -1.0 : 1.0) * double_factorial(2 * n - 2 * m - 1)
+                              * hermite_coef(a, i) * hermite_coef(b, j) * hermite_coef(c, k);
+                int p = a - 2 * i, q = b - 2 * j, r = c - 2 * k;
+                if (solid) {
+                    // expand r^(2m) = (x^2 + y^2 + z^2)^m
+                    for (int u = 0; u <= m; ++u) {
+                        for (int v = 0; u + v <= m; ++v) {
+                            int w = m - u - v;
+                            double multinomial = factorial(m) / (factorial(u) * factorial(v) * factorial(w));
+                            poly[((p + 2 * u) * dim + q + 2 * v) * dim + r + 2 * w] += coef * multinomial;
+                        }
+                    }
+                }
+                else {
+                    // on the sphere of radius rs, (x / rs)^p (y / rs)^q (z / rs)^r
+                    poly[(p * dim + q) * dim + r] += coef * pow(inv_rs, n - 2 * m);
+                }
+            }
+        }
+    }
+}
+
+// moments of a 1D gaussian of mean mu and variance var, and their derivatives
+// with respect to x0 (mu = lambda * x0)
+static inline void gaussian_moments(double mu, double var, double lambda, int n,
+                                    double* moments, double* dmoments) {
+    moments[0] = 1.0;
+    dmoments[0] = 0.0;
+    if (n < 1) return;
+    moments[1] = mu;
+    for (int k = 1; k < n; ++k) {
+        moments[k + 1] = mu * moments[k] + k * var * moments[k - 1];
+    }
+    for (int k = 1; k <= n; ++k) {
+        dmoments[k] = k * lambda * moments[k - 1];
+    }
+}
+
+
+MCSHEvaluator::MCSHEvaluator(int nmcsh, int** params_i, double** params_d, int solid) {
+    is_valid = true;
+    max_order = 0;
+    max_monomials = 0;
+    for (int m = 0; m < nmcsh; ++m) {
+        if (params_i[m][0] < 0) is_valid = false;
+        else if (params_i[m][0] > max_order) max_order = params_i[m][0];
+    }
+    probe_comp_start.assign(nmcsh, 0);
+    probe_ncomp.assign(nmcsh, 0);
+    probe_cutoff_sqr.assign(nmcsh, 0.0);
+    for (int m = 0; m < nmcsh; ++m) probe_cutoff_sqr[m] = params_d[m][4] * params_d[m][4];
+    comp_term_start.push_back(0);
+    if (!is_valid) return;
+
+    // group the probes by sigma, in the order of their first probe
+    std::vector<int> probe_group(nmcsh, -1);
+    for (int m = 0; m < nmcsh; ++m) {
+        for (int s = 0; s < (int) group_probe.size(); ++s) {
+            int first = group_probe[s];
+            if (params_d[first][2] == params_d[m][2] && params_d[first][3] == params_d[m][3]) {
+                probe_group[m] = s;
+                break;
+            }
+        }
+        if (probe_group[m] < 0) {
+            probe_group[m] = (int) group_probe.size();
+            group_probe.push_back(m);
+            group_order.push_back(0);
+        }
+        if (params_i[m][0] > group_order[probe_group[m]])
+            group_order[probe_group[m]] = params_i[m][0];
+    }
+
+    std::vector<double> poly;
+    for (int s = 0; s < (int) group_probe.size(); ++s) {
+        group_mono_start.push_back((int) mono_pqr.size() / 3);
+        group_member_start.push_back((int) group_members.size());
+        group_cutoff_sqr.push_back(0.0);
+        // index of the monomials of the group, -1 when not used yet
+        int dim_s = group_order[s] + 1;
+        std::vector<int> mono_index(dim_s * dim_s * dim_s, -1);
+        int nmono = 0;
+        for (int m = 0; m < nmcsh; ++m) {
+            if (probe_group[m] != s) continue;
+            int n = params_i[m][0], dim = n + 1;
+            double inv_rs = params_d[m][5];
+            group_members.push_back(m);
+            if (probe_cutoff_sqr[m] > group_cutoff_sqr[s]) group_cutoff_sqr[s] = probe_cutoff_sqr[m];
+            probe_comp_start[m] = (int) comp_weight.size();
+            probe_ncomp[m] = (n + 1) * (n + 2) / 2;
+            for (int a = n; a >= 0; --a) {
+                for (int b = n - a; b >= 0; --b) {
+                    int c = n - a - b;
+                    comp_weight.push_back(factorial(n) / (factorial(a) * factorial(b) * factorial(c)));
+                    component_polynomial(a, b, c, solid, inv_rs, poly);
+                    for (int p = 0; p <= n; ++p) {
+                        for (int q = 0; p + q <= n; ++q) {
+                            for (int r = 0; p + q + r <= n; ++r) {
+                                double coef = poly[(p * dim + q) * dim + r];
+                                if (coef == 0.0) continue;
+                                int& index = mono_index[(p * dim_s + q) * dim_s + r];
+                                if (index < 0) {
+                                    index = nmono++;
+                                    mono_pqr.push_back(p);
+                                    mono_pqr.push_back(q);
+                                    mono_pqr.push_back(r);
+                                }
+                                term_mono.push_back(index);
+                                term_coef.push_back(coef);
+                            }
+                        }
+                    }
+                    comp_term_start.push_back((int) term_coef.size());
+                }
+            }
+        }
+        if (nmono > max_monomials) max_monomials = nmono;
+    }
+    group_mono_start.push_back((int) mono_pqr.size() / 3);
+    group_member_start.push_back((int) group_members.size());
+}
+
+
+double MCSHEvaluator::coefficient_bound(int m) const {
+    double bound = 0.0;
+    for (int k = probe_comp_start[m]; k < probe_comp_start[m] + probe_ncomp[m]; ++k) {
+        double sum = 0.0;
+        for (int t = comp_term_start[k]; t < comp_term_start[k + 1]; ++t) sum += fabs(term_coef[t]);
+        if (sum > bound) bound = sum;
+    }
+    return bound;
+}
+
+
+void MCSHEvaluator::add(double x0, double y0, double z0, double r0_sqr, double** elem_coefs, int g,
+                        double* miu, double* dmiu, double* work) const {
+    int dim = max_order + 1;
+    double *px = work, *py = work + dim, *pz = work + 2 * dim;
+    double *dpx = work + 3 * dim, *dpy = work + 4 * dim, *dpz = work + 5 * dim;
+    // products of the moments for each monomial and their derivatives
+    double *mono = work + 6 * dim, *mono_dx = mono + max_monomials;
+    double *mono_dy = mono_dx + max_monomials, *mono_dz = mono_dy + max_monomials;
+
+    for (int s = 0; s < (int) group_probe.size(); ++s) {
+        // the neighbor is out of the cutoff of all the probes of the group
+        if (r0_sqr >= group_cutoff_sqr[s]) continue;
+        // overlap coefficients of the sigma with the gaussian
+        const double* coefs = elem_coefs[group_probe[s]] + g * 5;
+        // the overlap is screened out beyond its screening radius
+        if (r0_sqr >= coefs[4]) continue;
+        double C1 = coefs[0], C2 = coefs[1], lambda = coefs[2], gamma = coefs[3];
+        double temp = C1 * exp(C2 * r0_sqr);
+        double var = 0.5 / gamma;
+        int n = group_order[s];
+        gaussian_moments(lambda * x0, var, lambda, n, px, dpx);
+        gaussian_moments(lambda * y0, var, lambda, n, py, dpy);
+        gaussian_moments(lambda * z0, var, lambda, n, pz, dpz);
+
+        const int* pqr = &mono_pqr[group_mono_start[s] * 3];
+        int nmono = group_mono_start[s + 1] - group_mono_start[s];
+        for (int u = 0; u < nmono; ++u) {
+            int p = pqr[u * 3], q = pqr[u * 3 + 1], r = pqr[u * 3 + 2];
+            double yz = py[q] * pz[r];
+            mono[u] = px[p] * yz;
+            if (dmiu != NULL) {
+                mono_dx[u] = dpx[p] * yz;
+                mono_dy[u] = px[p] * dpy[q] * pz[r];
+                mono_dz[u] = px[p] * py[q] * dpz[r];
+            }
+        }
+
+        for (int v = group_member_start[s]; v < group_member_start[s + 1]; ++v) {
+            int m = group_members[v];
+            // the neighbor is out of the cutoff of the probe
+            if (r0_sqr >= probe_cutoff_sqr[m]) continue;
+            for (int k = probe_comp_start[m]; k < probe_comp_start[m] + probe_ncomp[m]; ++k) {
+                double value = 0.0;
+                for (int t = comp_term_start[k]; t < comp_term_start[k + 1]; ++t) {
+                    value += term_coef[t] * mono[term_mono[t]];
+                }
+                miu[k] += temp * value;
+                if (dmiu != NULL) {
+                    double value_dx = 0.0, value_dy = 0.0, value_dz = 0.0;
+                    for (int t = comp_term_start[k]; t < comp_term_start[k + 1]; ++t) {
+                        int u = term_mono[t];
+                        value_dx += term_coef[t] * mono_dx[u];
+                        value_dy += term_coef[t] * mono_dy[u];
+                        value_dz += term_coef[t] * mono_dz[u];
+                    }
+                    // d/dx0 of exp(C2 r0^2) is 2 C2 x0 exp(C2 r0^2)
+                    dmiu[k * 3]     += temp * (value_dx + 2.0 * C2 * x0 * value);
+                    dmiu[k * 3 + 1] += temp * (value_dy + 2.0 * C2 * y0 * value);
+                    dmiu[k * 3 + 2] += temp * (value_dz + 2.0 * C2 * z0 * value);
+                }
+            }
+        }
+    }
+}
+
+
+extern "C" int mcsh_coefficient_bounds(int nmcsh, int* params_i, int params_i_stride,
+                                       double* params_d, int params_d_stride, int solid,
+                                       double* bounds) {
+    RowView<int> params_i_rows(params_i, nmcsh, params_i_stride);
+    RowView<double> params_d_rows(params_d, nmcsh, params_d_stride);
+    MCSHEvaluator evaluator(nmcsh, params_i_rows.ptr(), params_d_rows.ptr(), solid);
+    if (!evaluator.valid()) return 1;
+    for (int m = 0; m < nmcsh; ++m) bounds[m] = evaluator.coefficient_bound(m);
+    return 0;
+}
@@ -0,0 +1,88 @@
+/*
+ Maxwell-Cartesian spherical harmonics (MCSH) of any order for the GMP probes.
+ The component (a, b, c) of order n = a + b + c is
+     T_abc(r) = (-1)^n r^(2n+1) d^a/dx^a d^b/dy^b d^c/dz^c (1/r),
+ a polynomial in x, y, z. The solid harmonics keep its r^2 factors and the
+ surface harmonics evaluate it on the sphere of radius rs, so each component is
+ tabulated once as a sum of monomials x^p y^q z^r.
+ The overlap of a monomial with the product of a probe gaussian and a gaussian
+ of a neighbor's pseudo-density is C1 exp(C2 r0^2) P_p(x0) P_q(y0) P_r(z0),
+ where P_k are the moments of a 1D gaussian and follow the recurrence
+     P_0 = 1, P_1 = lambda x0, P_k+1 = lambda x0 P_k + k / (2 gamma) P_k-1
+ so all the components of all the probes sharing a sigma are computed for a
+ neighbor from the same exponential, the same moments and the same products of
+ moments P_p(x0) P_q(y0) P_r(z0).
+ Each probe only sums the neighbors within its own cutoff.
+ */
+
+#ifndef AMPTORCH_MCSH_H
+#define AMPTORCH_MCSH_H
+
+#include <vector>
+
+class MCSHEvaluator {
+public:
+    // params_i: [order, square, solid] of each probe
+    // params_d: [sigma, weight, A, alpha, cutoff, inv_rs] of each probe
+    // solid: solid (1) or surface (0) harmonics
+    MCSHEvaluator(int nmcsh, int** params_i, double** params_d, int solid);
+
+    // false when a probe has a negative order
+    bool valid() const { return is_valid; }
+
+    // the components of probe m are [probe_start(m), probe_start(m) + probe_size(m))
+    // among the num_components() components of all the probes
+    int num_components() const { return (int) comp_weight.size(); }
+    int probe_start(int m) const { return probe_comp_start[m]; }
+    int probe_size(int m) const { return probe_ncomp[m]; }
+    // the fingerprint of a probe is sum_k weight(k) * miu_k^2, with the
+    // multinomial weight n! / (a! b! c!) of the component
+    double weight(int k) const { return comp_weight[k]; }
+
+    // largest sum of the absolute values of the monomial coefficients of a
+    // component of probe m, which bounds the component by the largest monomial
+    double coefficient_bound(int m) const;
+
+    // # of doubles of the scratch space of add
+    int workspace_size() const { return (max_order + 1) * 6 + max_monomials * 4; }
+
+    // add the overlaps of the neighbor at (x0, y0, z0) with gaussian g of its
+    // element to miu ([num_components()]), and their derivatives with respect
+    // to the neighbor position to dmiu ([num_components() * 3]) when it is not
+    // NULL. the probes whose cutoff is not larger than the distance of the
+    // neighbor are skipped, as well as the groups for which the neighbor is
+    // beyond the screening radius of the gaussian. elem_coefs: rows of the
+    // element in gaussian_coefs, one per probe
+    void add(double x0, double y0, double z0, double r0_sqr, double** elem_coefs, int g,
+             double* miu, double* dmiu, double* work) const;
+
+private:
+    bool is_valid;
+    int max_order, max_monomials;
+    // probes sharing A and alpha (the same sigma) have the same overlap
+    // coefficients and are evaluated together. group s computes the moments
+    // up to group_order[s] from the coefficients of probe group_probe[s].
+    // the monomials x^p y^q z^r used by the group are
+    // [group_mono_start[s], group_mono_start[s+1]), mono_pqr holds p, q, r
+    std::vector<int> group_probe, group_order, group_mono_start, mono_pqr;
+    // the probes of group s are group_members[group_member_start[s]:group_member_start[s+1]]
+    std::vector<int> group_member_start, group_members;
+    // squared cutoff of each probe, and the largest one of each group
+    std::vector<double> probe_cutoff_sqr, group_cutoff_sqr;
+    // the components are ordered by group, then by probe
+    std::vector<int> probe_comp_start, probe_ncomp;
+    std::vector<double> comp_weight;
+    // the terms coef * x^p y^q z^r of component k are
+    // [comp_term_start[k], comp_term_start[k+1]), term_mono holds the index of
+    // the monomial within its group
+    std::vector<int> comp_term_start, term_mono;
+    std::vector<double> term_coef;
+};
+
+// coefficient_bound of each probe ([nmcsh]), returns 1 when a probe has a
+// negative order. params_i and params_d are flat arrays with row strides
+extern "C" int mcsh_coefficient_bounds(int nmcsh, int* params_i, int params_i_stride,
+                                       double* params_d, int params_d_stride, int solid,
+                                       double* bounds);
+
+#endif
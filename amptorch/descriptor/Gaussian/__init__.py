@@ -1,15 +1,18 @@
 import hashlib
 
 import numpy as np
-from scipy import sparse
 
 from ..base_descriptor import BaseDescriptor
 from ..constants import ATOM_SYMBOL_TO_INDEX_DICT
-from ..util import _gen_2Darray_for_ffi, list_symbols_to_indices
+from ..util import (
+    _flat_array_for_ffi,
+    _ImageBatch,
+    _neighbor_pairs,
+    list_symbols_to_indices,
+)
 from ._libsymf import ffi, lib
 from .descriptor_set import GaussianDescriptorSet
 
-
 GDS = GaussianDescriptorSet  # so Flake8 allows the commit to proceed, also an easy-access-acronym!
 
 
@@ -25,9 +28,17 @@ class Gaussian(BaseDescriptor):
     cutoff_func [str] : defines the form of f_c. Default to "cosine".
 
     gamma [float] : parameter for polynomial cutoff function. Default to None as the default cutoff function is cosine.
+
+    tabulation_tolerance [float] : when given, the radial part of each symmetry function (its gaussian times the cutoff
+    function) and its derivative are tabulated once and interpolated by the kernels, instead of being computed for every
+    pair of atoms. The interpolation error of both is below the tolerance. Default to None (exact functions).
     """
 
-    def __init__(self, Gs, elements, cutoff_func="cosine", gamma=None):
+    supports_force_contraction = True
+
+    def __init__(
+        self, Gs, elements, cutoff_func="cosine", gamma=None, tabulation_tolerance=None
+    ):
         super().__init__()
         self.descriptor_type = "Gaussian"
         self.Gs = Gs
@@ -43,6 +54,9 @@ class Gaussian(BaseDescriptor):
             elif gamma <= 0.0:
                 raise ValueError("polynomial cutoff function gamma must be > 0.")
         self.gamma = gamma
+        if tabulation_tolerance is not None and tabulation_tolerance <= 0.0:
+            raise ValueError("tabulation_tolerance must be > 0.")
+        self.tabulation_tolerance = tabulation_tolerance
         self.element_indices = list_symbols_to_indices(elements)
 
         self.prepare_descriptor_parameters()
@@ -127,12 +141,6 @@ class Gaussian(BaseDescriptor):
             )
             self.params_set[element_index]["i"] = params_i
             self.params_set[element_index]["d"] = params_d
-            self.params_set[element_index]["ip"] = _gen_2Darray_for_ffi(
-                self.params_set[element_index]["i"], ffi, "int"
-            )
-            self.params_set[element_index]["dp"] = _gen_2Darray_for_ffi(
-                self.params_set[element_index]["d"], ffi
-            )
             self.params_set[element_index]["total"] = np.concatenate(
                 (
                     self.params_set[element_index]["i"],
@@ -142,8 +150,125 @@ class Gaussian(BaseDescriptor):
             )
             self.params_set[element_index]["num"] = len(self.descriptor_setup[element])
 
+        # the symmetry functions of all the elements are stacked for the
+        # kernels, the ones of the element of order e are the rows
+        # param_offsets[e] to param_offsets[e + 1]
+        element_index_to_order = np.full(120, -1, dtype=np.intc)
+        param_offsets = [0]
+        for order, element in enumerate(self.elements):
+            element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
+            element_index_to_order[element_index] = order
+            param_offsets.append(
+                param_offsets[-1] + self.params_set[element_index]["num"]
+            )
+        element_params = [
+            self.params_set[ATOM_SYMBOL_TO_INDEX_DICT[element]]
+            for element in self.elements
+        ]
+        param_offsets = np.asarray(param_offsets, dtype=np.intc, order="C")
+        self.params_set["i"] = np.concatenate(
+            [params["i"] for params in element_params]
+        )
+        self.params_set["d"] = np.concatenate(
+            [params["d"] for params in element_params]
+        )
+        self.params_set["ip"] = _flat_array_for_ffi(self.params_set["i"], ffi, "int")
+        self.params_set["dp"] = _flat_array_for_ffi(self.params_set["d"], ffi)
+        self.params_set["param_offsets"] = param_offsets
+        self.params_set["param_offsets_p"] = ffi.cast(
+            "int *", param_offsets.ctypes.data
+        )
+        self.params_set["element_index_to_order"] = element_index_to_order
+        self.params_set["element_index_to_order_p"] = ffi.cast(
+            "int *", element_index_to_order.ctypes.data
+        )
+        # the rows of the elements with less symmetry functions are padded
+        self.params_set["num"] = max(params["num"] for params in element_params)
+
+        if self.tabulation_tolerance is None:
+            self.params_set["table"] = None
+            self.params_set["table_p"] = ffi.NULL
+        else:
+            self.params_set["table"] = self._tabulate_radial_functions(
+                self.tabulation_tolerance
+            )
+            self.params_set["table_p"] = ffi.cast(
+                "double *", self.params_set["table"].ctypes.data
+            )
+
         return
 
+    def _radial_functions(self, r):
+        """
+        Radial part of each symmetry function (its gaussian times the cutoff
+        function) and its derivative at the distances r ([# of params, n]).
+        """
+        params_i, params_d = self.params_set["i"], self.params_set["d"]
+        cutoff, eta, rs = params_d[:, 0:1], params_d[:, 1:2], params_d[:, 2:3]
+        # the angular symmetry functions have no shift
+        rs = np.where(params_i[:, 0:1] == 2, rs, 0.0)
+        frac = np.minimum(r / cutoff, 1.0)
+        if self.cutoff_func == "cosine":
+            fc = 0.5 * (1.0 + np.cos(np.pi * frac))
+            dfc = -0.5 * np.pi * np.sin(np.pi * frac) / cutoff
+        else:
+            gamma = self.gamma
+            fc = 1.0 + gamma * frac ** (gamma + 1) - (gamma + 1) * frac**gamma
+            with np.errstate(divide="ignore"):
+                dfc = (
+                    gamma * (gamma + 1) / cutoff * (frac**gamma - frac ** (gamma - 1))
+                )
+        gaussian = np.exp(-eta * (r - rs) ** 2)
+        values = gaussian * fc
+        derivatives = gaussian * (dfc - 2.0 * eta * (r - rs) * fc)
+        return values, derivatives
+
+    def _tabulate_radial_functions(self, tolerance, max_intervals=2**14):
+        """
+        Table of the radial parts of the symmetry functions for the kernels,
+        one row per symmetry function holding the [value, derivative] pairs on
+        n + 1 equally spaced distances from 0 to its cutoff. n is doubled until
+        the cubic Hermite interpolation between the nodes (see tabulated in
+        symmetry_functions.h) reproduces the values and the derivatives to
+        within the tolerance.
+        """
+        cutoff = self.params_set["d"][:, 0:1]
+        n = 64
+        while n <= max_intervals:
+            spacing = cutoff / n
+            values, derivatives = self._radial_functions(np.arange(n + 1) * spacing)
+            error = 0.0
+            for t in (0.25, 0.5, 0.75):
+                f0, f1 = values[:, :-1], values[:, 1:]
+                d0, d1 = derivatives[:, :-1] * spacing, derivatives[:, 1:] * spacing
+                df = f0 - f1
+                value = f0 + t * (
+                    d0 + t * (-3 * df - 2 * d0 - d1 + t * (2 * df + d0 + d1))
+                )
+                derivative = (
+                    (6 * t - 6) * t * df
+                    + ((3 * t - 4) * t + 1) * d0
+                    + (3 * t - 2) * t * d1
+                ) / spacing
+                exact_value, exact_derivative = self._radial_functions(
+                    (np.arange(n) + t) * spacing
+                )
+                error = max(
+                    error,
+                    np.max(np.abs(value - exact_value)),
+                    np.max(np.abs(derivative - exact_derivative)),
+                )
+            if error <= tolerance:
+                table = np.empty((len(cutoff), 2 * (n + 1)), dtype=np.float64)
+                table[:, 0::2] = values
+                table[:, 1::2] = derivatives
+                return table
+            n *= 2
+        raise ValueError(
+            "the symmetry functions cannot be tabulated to a tolerance of %g"
+            % tolerance
+        )
+
     def _prepare_descriptor_parameters_element(self, Gs, element_indices):
         descriptor_setup = {"G2": set(), "G4": set(), "G5": set()}
         cutoff = Gs["cutoff"]
@@ -229,6 +354,12 @@ class Gaussian(BaseDescriptor):
                 "Gs must be a dict with descriptor params or a GaussianDescriptorSet object: passed was a (%s)"
                 % type(self.Gs)
             )
+        if self.tabulation_tolerance is not None:
+            # the interpolated fingerprints differ from the exact ones
+            string = self.descriptor_setup_hash + "tabulated%.15e" % (
+                self.tabulation_tolerance
+            )
+            self.descriptor_setup_hash = hashlib.md5(string.encode("utf-8")).hexdigest()
 
     def save_descriptor_setup(self, filename):
         with open(filename, "w") as out_file:
@@ -251,155 +382,149 @@ class Gaussian(BaseDescriptor):
                         )
                     )
 
-    def calculate_fingerprints(self, atoms, element, calc_derivatives, log):
+    def get_num_descriptors(self, element):
+        return self.params_set[ATOM_SYMBOL_TO_INDEX_DICT[element]]["num"]
+
+    def get_cutoff(self):
+        return float(np.max(self.params_set["d"][:, 0]))
+
+    def _neighbor_pairs(self, image, cutoff):
+        return _neighbor_pairs(image, cutoff, ffi, lib)
+
+    def calculate_fingerprints_batch(
+        self,
+        images,
+        element,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+    ):
         """
-        Interfacing with cffi to compute the fingerprints.
+        Compute the fingerprints of the atoms of an element in a list of images
+        with a single kernel call, the results are returned per image.
         """
         element_index = ATOM_SYMBOL_TO_INDEX_DICT[element]
+        batch = _ImageBatch(images, element_index, ffi, lib, neighbor_lists, dtype)
+        return self._calculate_batch(
+            batch, self.params_set[element_index]["num"], calc_derivatives, cores
+        )
 
-        symbols = np.array(atoms.get_chemical_symbols())
-        atom_num = len(symbols)
-        atom_indices = list_symbols_to_indices(symbols)
-        unique_atom_indices = np.unique(atom_indices)
-
-        type_num = dict()
-        type_idx = dict()
-
-        for atom_index in unique_atom_indices:
-            tmp = atom_indices == atom_index
-            type_num[atom_index] = np.sum(tmp).astype(np.int64)
-            # if atom indexs are sorted by atom type,
-            # indexs are sorted in this part.
-            # if not, it could generate bug in training process for force training
-            type_idx[atom_index] = np.arange(atom_num)[tmp]
-
-        atom_indices_p = ffi.cast("int *", atom_indices.ctypes.data)
-
-        cart = np.copy(atoms.get_positions(wrap=True), order="C")
-        scale = np.copy(atoms.get_scaled_positions(wrap=True), order="C")
-        cell = np.copy(atoms.cell, order="C")
-        pbc = np.copy(atoms.get_pbc()).astype(np.intc)
-
-        cart_p = _gen_2Darray_for_ffi(cart, ffi)
-        scale_p = _gen_2Darray_for_ffi(scale, ffi)
-        cell_p = _gen_2Darray_for_ffi(cell, ffi)
-        pbc_p = ffi.cast("int *", pbc.ctypes.data)
-
-        cal_atoms = np.asarray(type_idx[element_index], dtype=np.intc, order="C")
-        cal_num = len(cal_atoms)
-        cal_atoms_p = ffi.cast("int *", cal_atoms.ctypes.data)
-
-        size_info = np.array([atom_num, cal_num, self.params_set[element_index]["num"]])
-
-        if calc_derivatives:
-            x = np.zeros(
-                [cal_num, self.params_set[element_index]["num"]],
-                dtype=np.float64,
-                order="C",
-            )
-            dx = np.zeros(
-                [cal_num * self.params_set[element_index]["num"], atom_num * 3],
-                dtype=np.float64,
-                order="C",
-            )
-
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-            dx_p = _gen_2Darray_for_ffi(dx, ffi)
-
-            errno = (
-                lib.calculate_sf_cos(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set[element_index]["ip"],
-                    self.params_set[element_index]["dp"],
-                    self.params_set[element_index]["num"],
-                    x_p,
-                    dx_p,
-                )
-                if self.cutoff_func == "cosine"
-                else lib.calculate_sf_poly(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set[element_index]["ip"],
-                    self.params_set[element_index]["dp"],
-                    self.params_set[element_index]["num"],
-                    x_p,
-                    dx_p,
-                    self.gamma,
-                )
-            )
-
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
-            fp = np.array(x)
-            fp_prime = np.array(dx)
-            scipy_sparse_fp_prime = sparse.coo_matrix(fp_prime)
-
-            return (
-                size_info,
-                fp,
-                scipy_sparse_fp_prime.data,
-                scipy_sparse_fp_prime.row,
-                scipy_sparse_fp_prime.col,
-                np.array(fp_prime.shape),
-            )
+    def calculate_image_fingerprints_batch(
+        self,
+        images,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+    ):
+        """
+        Compute the fingerprints of all the atoms of a list of images with a
+        single kernel call, each center atom uses the symmetry functions of
+        its element. The results are returned per image. center_atoms and
+        free_atoms optionally restrict the center atoms and the derivative
+        columns of each image, see _ImageBatch.
+        """
+        batch = _ImageBatch(
+            images,
+            None,
+            ffi,
+            lib,
+            neighbor_lists,
+            dtype,
+            center_atoms=center_atoms,
+            free_atoms=free_atoms,
+        )
+        return self._calculate_batch(
+            batch, self.params_set["num"], calc_derivatives, cores
+        )
 
+    def calculate_image_forces_batch(
+        self,
+        images,
+        fingerprint_grads,
+        cores=1,
+        neighbor_lists=None,
+        calc_virial=False,
+        free_atoms=None,
+    ):
+        """
+        Forces of each image of a list from the gradient of the energy with
+        respect to the fingerprints of its atoms (one [# of atoms, num] array
+        per image). The kernels contract the fingerprint derivatives with the
+        gradient as they are computed, without storing them. With calc_virial
+        the virial of each image (-dE/dstrain, [3, 3]) is returned as well.
+        The forces of the atoms not in free_atoms (per image, optional) are
+        left at zero.
+        """
+        batch = _ImageBatch(
+            images, None, ffi, lib, neighbor_lists, free_atoms=free_atoms
+        )
+        self._calculate_batch(
+            batch, self.params_set["num"], False, cores, fingerprint_grads, calc_virial
+        )
+        return batch.force_results(calc_virial)
+
+    def _calculate_batch(
+        self,
+        batch,
+        num,
+        calc_derivatives,
+        cores,
+        fingerprint_grads=None,
+        calc_virial=False,
+    ):
+        x = np.zeros([batch.cal_total, num], dtype=np.float64, order="C")
+        x_p = _flat_array_for_ffi(x, ffi)
+        if fingerprint_grads is not None:
+            dx = batch.new_force_buffers(ffi, fingerprint_grads, calc_virial)
+        elif calc_derivatives:
+            dx = batch.new_fp_prime_buffers(ffi)
         else:
-            x = np.zeros(
-                [cal_num, self.params_set[element_index]["num"]],
-                dtype=np.float64,
-                order="C",
-            )
-            x_p = _gen_2Darray_for_ffi(x, ffi)
-
-            errno = (
-                lib.calculate_sf_cos_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set[element_index]["ip"],
-                    self.params_set[element_index]["dp"],
-                    self.params_set[element_index]["num"],
-                    x_p,
-                )
-                if self.cutoff_func == "cosine"
-                else lib.calculate_sf_poly_noderiv(
-                    cell_p,
-                    cart_p,
-                    scale_p,
-                    pbc_p,
-                    atom_indices_p,
-                    atom_num,
-                    cal_atoms_p,
-                    cal_num,
-                    self.params_set[element_index]["ip"],
-                    self.params_set[element_index]["dp"],
-                    self.params_set[element_index]["num"],
-                    x_p,
-                    dx_p,
-                    self.gamma,
-                )
-            )
-
-            if errno == 1:
-                raise NotImplementedError("Descriptor not implemented!")
-            fp = np.array(x)
+            dx = ffi.NULL
+
+        errno = lib.calculate_sf_batch(
+            batch.cell_p,
+            batch.cart_p,
+            batch.scale_p,
+            batch.pbc_p,
+            batch.atom_indices_p,
+            batch.num_images,
+            batch.atom_offsets_p,
+            batch.cal_atoms_p,
+            batch.cal_offsets_p,
+            self.params_set["ip"],
+            self.params_set["i"].shape[1],
+            self.params_set["dp"],
+            self.params_set["d"].shape[1],
+            self.params_set["element_index_to_order_p"],
+            self.params_set["param_offsets_p"],
+            len(self.elements),
+            num,
+            int(self.cutoff_func == "polynomial"),
+            x_p,
+            dx,
+            0.0,
+            self.gamma if self.cutoff_func == "polynomial" else 0.0,
+            self.params_set["table_p"],
+            0
+            if self.params_set["table"] is None
+            else self.params_set["table"].shape[1],
+            batch.neighbor_lists_p,
+            cores,
+        )
 
-            return size_info, fp, None, None, None, None
+        fp_primes = None
+        if calc_derivatives:
+            # all the nonzero derivatives are kept (threshold of 0.0)
+            fp_primes = batch.fp_prime_buffers_to_numpy(dx, ffi, lib)
+        if errno == 1:
+            raise NotImplementedError("Descriptor not implemented!")
+        if fingerprint_grads is not None:
+            return
+
+        return batch.fingerprint_results(x, fp_primes)
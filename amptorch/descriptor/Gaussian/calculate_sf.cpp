@@ -1,12 +1,16 @@
 //#include <mpi.h>
 #include <math.h>
 #include <stdio.h>
+#include "neighbor_list.h"
+#include "parallel.h"
+#include "flat_array.h"
 #include "calculate_sf.h"
 
 extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, int* pbc_bools,
                             int* atom_i, int natoms, int* cal_atoms, int cal_num,
-                            int** params_i, double** params_d, int nsyms,
-                            double** symf, double** dsymf) {
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, FpPrimeBuffer* dsymf, double threshold, NeighborList* neighbor_list, int cores) {
     // cell: cell info of structure
     // cart: cartesian coordinates of atoms
     // scale: fractional coordinates of atoms
@@ -16,7 +20,12 @@ extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, in
     // params_d: double parameter for symmetry function
     //           [cutoff, param1, param2, param3]
     // natoms: # of atoms
-    // nsyms: # of symmetry functions
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
     // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
@@ -24,16 +33,11 @@ extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, in
     // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
     // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-    int total_bins, max_atoms_bin, bin_num, neigh_check_bins, nneigh;
-    int bin_range[3], nbins[3], cell_shift[3], max_bin[3], min_bin[3], pbc_bin[3];
-    //int bin_i[natoms][4];
-    double vol, tmp, cutoff, dradtmp, rRij, rRik, rRjk;
-    double plane_d[3], total_shift[3], precal[12], tmpd[9], dangtmp[3];
-    double vecij[3], vecik[3], vecjk[3], deljk[3];
-    double cross[3][3], reci[3][3];//, powtwo[nsyms];
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
     // Check for not implemented symfunc type.
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         bool implemented = false;
         for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
             if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
@@ -44,15 +48,10 @@ extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, in
         if (!implemented) return 1;
     }
 
-    int **bin_i = new int*[natoms];
-    for (int i=0; i<natoms; i++) {
-        bin_i[i] = new int[4];
-    }
-
-    double *powtwo = new double[nsyms];
+    double *powtwo = new double[nparams];
 
     cutoff = 0.0;
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         if (cutoff < params_d[s][0])
             cutoff = params_d[s][0];
 
@@ -63,277 +62,180 @@ extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, in
         powtwo[s] = pow(2, 1.-params_d[s][2]);
     }
 
-    total_bins = 1;
-
-    // calculate the distance between cell plane
-    cross[0][0] = cell[1][1]*cell[2][2] - cell[1][2]*cell[2][1];
-    cross[0][1] = cell[1][2]*cell[2][0] - cell[1][0]*cell[2][2];
-    cross[0][2] = cell[1][0]*cell[2][1] - cell[1][1]*cell[2][0];
-    cross[1][0] = cell[2][1]*cell[0][2] - cell[2][2]*cell[0][1];
-    cross[1][1] = cell[2][2]*cell[0][0] - cell[2][0]*cell[0][2];
-    cross[1][2] = cell[2][0]*cell[0][1] - cell[2][1]*cell[0][0];
-    cross[2][0] = cell[0][1]*cell[1][2] - cell[0][2]*cell[1][1];
-    cross[2][1] = cell[0][2]*cell[1][0] - cell[0][0]*cell[1][2];
-    cross[2][2] = cell[0][0]*cell[1][1] - cell[0][1]*cell[1][0];
-
-    vol = cross[0][0]*cell[0][0] + cross[0][1]*cell[0][1] + cross[0][2]*cell[0][2];
-
-    //reci is the inverse matrix
-    for (int i=0; i<3; ++i) {
-        tmp = 0;
-        for (int j=0; j<3; ++j) {
-            reci[i][j] = cross[i][j]/vol;
-            tmp += reci[i][j]*reci[i][j];
-        }
-        // sqrt(tmp): magnitude of the cross product divided by vol, which is the "(1/height)" in that direction
-        // note: the magnitude of the cross product is the area of the parallelogram
-        // thus, plane_d[i] is height in dimension i
-        plane_d[i] = 1/sqrt(tmp);
-        // nbins[i] is height/cutoff in dimension i (how many "cutoff" can a height in that dimension hold)
-        // if height > cutoff, nbins > 1, if height <= cutoff, nbins = 1
-        // ==> nbins: num of bins in each cell in each dimension
-        nbins[i] = ceil(plane_d[i]/cutoff);
-        total_bins *= nbins[i];
-    }
-
-    int *atoms_bin = new int[total_bins];
-    for (int i=0; i<total_bins; ++i)
-        atoms_bin[i] = 0;
-
-    // cut the cell into numerous bins (evenly according to nbins)
-    // assign the bin index to each atom (which bin does the atom belong to)
-    // note bin_i is an integer array, and
-    for (int i=0; i<natoms; ++i) {
-        for (int j=0; j<3; ++j) {
-            bin_i[i][j] = (int) (scale[i][j] * (double) nbins[j]);
-            // this is an integer!
-            // bug when scale == 1?
-        }
-        bin_i[i][3] = bin_i[i][0] + nbins[0]*bin_i[i][1] + nbins[0]*nbins[1]*bin_i[i][2];
-        atoms_bin[bin_i[i][3]]++;
-    }
-
-    // atoms_bin: count of howmany atoms in that bin
-    max_atoms_bin = 0;
-    for (int i=0; i < total_bins; ++i) {
-        if (atoms_bin[i] > max_atoms_bin)
-            max_atoms_bin = atoms_bin[i];
-    }
-
-    delete[] atoms_bin;
-
-    // # of bins in each direction
-    neigh_check_bins = 1;
-    for (int i=0; i < 3; ++i) {
-        // plane_d[i] / nbins[i] = height[i] / nbins[i] = size of bin in i dimension
-        // cutoff * nbins[i] / plane_d[i] = cutoff / size of bin in i dimension = num bin needed in i dimension
-        // if cutoff < size: bin_range = 1, if cutoff > size: bin_range > 1
-        bin_range[i] = ceil(cutoff * nbins[i] / plane_d[i]);
-        // +1?
-        neigh_check_bins *= 2*bin_range[i]+1;
-    }
-
-    //for (int i=0; i < natoms; ++i) {
-    for (int ii=0; ii < cal_num; ++ii) {
-        int i=cal_atoms[ii];
-        // calculate neighbor atoms
-        double* nei_list_d = new double[max_atoms_bin * 4 * neigh_check_bins];
-        int*    nei_list_i = new int[max_atoms_bin * 2 * neigh_check_bins];
-        nneigh = 0;
-
-        for (int j=0; j < 3; ++j) {
-            max_bin[j] = bin_i[i][j] + bin_range[j];
-            min_bin[j] = bin_i[i][j] - bin_range[j];
-        }
-
-        // loop through nearby bins
-        for (int dx=min_bin[0]; dx < max_bin[0]+1; ++dx) {
-            for (int dy=min_bin[1]; dy < max_bin[1]+1; ++dy) {
-                for (int dz=min_bin[2]; dz < max_bin[2]+1; ++dz) {
-                    pbc_bin[0] = (dx%nbins[0] + nbins[0]) % nbins[0];
-                    pbc_bin[1] = (dy%nbins[1] + nbins[1]) % nbins[1];
-                    pbc_bin[2] = (dz%nbins[2] + nbins[2]) % nbins[2];
-                    cell_shift[0] = (dx-pbc_bin[0]) / nbins[0];
-                    cell_shift[1] = (dy-pbc_bin[1]) / nbins[1];
-                    cell_shift[2] = (dz-pbc_bin[2]) / nbins[2];
-
-                    bin_num = pbc_bin[0] + nbins[0]*pbc_bin[1] + nbins[0]*nbins[1]*pbc_bin[2];
-
-                    for (int j=0; j < natoms; ++j) {
-                        // what does this mean?
-                        // only consider atom in the current bin (not other atoms in the cell that's not in this bin)
-                        if (bin_i[j][3] != bin_num)
-                            continue;
-
-                        // take care of pbc
-                        if (!pbc_bools[0] && cell_shift[0] != 0)
-                            continue;
-
-                        if (!pbc_bools[1] && cell_shift[1] != 0)
-                            continue;
-
-                        if (!pbc_bools[2] && cell_shift[2] != 0)
-                            continue;
-
-                        // skip if it's the same atom
-                        if (!(cell_shift[0] || cell_shift[1] || cell_shift[2]) && (i == j))
-                            continue;
-
-                        for (int a=0; a < 3; ++a) {
-                            total_shift[a] = cell_shift[0]*cell[0][a] + cell_shift[1]*cell[1][a] + cell_shift[2]*cell[2][a]
-                                             + cart[j][a] - cart[i][a];
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread, and the
+    // derivatives of each thread are merged in order, as in a serial run
+    if (cores < 1) cores = 1;
+    FpPrimeBuffer* thread_dsymf = new_thread_buffers(dsymf, cores, natoms);
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ij, cutoff_ijk, eta4_ijk, eta5_ijk;
+        double precal[14], tmpd[9], dangtmp[3];
+        double vecij[3], vecik[3], vecjk[3], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+        FpPrimeAccumulator fp_prime(natoms, max_nneigh, nsyms, dsymf->virial != NULL);
+        FpPrimeBuffer* thread_buffer = &thread_dsymf[get_thread_num()];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            fp_prime.set_neighbors(i, nneigh, nei_list_i, nei_list_d);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+                vecij[0] =  nei_list_d[j*4]     / rRij;
+                vecij[1] =  nei_list_d[j*4 + 1] / rRij;
+                vecij[2] =  nei_list_d[j*4 + 2] / rRij;
+
+                // the cutoff terms are computed once per cutoff
+                cutoff_ij = -1.0;
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        if (elem_params_d[s][0] != cutoff_ij) {
+                            cutoff_ij = elem_params_d[s][0];
+                            precal[0] = cutf(rRij / cutoff_ij);
+                            precal[1] = dcutf(rRij, cutoff_ij);
                         }
 
-                        tmp = sqrt(total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2]);
+                        symf[ii][s] += G2(rRij, precal, elem_params_d[s], dradtmp); // FIXME: index
+                        tmpd[0] = dradtmp*vecij[0];
+                        tmpd[1] = dradtmp*vecij[1];
+                        tmpd[2] = dradtmp*vecij[2];
 
-                        if (tmp < cutoff) {
-                            for (int a=0; a < 3; ++a)
-                                nei_list_d[nneigh*4 + a] = total_shift[a];
-                            nei_list_d[nneigh*4 + 3] = tmp;
-                            nei_list_i[nneigh*2]    = atom_i[j];
-                            nei_list_i[nneigh*2 + 1] = j;
-                            nneigh++;
-                        }
+                        fp_prime.add(s, j, tmpd[0], tmpd[1], tmpd[2]);
                     }
+                    else continue;
                 }
-            }
-        }
 
-        for (int j=0; j < nneigh; ++j) {
-            // calculate radial symmetry function
-            rRij = nei_list_d[j*4 + 3];
-            vecij[0] =  nei_list_d[j*4]     / rRij;
-            vecij[1] =  nei_list_d[j*4 + 1] / rRij;
-            vecij[2] =  nei_list_d[j*4 + 2] / rRij;
-
-            for (int s=0; s < nsyms; ++s) {
-                if ((params_i[s][0] == 2) && (params_i[s][1] == nei_list_i[j*2])) { // FIXME:
-                    precal[0] = cutf(rRij / params_d[s][0]);
-                    precal[1] = dcutf(rRij, params_d[s][0]);
-
-                    symf[ii][s] += G2(rRij, precal, params_d[s], dradtmp); // FIXME: index
-                    tmpd[0] = dradtmp*vecij[0];
-                    tmpd[1] = dradtmp*vecij[1];
-                    tmpd[2] = dradtmp*vecij[2];
-
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0];
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1];
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2];
-
-                    dsymf[ii*nsyms + s][i*3]     -= tmpd[0];
-                    dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1];
-                    dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2];
-                }
-                else continue;
-            }
-
-            for (int k=j+1; k < nneigh; ++k) {
-                // calculate angular symmetry function
-                rRik = nei_list_d[k*4 + 3];
-                vecik[0] = nei_list_d[k*4]     / rRik;
-                vecik[1] = nei_list_d[k*4 + 1] / rRik;
-                vecik[2] = nei_list_d[k*4 + 2] / rRik;
-
-                deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
-                deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
-                deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
-                rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
-
-                if (rRjk < 0.0001) continue;
-
-                vecjk[0] = deljk[0] / rRjk;
-                vecjk[1] = deljk[1] / rRjk;
-                vecjk[2] = deljk[2] / rRjk;
-
-                precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
-                precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
-                precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
-                precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
-                precal[10] = rRjk/rRij/rRik;
-                precal[11] = rRij*rRij+rRik*rRik;
-
-                for (int s=0; s < nsyms; ++s) {
-                    if ((params_i[s][0] == 4) &&
-                       (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                        ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
-
-                        precal[0] = cutf(rRij / params_d[s][0]);
-                        precal[1] = dcutf(rRij, params_d[s][0]);
-                        precal[2] = cutf(rRik / params_d[s][0]);
-                        precal[3] = dcutf(rRik, params_d[s][0]);
-                        precal[4] = cutf(rRjk / params_d[s][0]);
-                        precal[5] = dcutf(rRjk, params_d[s][0]);
-
-                        symf[ii][s] += G4(rRij, rRik, rRjk, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0] - tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1] - tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2] - tmpd[8];
-
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3]     += tmpd[3] + tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 1] += tmpd[4] + tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 2] += tmpd[5] + tmpd[8];
-
-                        dsymf[ii*nsyms + s][i*3]     -= tmpd[0] + tmpd[3];
-                        dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1] + tmpd[4];
-                        dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2] + tmpd[5];
-                    }
-                    else if ((params_i[s][0] == 5) &&
-                           (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                            ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) {
-
-                        precal[0] = cutf(rRij / params_d[s][0]);
-                        precal[1] = dcutf(rRij, params_d[s][0]);
-                        precal[2] = cutf(rRik / params_d[s][0]);
-                        precal[3] = dcutf(rRik, params_d[s][0]);
-
-                        symf[ii][s] += G5(rRij, rRik, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0] - tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1] - tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2] - tmpd[8];
-
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3]     += tmpd[3] + tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 1] += tmpd[4] + tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 2] += tmpd[5] + tmpd[8];
-
-                        dsymf[ii*nsyms + s][i*3]     -= tmpd[0] + tmpd[3];
-                        dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1] + tmpd[4];
-                        dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2] + tmpd[5];
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+                    vecik[0] = nei_list_d[k*4]     / rRik;
+                    vecik[1] = nei_list_d[k*4 + 1] / rRik;
+                    vecik[2] = nei_list_d[k*4 + 2] / rRik;
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    vecjk[0] = deljk[0] / rRjk;
+                    vecjk[1] = deljk[1] / rRjk;
+                    vecjk[2] = deljk[2] / rRjk;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the cutoff terms and the gaussians only depend on the cutoff and
+                    // eta of the symmetry functions, they are computed once per value
+                    cutoff_ijk = eta4_ijk = eta5_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = cutf(rRij / cutoff_ijk);
+                                precal[1] = dcutf(rRij, cutoff_ijk);
+                                precal[2] = cutf(rRik / cutoff_ijk);
+                                precal[3] = dcutf(rRik, cutoff_ijk);
+                                precal[4] = cutf(rRjk / cutoff_ijk);
+                                precal[5] = dcutf(rRjk, cutoff_ijk);
+                            }
+                            if (elem_params_d[s][1] != eta4_ijk) {
+                                eta4_ijk = elem_params_d[s][1];
+                                precal[12] = exp(-eta4_ijk*precal[6]);
+                            }
+
+                            symf[ii][s] += G4(rRij, rRik, rRjk, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = cutf(rRij / cutoff_ijk);
+                                precal[1] = dcutf(rRij, cutoff_ijk);
+                                precal[2] = cutf(rRik / cutoff_ijk);
+                                precal[3] = dcutf(rRik, cutoff_ijk);
+                                precal[4] = cutf(rRjk / cutoff_ijk);
+                                precal[5] = dcutf(rRjk, cutoff_ijk);
+                            }
+                            if (elem_params_d[s][1] != eta5_ijk) {
+                                eta5_ijk = elem_params_d[s][1];
+                                precal[13] = exp(-eta5_ijk*precal[11]);
+                            }
+
+                            symf[ii][s] += G5(rRij, rRik, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else continue;
                     }
-                    else continue;
                 }
             }
+
+            fp_prime.flush(thread_buffer, (long) ii * nsyms, threshold);
         }
 
         delete[] nei_list_d;
         delete[] nei_list_i;
     }
 
-    for (int i=0; i<natoms; i++) {
-        delete[] bin_i[i];
-    }
-    delete[] bin_i;
+    merge_thread_buffers(dsymf, thread_dsymf, cores, natoms);
+
     delete[] powtwo;
     return 0;
 }
@@ -343,8 +245,9 @@ extern "C" int calculate_sf_cos(double** cell, double** cart, double** scale, in
 
 extern "C" int calculate_sf_cos_noderiv(double** cell, double** cart, double** scale, int* pbc_bools,
                             int* atom_i, int natoms, int* cal_atoms, int cal_num,
-                            int** params_i, double** params_d, int nsyms,
-                            double** symf) {
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, NeighborList* neighbor_list, int cores) {
     // cell: cell info of structure
     // cart: cartesian coordinates of atoms
     // scale: fractional coordinates of atoms
@@ -354,7 +257,12 @@ extern "C" int calculate_sf_cos_noderiv(double** cell, double** cart, double** s
     // params_d: double parameter for symmetry function
     //           [cutoff, param1, param2, param3]
     // natoms: # of atoms
-    // nsyms: # of symmetry functions
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
     // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
@@ -362,16 +270,11 @@ extern "C" int calculate_sf_cos_noderiv(double** cell, double** cart, double** s
     // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
     // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-    int total_bins, max_atoms_bin, bin_num, neigh_check_bins, nneigh;
-    int bin_range[3], nbins[3], cell_shift[3], max_bin[3], min_bin[3], pbc_bin[3];
-    //int bin_i[natoms][4];
-    double vol, tmp, cutoff, dradtmp, rRij, rRik, rRjk;
-    double plane_d[3], total_shift[3], precal[12], tmpd[9], dangtmp[3];
-    double vecij[3], vecik[3], vecjk[3], deljk[3];
-    double cross[3][3], reci[3][3];//, powtwo[nsyms];
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
     // Check for not implemented symfunc type.
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         bool implemented = false;
         for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
             if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
@@ -382,15 +285,10 @@ extern "C" int calculate_sf_cos_noderiv(double** cell, double** cart, double** s
         if (!implemented) return 1;
     }
 
-    int **bin_i = new int*[natoms];
-    for (int i=0; i<natoms; i++) {
-        bin_i[i] = new int[4];
-    }
-
-    double *powtwo = new double[nsyms];
+    double *powtwo = new double[nparams];
 
     cutoff = 0.0;
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         if (cutoff < params_d[s][0])
             cutoff = params_d[s][0];
 
@@ -401,248 +299,407 @@ extern "C" int calculate_sf_cos_noderiv(double** cell, double** cart, double** s
         powtwo[s] = pow(2, 1.-params_d[s][2]);
     }
 
-    total_bins = 1;
-
-    // calculate the distance between cell plane
-    cross[0][0] = cell[1][1]*cell[2][2] - cell[1][2]*cell[2][1];
-    cross[0][1] = cell[1][2]*cell[2][0] - cell[1][0]*cell[2][2];
-    cross[0][2] = cell[1][0]*cell[2][1] - cell[1][1]*cell[2][0];
-    cross[1][0] = cell[2][1]*cell[0][2] - cell[2][2]*cell[0][1];
-    cross[1][1] = cell[2][2]*cell[0][0] - cell[2][0]*cell[0][2];
-    cross[1][2] = cell[2][0]*cell[0][1] - cell[2][1]*cell[0][0];
-    cross[2][0] = cell[0][1]*cell[1][2] - cell[0][2]*cell[1][1];
-    cross[2][1] = cell[0][2]*cell[1][0] - cell[0][0]*cell[1][2];
-    cross[2][2] = cell[0][0]*cell[1][1] - cell[0][1]*cell[1][0];
-
-    vol = cross[0][0]*cell[0][0] + cross[0][1]*cell[0][1] + cross[0][2]*cell[0][2];
-
-    //reci is the inverse matrix
-    for (int i=0; i<3; ++i) {
-        tmp = 0;
-        for (int j=0; j<3; ++j) {
-            reci[i][j] = cross[i][j]/vol;
-            tmp += reci[i][j]*reci[i][j];
-        }
-        // sqrt(tmp): magnitude of the cross product divided by vol, which is the "(1/height)" in that direction
-        // note: the magnitude of the cross product is the area of the parallelogram
-        // thus, plane_d[i] is height in dimension i
-        plane_d[i] = 1/sqrt(tmp);
-        // nbins[i] is height/cutoff in dimension i (how many "cutoff" can a height in that dimension hold)
-        // if height > cutoff, nbins > 1, if height <= cutoff, nbins = 1
-        nbins[i] = ceil(plane_d[i]/cutoff);
-        total_bins *= nbins[i];
-    }
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread
+    if (cores < 1) cores = 1;
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ij, cutoff_ijk, eta4_ijk, eta5_ijk;
+        double precal[14], tmpd[9], dangtmp[3];
+        double vecij[3], vecik[3], vecjk[3], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+                vecij[0] =  nei_list_d[j*4]     / rRij;
+                vecij[1] =  nei_list_d[j*4 + 1] / rRij;
+                vecij[2] =  nei_list_d[j*4 + 2] / rRij;
+
+                // the cutoff terms are computed once per cutoff
+                cutoff_ij = -1.0;
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        if (elem_params_d[s][0] != cutoff_ij) {
+                            cutoff_ij = elem_params_d[s][0];
+                            precal[0] = cutf(rRij / cutoff_ij);
+                            precal[1] = dcutf(rRij, cutoff_ij);
+                        }
 
-    int *atoms_bin = new int[total_bins];
-    for (int i=0; i<total_bins; ++i)
-        atoms_bin[i] = 0;
-
-    // cut the cell into numerous bins (evenly according to nbins)
-    // assign the bin index to each atom (which bin does the atom belong to)
-    // note bin_i is an integer array, and
-    for (int i=0; i<natoms; ++i) {
-        for (int j=0; j<3; ++j) {
-            bin_i[i][j] = (int) (scale[i][j] * (double) nbins[j]);
-            // this is an integer!
+                        symf[ii][s] += G2_noderiv(rRij, precal, elem_params_d[s], dradtmp); // FIXME: index
+                        tmpd[0] = dradtmp*vecij[0];
+                        tmpd[1] = dradtmp*vecij[1];
+                        tmpd[2] = dradtmp*vecij[2];
+                    }
+                    else continue;
+                }
+
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+                    vecik[0] = nei_list_d[k*4]     / rRik;
+                    vecik[1] = nei_list_d[k*4 + 1] / rRik;
+                    vecik[2] = nei_list_d[k*4 + 2] / rRik;
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    vecjk[0] = deljk[0] / rRjk;
+                    vecjk[1] = deljk[1] / rRjk;
+                    vecjk[2] = deljk[2] / rRjk;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the cutoff terms and the gaussians only depend on the cutoff and
+                    // eta of the symmetry functions, they are computed once per value
+                    cutoff_ijk = eta4_ijk = eta5_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = cutf(rRij / cutoff_ijk);
+                                precal[1] = dcutf(rRij, cutoff_ijk);
+                                precal[2] = cutf(rRik / cutoff_ijk);
+                                precal[3] = dcutf(rRik, cutoff_ijk);
+                                precal[4] = cutf(rRjk / cutoff_ijk);
+                                precal[5] = dcutf(rRjk, cutoff_ijk);
+                            }
+                            if (elem_params_d[s][1] != eta4_ijk) {
+                                eta4_ijk = elem_params_d[s][1];
+                                precal[12] = exp(-eta4_ijk*precal[6]);
+                            }
+
+                            symf[ii][s] += G4_noderiv(rRij, rRik, rRjk, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = cutf(rRij / cutoff_ijk);
+                                precal[1] = dcutf(rRij, cutoff_ijk);
+                                precal[2] = cutf(rRik / cutoff_ijk);
+                                precal[3] = dcutf(rRik, cutoff_ijk);
+                                precal[4] = cutf(rRjk / cutoff_ijk);
+                                precal[5] = dcutf(rRjk, cutoff_ijk);
+                            }
+                            if (elem_params_d[s][1] != eta5_ijk) {
+                                eta5_ijk = elem_params_d[s][1];
+                                precal[13] = exp(-eta5_ijk*precal[11]);
+                            }
+
+                            symf[ii][s] += G5_noderiv(rRij, rRik, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+                        }
+                        else continue;
+                    }
+                }
+            }
         }
-        bin_i[i][3] = bin_i[i][0] + nbins[0]*bin_i[i][1] + nbins[0]*nbins[1]*bin_i[i][2];
-        atoms_bin[bin_i[i][3]]++;
-    }
 
-    // atoms_bin: count of howmany atoms in that bin
-    max_atoms_bin = 0;
-    for (int i=0; i < total_bins; ++i) {
-        if (atoms_bin[i] > max_atoms_bin)
-            max_atoms_bin = atoms_bin[i];
+        delete[] nei_list_d;
+        delete[] nei_list_i;
     }
 
-    delete[] atoms_bin;
-
-    // # of bins in each direction
-    neigh_check_bins = 1;
-    for (int i=0; i < 3; ++i) {
-        // plane_d[i] / nbins[i] = height[i] / nbins[i] = size of bin in i dimension
-        // cutoff * nbins[i] / plane_d[i] = cutoff / size of bin in i dimension = num bin needed in i dimension
-        bin_range[i] = ceil(cutoff * nbins[i] / plane_d[i]);
-        neigh_check_bins *= 2*bin_range[i];
-    }
+    delete[] powtwo;
+    return 0;
+}
 
-    //for (int i=0; i < natoms; ++i) {
-    for (int ii=0; ii < cal_num; ++ii) {
-        int i=cal_atoms[ii];
-        // calculate neighbor atoms
-        double* nei_list_d = new double[max_atoms_bin * 4 * neigh_check_bins];
-        int*    nei_list_i = new int[max_atoms_bin * 2 * neigh_check_bins];
-        nneigh = 0;
-
-        for (int j=0; j < 3; ++j) {
-            max_bin[j] = bin_i[i][j] + bin_range[j];
-            min_bin[j] = bin_i[i][j] - bin_range[j];
-        }
 
-        for (int dx=min_bin[0]; dx < max_bin[0]+1; ++dx) {
-            for (int dy=min_bin[1]; dy < max_bin[1]+1; ++dy) {
-                for (int dz=min_bin[2]; dz < max_bin[2]+1; ++dz) {
-                    pbc_bin[0] = (dx%nbins[0] + nbins[0]) % nbins[0];
-                    pbc_bin[1] = (dy%nbins[1] + nbins[1]) % nbins[1];
-                    pbc_bin[2] = (dz%nbins[2] + nbins[2]) % nbins[2];
-                    cell_shift[0] = (dx-pbc_bin[0]) / nbins[0];
-                    cell_shift[1] = (dy-pbc_bin[1]) / nbins[1];
-                    cell_shift[2] = (dz-pbc_bin[2]) / nbins[2];
+extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, int* pbc_bools,
+                            int* atom_i, int natoms, int* cal_atoms, int cal_num,
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, FpPrimeBuffer* dsymf, double threshold, double gamma, NeighborList* neighbor_list, int cores) {
+    // cell: cell info of structure
+    // cart: cartesian coordinates of atoms
+    // scale: fractional coordinates of atoms
+    // atom_i: atom type index (start with 1)
+    // params_i: integer parameter for symmetry function
+    //           [symmetry function type, 1st neighbor atom type, 2nd neighbor atom type]
+    // params_d: double parameter for symmetry function
+    //           [cutoff, param1, param2, param3]
+    // natoms: # of atoms
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
-                    bin_num = pbc_bin[0] + nbins[0]*pbc_bin[1] + nbins[0]*nbins[1]*pbc_bin[2];
+    // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
-                    for (int j=0; j < natoms; ++j) {
-                        // what does this mean?
-                        if (bin_i[j][3] != bin_num)
-                            continue;
+    // dsymf: derivative of symmetry function vector
+    // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
+    // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-                        // take care of pbc
-                        if (!pbc_bools[0] && cell_shift[0] != 0)
-                            continue;
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
-                        if (!pbc_bools[1] && cell_shift[1] != 0)
-                            continue;
+    // Check for not implemented symfunc type.
+    for (int s=0; s < nparams; ++s) {
+        bool implemented = false;
+        for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
+            if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
+                implemented = true;
+                break;
+            }
+        }
+        if (!implemented) return 1;
+    }
 
-                        if (!pbc_bools[2] && cell_shift[2] != 0)
-                            continue;
+    double *powtwo = new double[nparams];
 
-                        // skip if it's the same atom
-                        if (!(cell_shift[0] || cell_shift[1] || cell_shift[2]) && (i == j))
-                            continue;
+    cutoff = 0.0;
+    for (int s=0; s < nparams; ++s) {
+        if (cutoff < params_d[s][0])
+            cutoff = params_d[s][0];
 
-                        for (int a=0; a < 3; ++a) {
-                            total_shift[a] = cell_shift[0]*cell[0][a] + cell_shift[1]*cell[1][a] + cell_shift[2]*cell[2][a]
-                                             + cart[j][a] - cart[i][a];
-                        }
+        if ((params_i[s][0] == 4 || params_i[s][0] == 5) &&
+             params_d[s][2] < 1.0)
+            return 2;
 
-                        tmp = sqrt(total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2]);
+        powtwo[s] = pow(2, 1.-params_d[s][2]);
+    }
 
-                        if (tmp < cutoff) {
-                            for (int a=0; a < 3; ++a)
-                                nei_list_d[nneigh*4 + a] = total_shift[a];
-                            nei_list_d[nneigh*4 + 3] = tmp;
-                            nei_list_i[nneigh*2]    = atom_i[j];
-                            nei_list_i[nneigh*2 + 1] = j;
-                            nneigh++;
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread, and the
+    // derivatives of each thread are merged in order, as in a serial run
+    if (cores < 1) cores = 1;
+    FpPrimeBuffer* thread_dsymf = new_thread_buffers(dsymf, cores, natoms);
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ij, cutoff_ijk, eta4_ijk, eta5_ijk;
+        double precal[14], tmpd[9], dangtmp[3];
+        double vecij[3], vecik[3], vecjk[3], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+        FpPrimeAccumulator fp_prime(natoms, max_nneigh, nsyms, dsymf->virial != NULL);
+        FpPrimeBuffer* thread_buffer = &thread_dsymf[get_thread_num()];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            fp_prime.set_neighbors(i, nneigh, nei_list_i, nei_list_d);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+                vecij[0] =  nei_list_d[j*4]     / rRij;
+                vecij[1] =  nei_list_d[j*4 + 1] / rRij;
+                vecij[2] =  nei_list_d[j*4 + 2] / rRij;
+
+                // the cutoff terms are computed once per cutoff
+                cutoff_ij = -1.0;
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        if (elem_params_d[s][0] != cutoff_ij) {
+                            cutoff_ij = elem_params_d[s][0];
+                            precal[0] = poly_cutf(rRij / cutoff_ij, gamma);
+                            precal[1] = dpoly_cutf(rRij, cutoff_ij, gamma);
                         }
-                    }
-                }
-            }
-        }
+                        symf[ii][s] += G2(rRij, precal, elem_params_d[s], dradtmp); // FIXME: index
+                        tmpd[0] = dradtmp*vecij[0];
+                        tmpd[1] = dradtmp*vecij[1];
+                        tmpd[2] = dradtmp*vecij[2];
 
-        for (int j=0; j < nneigh; ++j) {
-            // calculate radial symmetry function
-            rRij = nei_list_d[j*4 + 3];
-            vecij[0] =  nei_list_d[j*4]     / rRij;
-            vecij[1] =  nei_list_d[j*4 + 1] / rRij;
-            vecij[2] =  nei_list_d[j*4 + 2] / rRij;
-
-            for (int s=0; s < nsyms; ++s) {
-                if ((params_i[s][0] == 2) && (params_i[s][1] == nei_list_i[j*2])) { // FIXME:
-                    precal[0] = cutf(rRij / params_d[s][0]);
-                    precal[1] = dcutf(rRij, params_d[s][0]);
-
-                    symf[ii][s] += G2_noderiv(rRij, precal, params_d[s], dradtmp); // FIXME: index
-                    tmpd[0] = dradtmp*vecij[0];
-                    tmpd[1] = dradtmp*vecij[1];
-                    tmpd[2] = dradtmp*vecij[2];
+                        fp_prime.add(s, j, tmpd[0], tmpd[1], tmpd[2]);
+                    }
+                    else continue;
                 }
-                else continue;
-            }
 
-            for (int k=j+1; k < nneigh; ++k) {
-                // calculate angular symmetry function
-                rRik = nei_list_d[k*4 + 3];
-                vecik[0] = nei_list_d[k*4]     / rRik;
-                vecik[1] = nei_list_d[k*4 + 1] / rRik;
-                vecik[2] = nei_list_d[k*4 + 2] / rRik;
-
-                deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
-                deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
-                deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
-                rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
-
-                if (rRjk < 0.0001) continue;
-
-                vecjk[0] = deljk[0] / rRjk;
-                vecjk[1] = deljk[1] / rRjk;
-                vecjk[2] = deljk[2] / rRjk;
-
-                precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
-                precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
-                precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
-                precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
-                precal[10] = rRjk/rRij/rRik;
-                precal[11] = rRij*rRij+rRik*rRik;
-
-                for (int s=0; s < nsyms; ++s) {
-                    if ((params_i[s][0] == 4) &&
-                       (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                        ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
-
-                        precal[0] = cutf(rRij / params_d[s][0]);
-                        precal[1] = dcutf(rRij, params_d[s][0]);
-                        precal[2] = cutf(rRik / params_d[s][0]);
-                        precal[3] = dcutf(rRik, params_d[s][0]);
-                        precal[4] = cutf(rRjk / params_d[s][0]);
-                        precal[5] = dcutf(rRjk, params_d[s][0]);
-
-                        symf[ii][s] += G4_noderiv(rRij, rRik, rRjk, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-                    }
-                    else if ((params_i[s][0] == 5) &&
-                           (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                            ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) {
-
-                        precal[0] = cutf(rRij / params_d[s][0]);
-                        precal[1] = dcutf(rRij, params_d[s][0]);
-                        precal[2] = cutf(rRik / params_d[s][0]);
-                        precal[3] = dcutf(rRik, params_d[s][0]);
-
-                        symf[ii][s] += G5_noderiv(rRij, rRik, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+                    vecik[0] = nei_list_d[k*4]     / rRik;
+                    vecik[1] = nei_list_d[k*4 + 1] / rRik;
+                    vecik[2] = nei_list_d[k*4 + 2] / rRik;
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    vecjk[0] = deljk[0] / rRjk;
+                    vecjk[1] = deljk[1] / rRjk;
+                    vecjk[2] = deljk[2] / rRjk;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the cutoff terms and the gaussians only depend on the cutoff and
+                    // eta of the symmetry functions, they are computed once per value
+                    cutoff_ijk = eta4_ijk = eta5_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = poly_cutf(rRij / cutoff_ijk, gamma);
+                                precal[1] = dpoly_cutf(rRij, cutoff_ijk, gamma);
+                                precal[2] = poly_cutf(rRik / cutoff_ijk, gamma);
+                                precal[3] = dpoly_cutf(rRik, cutoff_ijk, gamma);
+                                precal[4] = poly_cutf(rRjk / cutoff_ijk, gamma);
+                                precal[5] = dpoly_cutf(rRjk, cutoff_ijk, gamma);
+                            }
+                            if (elem_params_d[s][1] != eta4_ijk) {
+                                eta4_ijk = elem_params_d[s][1];
+                                precal[12] = exp(-eta4_ijk*precal[6]);
+                            }
+                            symf[ii][s] += G4(rRij, rRik, rRjk, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = poly_cutf(rRij / cutoff_ijk, gamma);
+                                precal[1] = dpoly_cutf(rRij, cutoff_ijk, gamma);
+                                precal[2] = poly_cutf(rRik / cutoff_ijk, gamma);
+                                precal[3] = dpoly_cutf(rRik, cutoff_ijk, gamma);
+                                precal[4] = poly_cutf(rRjk / cutoff_ijk, gamma);
+                                precal[5] = dpoly_cutf(rRjk, cutoff_ijk, gamma);
+                            }
+                            if (elem_params_d[s][1] != eta5_ijk) {
+                                eta5_ijk = elem_params_d[s][1];
+                                precal[13] = exp(-eta5_ijk*precal[11]);
+                            }
+                            symf[ii][s] += G5(rRij, rRik, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else continue;
                     }
-                    else continue;
                 }
             }
+
+            fp_prime.flush(thread_buffer, (long) ii * nsyms, threshold);
         }
 
         delete[] nei_list_d;
         delete[] nei_list_i;
     }
 
-    for (int i=0; i<natoms; i++) {
-        delete[] bin_i[i];
-    }
-    delete[] bin_i;
+    merge_thread_buffers(dsymf, thread_dsymf, cores, natoms);
+
     delete[] powtwo;
     return 0;
 }
 
 
-extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, int* pbc_bools,
+
+
+extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double** scale, int* pbc_bools,
                             int* atom_i, int natoms, int* cal_atoms, int cal_num,
-                            int** params_i, double** params_d, int nsyms,
-                            double** symf, double** dsymf, double gamma) {
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, double gamma, NeighborList* neighbor_list, int cores) {
     // cell: cell info of structure
     // cart: cartesian coordinates of atoms
     // scale: fractional coordinates of atoms
@@ -652,7 +709,12 @@ extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, i
     // params_d: double parameter for symmetry function
     //           [cutoff, param1, param2, param3]
     // natoms: # of atoms
-    // nsyms: # of symmetry functions
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
     // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
@@ -660,16 +722,11 @@ extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, i
     // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
     // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-    int total_bins, max_atoms_bin, bin_num, neigh_check_bins, nneigh;
-    int bin_range[3], nbins[3], cell_shift[3], max_bin[3], min_bin[3], pbc_bin[3];
-    //int bin_i[natoms][4];
-    double vol, tmp, cutoff, dradtmp, rRij, rRik, rRjk;
-    double plane_d[3], total_shift[3], precal[12], tmpd[9], dangtmp[3];
-    double vecij[3], vecik[3], vecjk[3], deljk[3];
-    double cross[3][3], reci[3][3];//, powtwo[nsyms];
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
     // Check for not implemented symfunc type.
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         bool implemented = false;
         for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
             if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
@@ -680,15 +737,10 @@ extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, i
         if (!implemented) return 1;
     }
 
-    int **bin_i = new int*[natoms];
-    for (int i=0; i<natoms; i++) {
-        bin_i[i] = new int[4];
-    }
-
-    double *powtwo = new double[nsyms];
+    double *powtwo = new double[nparams];
 
     cutoff = 0.0;
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         if (cutoff < params_d[s][0])
             cutoff = params_d[s][0];
 
@@ -699,257 +751,152 @@ extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, i
         powtwo[s] = pow(2, 1.-params_d[s][2]);
     }
 
-    total_bins = 1;
-
-    // calculate the distance between cell plane
-    cross[0][0] = cell[1][1]*cell[2][2] - cell[1][2]*cell[2][1];
-    cross[0][1] = cell[1][2]*cell[2][0] - cell[1][0]*cell[2][2];
-    cross[0][2] = cell[1][0]*cell[2][1] - cell[1][1]*cell[2][0];
-    cross[1][0] = cell[2][1]*cell[0][2] - cell[2][2]*cell[0][1];
-    cross[1][1] = cell[2][2]*cell[0][0] - cell[2][0]*cell[0][2];
-    cross[1][2] = cell[2][0]*cell[0][1] - cell[2][1]*cell[0][0];
-    cross[2][0] = cell[0][1]*cell[1][2] - cell[0][2]*cell[1][1];
-    cross[2][1] = cell[0][2]*cell[1][0] - cell[0][0]*cell[1][2];
-    cross[2][2] = cell[0][0]*cell[1][1] - cell[0][1]*cell[1][0];
-
-    vol = cross[0][0]*cell[0][0] + cross[0][1]*cell[0][1] + cross[0][2]*cell[0][2];
-
-    //reci is the inverse matrix
-    for (int i=0; i<3; ++i) {
-        tmp = 0;
-        for (int j=0; j<3; ++j) {
-            reci[i][j] = cross[i][j]/vol;
-            tmp += reci[i][j]*reci[i][j];
-        }
-        // sqrt(tmp): magnitude of the cross product divided by vol, which is the "(1/height)" in that direction
-        // note: the magnitude of the cross product is the area of the parallelogram
-        // thus, plane_d[i] is height in dimension i
-        plane_d[i] = 1/sqrt(tmp);
-        // nbins[i] is height/cutoff in dimension i (how many "cutoff" can a height in that dimension hold)
-        // if height > cutoff, nbins > 1, if height <= cutoff, nbins = 1
-        nbins[i] = ceil(plane_d[i]/cutoff);
-        total_bins *= nbins[i];
-    }
-
-    int *atoms_bin = new int[total_bins];
-    for (int i=0; i<total_bins; ++i)
-        atoms_bin[i] = 0;
-
-    // cut the cell into numerous bins (evenly according to nbins)
-    // assign the bin index to each atom (which bin does the atom belong to)
-    // note bin_i is an integer array, and
-    for (int i=0; i<natoms; ++i) {
-        for (int j=0; j<3; ++j) {
-            bin_i[i][j] = (int) (scale[i][j] * (double) nbins[j]);
-            // this is an integer!
-        }
-        bin_i[i][3] = bin_i[i][0] + nbins[0]*bin_i[i][1] + nbins[0]*nbins[1]*bin_i[i][2];
-        atoms_bin[bin_i[i][3]]++;
-    }
-
-    // atoms_bin: count of howmany atoms in that bin
-    max_atoms_bin = 0;
-    for (int i=0; i < total_bins; ++i) {
-        if (atoms_bin[i] > max_atoms_bin)
-            max_atoms_bin = atoms_bin[i];
-    }
-
-    delete[] atoms_bin;
-
-    // # of bins in each direction
-    neigh_check_bins = 1;
-    for (int i=0; i < 3; ++i) {
-        // plane_d[i] / nbins[i] = height[i] / nbins[i] = size of bin in i dimension
-        // cutoff * nbins[i] / plane_d[i] = cutoff / size of bin in i dimension = num bin needed in i dimension
-        bin_range[i] = ceil(cutoff * nbins[i] / plane_d[i]);
-        neigh_check_bins *= 2*bin_range[i];
-    }
-
-    //for (int i=0; i < natoms; ++i) {
-    for (int ii=0; ii < cal_num; ++ii) {
-        int i=cal_atoms[ii];
-        // calculate neighbor atoms
-        double* nei_list_d = new double[max_atoms_bin * 4 * neigh_check_bins];
-        int*    nei_list_i = new int[max_atoms_bin * 2 * neigh_check_bins];
-        nneigh = 0;
-
-        for (int j=0; j < 3; ++j) {
-            max_bin[j] = bin_i[i][j] + bin_range[j];
-            min_bin[j] = bin_i[i][j] - bin_range[j];
-        }
-
-        for (int dx=min_bin[0]; dx < max_bin[0]+1; ++dx) {
-            for (int dy=min_bin[1]; dy < max_bin[1]+1; ++dy) {
-                for (int dz=min_bin[2]; dz < max_bin[2]+1; ++dz) {
-                    pbc_bin[0] = (dx%nbins[0] + nbins[0]) % nbins[0];
-                    pbc_bin[1] = (dy%nbins[1] + nbins[1]) % nbins[1];
-                    pbc_bin[2] = (dz%nbins[2] + nbins[2]) % nbins[2];
-                    cell_shift[0] = (dx-pbc_bin[0]) / nbins[0];
-                    cell_shift[1] = (dy-pbc_bin[1]) / nbins[1];
-                    cell_shift[2] = (dz-pbc_bin[2]) / nbins[2];
-
-                    bin_num = pbc_bin[0] + nbins[0]*pbc_bin[1] + nbins[0]*nbins[1]*pbc_bin[2];
-
-                    for (int j=0; j < natoms; ++j) {
-                        // what does this mean?
-                        // only consider atom in the current bin (not other atoms in the cell that's not in this bin)
-                        if (bin_i[j][3] != bin_num)
-                            continue;
-
-                        // take care of pbc
-                        if (!pbc_bools[0] && cell_shift[0] != 0)
-                            continue;
-
-                        if (!pbc_bools[1] && cell_shift[1] != 0)
-                            continue;
-
-                        if (!pbc_bools[2] && cell_shift[2] != 0)
-                            continue;
-
-                        // skip if it's the same atom
-                        if (!(cell_shift[0] || cell_shift[1] || cell_shift[2]) && (i == j))
-                            continue;
-
-                        for (int a=0; a < 3; ++a) {
-                            total_shift[a] = cell_shift[0]*cell[0][a] + cell_shift[1]*cell[1][a] + cell_shift[2]*cell[2][a]
-                                             + cart[j][a] - cart[i][a];
-                        }
-
-                        tmp = sqrt(total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2]);
-
-                        if (tmp < cutoff) {
-                            for (int a=0; a < 3; ++a)
-                                nei_list_d[nneigh*4 + a] = total_shift[a];
-                            nei_list_d[nneigh*4 + 3] = tmp;
-                            nei_list_i[nneigh*2]    = atom_i[j];
-                            nei_list_i[nneigh*2 + 1] = j;
-                            nneigh++;
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread
+    if (cores < 1) cores = 1;
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ij, cutoff_ijk, eta4_ijk, eta5_ijk;
+        double precal[14], tmpd[9], dangtmp[3];
+        double vecij[3], vecik[3], vecjk[3], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+                vecij[0] =  nei_list_d[j*4]     / rRij;
+                vecij[1] =  nei_list_d[j*4 + 1] / rRij;
+                vecij[2] =  nei_list_d[j*4 + 2] / rRij;
+
+                // the cutoff terms are computed once per cutoff
+                cutoff_ij = -1.0;
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        if (elem_params_d[s][0] != cutoff_ij) {
+                            cutoff_ij = elem_params_d[s][0];
+                            precal[0] = poly_cutf(rRij / cutoff_ij, gamma);
+                            precal[1] = dpoly_cutf(rRij, cutoff_ij, gamma);
                         }
+                        symf[ii][s] += G2_noderiv(rRij, precal, elem_params_d[s], dradtmp); // FIXME: index
+                        tmpd[0] = dradtmp*vecij[0];
+                        tmpd[1] = dradtmp*vecij[1];
+                        tmpd[2] = dradtmp*vecij[2];
                     }
+                    else continue;
                 }
-            }
-        }
-
-        for (int j=0; j < nneigh; ++j) {
-            // calculate radial symmetry function
-            rRij = nei_list_d[j*4 + 3];
-            vecij[0] =  nei_list_d[j*4]     / rRij;
-            vecij[1] =  nei_list_d[j*4 + 1] / rRij;
-            vecij[2] =  nei_list_d[j*4 + 2] / rRij;
-
-            for (int s=0; s < nsyms; ++s) {
-                if ((params_i[s][0] == 2) && (params_i[s][1] == nei_list_i[j*2])) { // FIXME:
-                    precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                    precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                    symf[ii][s] += G2(rRij, precal, params_d[s], dradtmp); // FIXME: index
-                    tmpd[0] = dradtmp*vecij[0];
-                    tmpd[1] = dradtmp*vecij[1];
-                    tmpd[2] = dradtmp*vecij[2];
-
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0];
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1];
-                    dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2];
-
-                    dsymf[ii*nsyms + s][i*3]     -= tmpd[0];
-                    dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1];
-                    dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2];
-                }
-                else continue;
-            }
 
-            for (int k=j+1; k < nneigh; ++k) {
-                // calculate angular symmetry function
-                rRik = nei_list_d[k*4 + 3];
-                vecik[0] = nei_list_d[k*4]     / rRik;
-                vecik[1] = nei_list_d[k*4 + 1] / rRik;
-                vecik[2] = nei_list_d[k*4 + 2] / rRik;
-
-                deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
-                deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
-                deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
-                rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
-
-                if (rRjk < 0.0001) continue;
-
-                vecjk[0] = deljk[0] / rRjk;
-                vecjk[1] = deljk[1] / rRjk;
-                vecjk[2] = deljk[2] / rRjk;
-
-                precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
-                precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
-                precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
-                precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
-                precal[10] = rRjk/rRij/rRik;
-                precal[11] = rRij*rRij+rRik*rRik;
-
-                for (int s=0; s < nsyms; ++s) {
-                    if ((params_i[s][0] == 4) &&
-                       (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                        ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
-
-                        precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                        precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                        precal[2] = poly_cutf(rRik / params_d[s][0], gamma);
-                        precal[3] = dpoly_cutf(rRik, params_d[s][0], gamma);
-                        precal[4] = poly_cutf(rRjk / params_d[s][0], gamma);
-                        precal[5] = dpoly_cutf(rRjk, params_d[s][0], gamma);
-                        symf[ii][s] += G4(rRij, rRik, rRjk, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0] - tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1] - tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2] - tmpd[8];
-
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3]     += tmpd[3] + tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 1] += tmpd[4] + tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 2] += tmpd[5] + tmpd[8];
-
-                        dsymf[ii*nsyms + s][i*3]     -= tmpd[0] + tmpd[3];
-                        dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1] + tmpd[4];
-                        dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2] + tmpd[5];
-                    }
-                    else if ((params_i[s][0] == 5) &&
-                           (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                            ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) {
-
-                        precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                        precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                        precal[2] = poly_cutf(rRik / params_d[s][0], gamma);
-                        precal[3] = dpoly_cutf(rRik, params_d[s][0], gamma);
-                        symf[ii][s] += G5(rRij, rRik, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3]     += tmpd[0] - tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 1] += tmpd[1] - tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[j*2 + 1]*3 + 2] += tmpd[2] - tmpd[8];
-
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3]     += tmpd[3] + tmpd[6];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 1] += tmpd[4] + tmpd[7];
-                        dsymf[ii*nsyms + s][nei_list_i[k*2 + 1]*3 + 2] += tmpd[5] + tmpd[8];
-
-                        dsymf[ii*nsyms + s][i*3]     -= tmpd[0] + tmpd[3];
-                        dsymf[ii*nsyms + s][i*3 + 1] -= tmpd[1] + tmpd[4];
-                        dsymf[ii*nsyms + s][i*3 + 2] -= tmpd[2] + tmpd[5];
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+                    vecik[0] = nei_list_d[k*4]     / rRik;
+                    vecik[1] = nei_list_d[k*4 + 1] / rRik;
+                    vecik[2] = nei_list_d[k*4 + 2] / rRik;
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    vecjk[0] = deljk[0] / rRjk;
+                    vecjk[1] = deljk[1] / rRjk;
+                    vecjk[2] = deljk[2] / rRjk;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the cutoff terms and the gaussians only depend on the cutoff and
+                    // eta of the symmetry functions, they are computed once per value
+                    cutoff_ijk = eta4_ijk = eta5_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = poly_cutf(rRij / cutoff_ijk, gamma);
+                                precal[1] = dpoly_cutf(rRij, cutoff_ijk, gamma);
+                                precal[2] = poly_cutf(rRik / cutoff_ijk, gamma);
+                                precal[3] = dpoly_cutf(rRik, cutoff_ijk, gamma);
+                                precal[4] = poly_cutf(rRjk / cutoff_ijk, gamma);
+                                precal[5] = dpoly_cutf(rRjk, cutoff_ijk, gamma);
+                            }
+                            if (elem_params_d[s][1] != eta4_ijk) {
+                                eta4_ijk = elem_params_d[s][1];
+                                precal[12] = exp(-eta4_ijk*precal[6]);
+                            }
+                            symf[ii][s] += G4_noderiv(rRij, rRik, rRjk, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                precal[0] = poly_cutf(rRij / cutoff_ijk, gamma);
+                                precal[1] = dpoly_cutf(rRij, cutoff_ijk, gamma);
+                                precal[2] = poly_cutf(rRik / cutoff_ijk, gamma);
+                                precal[3] = dpoly_cutf(rRik, cutoff_ijk, gamma);
+                                precal[4] = poly_cutf(rRjk / cutoff_ijk, gamma);
+                                precal[5] = dpoly_cutf(rRjk, cutoff_ijk, gamma);
+                            }
+                            if (elem_params_d[s][1] != eta5_ijk) {
+                                eta5_ijk = elem_params_d[s][1];
+                                precal[13] = exp(-eta5_ijk*precal[11]);
+                            }
+                            symf[ii][s] += G5_noderiv(rRij, rRik, elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+                        }
+                        else continue;
                     }
-                    else continue;
                 }
             }
         }
@@ -958,21 +905,16 @@ extern "C" int calculate_sf_poly(double** cell, double** cart, double** scale, i
         delete[] nei_list_i;
     }
 
-    for (int i=0; i<natoms; i++) {
-        delete[] bin_i[i];
-    }
-    delete[] bin_i;
     delete[] powtwo;
     return 0;
 }
 
-
-
-
-extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double** scale, int* pbc_bools,
+extern "C" int calculate_sf_tab(double** cell, double** cart, double** scale, int* pbc_bools,
                             int* atom_i, int natoms, int* cal_atoms, int cal_num,
-                            int** params_i, double** params_d, int nsyms,
-                            double** symf, double gamma) {
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, FpPrimeBuffer* dsymf, double threshold,
+                            double** table, int nintervals, NeighborList* neighbor_list, int cores) {
     // cell: cell info of structure
     // cart: cartesian coordinates of atoms
     // scale: fractional coordinates of atoms
@@ -982,24 +924,28 @@ extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double**
     // params_d: double parameter for symmetry function
     //           [cutoff, param1, param2, param3]
     // natoms: # of atoms
-    // nsyms: # of symmetry functions
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
     // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
+    // table: radial part (gaussian times cutoff function) of each symmetry function
+    //        and its derivative, tabulated on nintervals + 1 equally spaced distances
+    //        from 0 to the cutoff ([# of params, 2 * (nintervals + 1)], see tabulated)
+
     // dsymf: derivative of symmetry function vector
     // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
     // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-    int total_bins, max_atoms_bin, bin_num, neigh_check_bins, nneigh;
-    int bin_range[3], nbins[3], cell_shift[3], max_bin[3], min_bin[3], pbc_bin[3];
-    //int bin_i[natoms][4];
-    double vol, tmp, cutoff, dradtmp, rRij, rRik, rRjk;
-    double plane_d[3], total_shift[3], precal[12], tmpd[9], dangtmp[3];
-    double vecij[3], vecik[3], vecjk[3], deljk[3];
-    double cross[3][3], reci[3][3];//, powtwo[nsyms];
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
     // Check for not implemented symfunc type.
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         bool implemented = false;
         for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
             if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
@@ -1010,15 +956,11 @@ extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double**
         if (!implemented) return 1;
     }
 
-    int **bin_i = new int*[natoms];
-    for (int i=0; i<natoms; i++) {
-        bin_i[i] = new int[4];
-    }
-
-    double *powtwo = new double[nsyms];
+    double *powtwo = new double[nparams];
+    double *inv_spacing = new double[nparams];
 
     cutoff = 0.0;
-    for (int s=0; s < nsyms; ++s) {
+    for (int s=0; s < nparams; ++s) {
         if (cutoff < params_d[s][0])
             cutoff = params_d[s][0];
 
@@ -1027,226 +969,329 @@ extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double**
             return 2;
 
         powtwo[s] = pow(2, 1.-params_d[s][2]);
+        inv_spacing[s] = nintervals / params_d[s][0];
     }
 
-    total_bins = 1;
-
-    // calculate the distance between cell plane
-    cross[0][0] = cell[1][1]*cell[2][2] - cell[1][2]*cell[2][1];
-    cross[0][1] = cell[1][2]*cell[2][0] - cell[1][0]*cell[2][2];
-    cross[0][2] = cell[1][0]*cell[2][1] - cell[1][1]*cell[2][0];
-    cross[1][0] = cell[2][1]*cell[0][2] - cell[2][2]*cell[0][1];
-    cross[1][1] = cell[2][2]*cell[0][0] - cell[2][0]*cell[0][2];
-    cross[1][2] = cell[2][0]*cell[0][1] - cell[2][1]*cell[0][0];
-    cross[2][0] = cell[0][1]*cell[1][2] - cell[0][2]*cell[1][1];
-    cross[2][1] = cell[0][2]*cell[1][0] - cell[0][0]*cell[1][2];
-    cross[2][2] = cell[0][0]*cell[1][1] - cell[0][1]*cell[1][0];
-
-    vol = cross[0][0]*cell[0][0] + cross[0][1]*cell[0][1] + cross[0][2]*cell[0][2];
-
-    //reci is the inverse matrix
-    for (int i=0; i<3; ++i) {
-        tmp = 0;
-        for (int j=0; j<3; ++j) {
-            reci[i][j] = cross[i][j]/vol;
-            tmp += reci[i][j]*reci[i][j];
-        }
-        // sqrt(tmp): magnitude of the cross product divided by vol, which is the "(1/height)" in that direction
-        // note: the magnitude of the cross product is the area of the parallelogram
-        // thus, plane_d[i] is height in dimension i
-        plane_d[i] = 1/sqrt(tmp);
-        // nbins[i] is height/cutoff in dimension i (how many "cutoff" can a height in that dimension hold)
-        // if height > cutoff, nbins > 1, if height <= cutoff, nbins = 1
-        nbins[i] = ceil(plane_d[i]/cutoff);
-        total_bins *= nbins[i];
-    }
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread, and the
+    // derivatives of each thread are merged in order, as in a serial run
+    if (cores < 1) cores = 1;
+    FpPrimeBuffer* thread_dsymf = new_thread_buffers(dsymf, cores, natoms);
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ijk, eta_ijk;
+        double precal[12], tmpd[9], dangtmp[3];
+        double vecij[3], vecik[3], vecjk[3], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+        FpPrimeAccumulator fp_prime(natoms, max_nneigh, nsyms, dsymf->virial != NULL);
+        FpPrimeBuffer* thread_buffer = &thread_dsymf[get_thread_num()];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            double* elem_inv_spacing = inv_spacing + param_offsets[order];
+            double** elem_table = table + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            fp_prime.set_neighbors(i, nneigh, nei_list_i, nei_list_d);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+                vecij[0] =  nei_list_d[j*4]     / rRij;
+                vecij[1] =  nei_list_d[j*4 + 1] / rRij;
+                vecij[2] =  nei_list_d[j*4 + 2] / rRij;
+
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        symf[ii][s] += tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, dradtmp);
+                        tmpd[0] = dradtmp*vecij[0];
+                        tmpd[1] = dradtmp*vecij[1];
+                        tmpd[2] = dradtmp*vecij[2];
+
+                        fp_prime.add(s, j, tmpd[0], tmpd[1], tmpd[2]);
+                    }
+                    else continue;
+                }
+
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+                    vecik[0] = nei_list_d[k*4]     / rRik;
+                    vecik[1] = nei_list_d[k*4 + 1] / rRik;
+                    vecik[2] = nei_list_d[k*4 + 2] / rRik;
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    vecjk[0] = deljk[0] / rRjk;
+                    vecjk[1] = deljk[1] / rRjk;
+                    vecjk[2] = deljk[2] / rRjk;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the radial parts only depend on the cutoff and eta of the
+                    // symmetry functions, they are looked up once per value
+                    cutoff_ijk = eta_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk || elem_params_d[s][1] != eta_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                eta_ijk = elem_params_d[s][1];
+                                precal[0] = tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, precal[1]);
+                                precal[2] = tabulated(elem_table[s], rRik, elem_inv_spacing[s], nintervals, precal[3]);
+                                precal[4] = tabulated(elem_table[s], rRjk, elem_inv_spacing[s], nintervals, precal[5]);
+                            }
+
+                            symf[ii][s] += G4_tab(elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk || elem_params_d[s][1] != eta_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                eta_ijk = elem_params_d[s][1];
+                                precal[0] = tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, precal[1]);
+                                precal[2] = tabulated(elem_table[s], rRik, elem_inv_spacing[s], nintervals, precal[3]);
+                                precal[4] = tabulated(elem_table[s], rRjk, elem_inv_spacing[s], nintervals, precal[5]);
+                            }
+
+                            symf[ii][s] += G5_tab(elem_powtwo[s], precal, elem_params_d[s], dangtmp);
+
+                            tmpd[0] = dangtmp[0]*vecij[0];
+                            tmpd[1] = dangtmp[0]*vecij[1];
+                            tmpd[2] = dangtmp[0]*vecij[2];
+                            tmpd[3] = dangtmp[1]*vecik[0];
+                            tmpd[4] = dangtmp[1]*vecik[1];
+                            tmpd[5] = dangtmp[1]*vecik[2];
+                            tmpd[6] = dangtmp[2]*vecjk[0];
+                            tmpd[7] = dangtmp[2]*vecjk[1];
+                            tmpd[8] = dangtmp[2]*vecjk[2];
+
+                            fp_prime.add(s, j, tmpd[0] - tmpd[6], tmpd[1] - tmpd[7], tmpd[2] - tmpd[8]);
+                            fp_prime.add(s, k, tmpd[3] + tmpd[6], tmpd[4] + tmpd[7], tmpd[5] + tmpd[8]);
+                        }
+                        else continue;
+                    }
+                }
+            }
 
-    int *atoms_bin = new int[total_bins];
-    for (int i=0; i<total_bins; ++i)
-        atoms_bin[i] = 0;
-
-    // cut the cell into numerous bins (evenly according to nbins)
-    // assign the bin index to each atom (which bin does the atom belong to)
-    // note bin_i is an integer array, and
-    for (int i=0; i<natoms; ++i) {
-        for (int j=0; j<3; ++j) {
-            bin_i[i][j] = (int) (scale[i][j] * (double) nbins[j]);
-            // this is an integer!
+            fp_prime.flush(thread_buffer, (long) ii * nsyms, threshold);
         }
-        bin_i[i][3] = bin_i[i][0] + nbins[0]*bin_i[i][1] + nbins[0]*nbins[1]*bin_i[i][2];
-        atoms_bin[bin_i[i][3]]++;
-    }
 
-    // atoms_bin: count of howmany atoms in that bin
-    max_atoms_bin = 0;
-    for (int i=0; i < total_bins; ++i) {
-        if (atoms_bin[i] > max_atoms_bin)
-            max_atoms_bin = atoms_bin[i];
+        delete[] nei_list_d;
+        delete[] nei_list_i;
     }
 
-    delete[] atoms_bin;
+    merge_thread_buffers(dsymf, thread_dsymf, cores, natoms);
 
-    // # of bins in each direction
-    neigh_check_bins = 1;
-    for (int i=0; i < 3; ++i) {
-        // plane_d[i] / nbins[i] = height[i] / nbins[i] = size of bin in i dimension
-        // cutoff * nbins[i] / plane_d[i] = cutoff / size of bin in i dimension = num bin needed in i dimension
-        bin_range[i] = ceil(cutoff * nbins[i] / plane_d[i]);
-        neigh_check_bins *= 2*bin_range[i];
-    }
+    delete[] powtwo;
+    delete[] inv_spacing;
+    return 0;
+}
 
-    //for (int i=0; i < natoms; ++i) {
-    for (int ii=0; ii < cal_num; ++ii) {
-        int i=cal_atoms[ii];
-        // calculate neighbor atoms
-        double* nei_list_d = new double[max_atoms_bin * 4 * neigh_check_bins];
-        int*    nei_list_i = new int[max_atoms_bin * 2 * neigh_check_bins];
-        nneigh = 0;
-
-        for (int j=0; j < 3; ++j) {
-            max_bin[j] = bin_i[i][j] + bin_range[j];
-            min_bin[j] = bin_i[i][j] - bin_range[j];
-        }
+extern "C" int calculate_sf_tab_noderiv(double** cell, double** cart, double** scale, int* pbc_bools,
+                            int* atom_i, int natoms, int* cal_atoms, int cal_num,
+                            int** params_i, double** params_d, int* element_index_to_order,
+                            int* param_offsets, int nelements, int nsyms,
+                            double** symf, double** table, int nintervals, NeighborList* neighbor_list, int cores) {
+    // cell: cell info of structure
+    // cart: cartesian coordinates of atoms
+    // scale: fractional coordinates of atoms
+    // atom_i: atom type index (start with 1)
+    // params_i: integer parameter for symmetry function
+    //           [symmetry function type, 1st neighbor atom type, 2nd neighbor atom type]
+    // params_d: double parameter for symmetry function
+    //           [cutoff, param1, param2, param3]
+    // natoms: # of atoms
+    // params_i, params_d: symmetry functions of all the elements, the ones of the
+    //                     element of order e are the rows param_offsets[e] to param_offsets[e+1]
+    // element_index_to_order: order of each atom type, -1 when the atom type has no
+    //                         symmetry functions (such center atoms are skipped)
+    // nelements: # of elements in the parameter tables
+    // nsyms: # of symmetry functions per center atom (row width of symf)
 
-        for (int dx=min_bin[0]; dx < max_bin[0]+1; ++dx) {
-            for (int dy=min_bin[1]; dy < max_bin[1]+1; ++dy) {
-                for (int dz=min_bin[2]; dz < max_bin[2]+1; ++dz) {
-                    pbc_bin[0] = (dx%nbins[0] + nbins[0]) % nbins[0];
-                    pbc_bin[1] = (dy%nbins[1] + nbins[1]) % nbins[1];
-                    pbc_bin[2] = (dz%nbins[2] + nbins[2]) % nbins[2];
-                    cell_shift[0] = (dx-pbc_bin[0]) / nbins[0];
-                    cell_shift[1] = (dy-pbc_bin[1]) / nbins[1];
-                    cell_shift[2] = (dz-pbc_bin[2]) / nbins[2];
+    // symf: symmetry function vector ([# of atoms, # of symfuncs])
 
-                    bin_num = pbc_bin[0] + nbins[0]*pbc_bin[1] + nbins[0]*nbins[1]*pbc_bin[2];
+    // table: radial part (gaussian times cutoff function) of each symmetry function
+    //        and its derivative, tabulated on nintervals + 1 equally spaced distances
+    //        from 0 to the cutoff ([# of params, 2 * (nintervals + 1)], see tabulated)
 
-                    for (int j=0; j < natoms; ++j) {
-                        // what does this mean?
-                        if (bin_i[j][3] != bin_num)
-                            continue;
+    // dsymf: derivative of symmetry function vector
+    // originally, dsymf is 4D array (dimension: [# of atoms, # of symfuncs, # of atoms, 3])
+    // in this function, we use 2D array ([# of atoms *  # of symfuncs, # of atoms * 3])
 
-                        // take care of pbc
-                        if (!pbc_bools[0] && cell_shift[0] != 0)
-                            continue;
+    double cutoff;
+    int nparams = param_offsets[nelements];
 
-                        if (!pbc_bools[1] && cell_shift[1] != 0)
-                            continue;
+    // Check for not implemented symfunc type.
+    for (int s=0; s < nparams; ++s) {
+        bool implemented = false;
+        for (int i=0; i < sizeof(IMPLEMENTED_TYPE) / sizeof(IMPLEMENTED_TYPE[0]); i++) {
+            if (params_i[s][0] == IMPLEMENTED_TYPE[i]) {
+                implemented = true;
+                break;
+            }
+        }
+        if (!implemented) return 1;
+    }
 
-                        if (!pbc_bools[2] && cell_shift[2] != 0)
-                            continue;
+    double *powtwo = new double[nparams];
+    double *inv_spacing = new double[nparams];
 
-                        // skip if it's the same atom
-                        if (!(cell_shift[0] || cell_shift[1] || cell_shift[2]) && (i == j))
-                            continue;
+    cutoff = 0.0;
+    for (int s=0; s < nparams; ++s) {
+        if (cutoff < params_d[s][0])
+            cutoff = params_d[s][0];
 
-                        for (int a=0; a < 3; ++a) {
-                            total_shift[a] = cell_shift[0]*cell[0][a] + cell_shift[1]*cell[1][a] + cell_shift[2]*cell[2][a]
-                                             + cart[j][a] - cart[i][a];
-                        }
+        if ((params_i[s][0] == 4 || params_i[s][0] == 5) &&
+             params_d[s][2] < 1.0)
+            return 2;
 
-                        tmp = sqrt(total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2]);
+        powtwo[s] = pow(2, 1.-params_d[s][2]);
+        inv_spacing[s] = nintervals / params_d[s][0];
+    }
 
-                        if (tmp < cutoff) {
-                            for (int a=0; a < 3; ++a)
-                                nei_list_d[nneigh*4 + a] = total_shift[a];
-                            nei_list_d[nneigh*4 + 3] = tmp;
-                            nei_list_i[nneigh*2]    = atom_i[j];
-                            nei_list_i[nneigh*2 + 1] = j;
-                            nneigh++;
-                        }
+    // neighbor search, from the Verlet list when one is given
+    NeighborSearch neighbor_search(neighbor_list, cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    int max_nneigh = neighbor_search.max_neighbors();
+
+    // the center atoms are split into contiguous blocks, one per thread
+    if (cores < 1) cores = 1;
+
+    #pragma omp parallel num_threads(cores)
+    {
+        int nneigh;
+        double dradtmp, rRij, rRik, rRjk;
+        double cutoff_ijk, eta_ijk;
+        double precal[12], deljk[3];
+        double* nei_list_d = new double[max_nneigh * 4];
+        int*    nei_list_i = new int[max_nneigh * 2];
+
+        #pragma omp for schedule(static)
+        for (int ii=0; ii < cal_num; ++ii) {
+            int i=cal_atoms[ii];
+            // symmetry functions of the element of the center atom
+            int order = element_index_to_order[atom_i[i]];
+            if (order < 0) continue;
+            int** elem_params_i = params_i + param_offsets[order];
+            double** elem_params_d = params_d + param_offsets[order];
+            double* elem_powtwo = powtwo + param_offsets[order];
+            double* elem_inv_spacing = inv_spacing + param_offsets[order];
+            double** elem_table = table + param_offsets[order];
+            int elem_nsyms = param_offsets[order+1] - param_offsets[order];
+            // calculate neighbor atoms
+            nneigh = neighbor_search.find_neighbors(i, false, nei_list_d, nei_list_i);
+            for (int j=0; j < nneigh; ++j)
+                nei_list_d[j*4 + 3] = sqrt(nei_list_d[j*4 + 3]);
+
+            for (int j=0; j < nneigh; ++j) {
+                // calculate radial symmetry function
+                rRij = nei_list_d[j*4 + 3];
+
+                for (int s=0; s < elem_nsyms; ++s) {
+                    if ((elem_params_i[s][0] == 2) && (elem_params_i[s][1] == nei_list_i[j*2])) { // FIXME:
+                        symf[ii][s] += tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, dradtmp);
                     }
+                    else continue;
                 }
-            }
-        }
-
-        for (int j=0; j < nneigh; ++j) {
-            // calculate radial symmetry function
-            rRij = nei_list_d[j*4 + 3];
-            vecij[0] =  nei_list_d[j*4]     / rRij;
-            vecij[1] =  nei_list_d[j*4 + 1] / rRij;
-            vecij[2] =  nei_list_d[j*4 + 2] / rRij;
-
-            for (int s=0; s < nsyms; ++s) {
-                if ((params_i[s][0] == 2) && (params_i[s][1] == nei_list_i[j*2])) { // FIXME:
-                    precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                    precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                    symf[ii][s] += G2_noderiv(rRij, precal, params_d[s], dradtmp); // FIXME: index
-                    tmpd[0] = dradtmp*vecij[0];
-                    tmpd[1] = dradtmp*vecij[1];
-                    tmpd[2] = dradtmp*vecij[2];
-                }
-                else continue;
-            }
 
-            for (int k=j+1; k < nneigh; ++k) {
-                // calculate angular symmetry function
-                rRik = nei_list_d[k*4 + 3];
-                vecik[0] = nei_list_d[k*4]     / rRik;
-                vecik[1] = nei_list_d[k*4 + 1] / rRik;
-                vecik[2] = nei_list_d[k*4 + 2] / rRik;
-
-                deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
-                deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
-                deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
-                rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
-
-                if (rRjk < 0.0001) continue;
-
-                vecjk[0] = deljk[0] / rRjk;
-                vecjk[1] = deljk[1] / rRjk;
-                vecjk[2] = deljk[2] / rRjk;
-
-                precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
-                precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
-                precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
-                precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
-                precal[10] = rRjk/rRij/rRik;
-                precal[11] = rRij*rRij+rRik*rRik;
-
-                for (int s=0; s < nsyms; ++s) {
-                    if ((params_i[s][0] == 4) &&
-                       (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                        ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
-
-                        precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                        precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                        precal[2] = poly_cutf(rRik / params_d[s][0], gamma);
-                        precal[3] = dpoly_cutf(rRik, params_d[s][0], gamma);
-                        precal[4] = poly_cutf(rRjk / params_d[s][0], gamma);
-                        precal[5] = dpoly_cutf(rRjk, params_d[s][0], gamma);
-                        symf[ii][s] += G4_noderiv(rRij, rRik, rRjk, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
-                    }
-                    else if ((params_i[s][0] == 5) &&
-                           (((params_i[s][1] == nei_list_i[j*2]) && (params_i[s][2] == nei_list_i[k*2])) ||
-                            ((params_i[s][1] == nei_list_i[k*2]) && (params_i[s][2] == nei_list_i[j*2]))) ) {
-
-                        precal[0] = poly_cutf(rRij / params_d[s][0], gamma);
-                        precal[1] = dpoly_cutf(rRij, params_d[s][0], gamma);
-                        precal[2] = poly_cutf(rRik / params_d[s][0], gamma);
-                        precal[3] = dpoly_cutf(rRik, params_d[s][0], gamma);
-                        symf[ii][s] += G5_noderiv(rRij, rRik, powtwo[s], precal, params_d[s], dangtmp);
-
-                        tmpd[0] = dangtmp[0]*vecij[0];
-                        tmpd[1] = dangtmp[0]*vecij[1];
-                        tmpd[2] = dangtmp[0]*vecij[2];
-                        tmpd[3] = dangtmp[1]*vecik[0];
-                        tmpd[4] = dangtmp[1]*vecik[1];
-                        tmpd[5] = dangtmp[1]*vecik[2];
-                        tmpd[6] = dangtmp[2]*vecjk[0];
-                        tmpd[7] = dangtmp[2]*vecjk[1];
-                        tmpd[8] = dangtmp[2]*vecjk[2];
+                for (int k=j+1; k < nneigh; ++k) {
+                    // calculate angular symmetry function
+                    rRik = nei_list_d[k*4 + 3];
+
+                    deljk[0] = nei_list_d[k*4]     - nei_list_d[j*4];
+                    deljk[1] = nei_list_d[k*4 + 1] - nei_list_d[j*4 + 1];
+                    deljk[2] = nei_list_d[k*4 + 2] - nei_list_d[j*4 + 2];
+                    rRjk = sqrt(deljk[0]*deljk[0] + deljk[1]*deljk[1] + deljk[2]*deljk[2]);
+
+                    if (rRjk < 0.0001) continue;
+
+                    precal[6]  = rRij*rRij+rRik*rRik+rRjk*rRjk;
+                    precal[7]  = (rRij*rRij + rRik*rRik - rRjk*rRjk)/2/rRij/rRik;
+                    precal[8]  = 0.5*(1/rRik + 1/rRij/rRij*(rRjk*rRjk/rRik - rRik));
+                    precal[9]  = 0.5*(1/rRij + 1/rRik/rRik*(rRjk*rRjk/rRij - rRij));
+                    precal[10] = rRjk/rRij/rRik;
+                    precal[11] = rRij*rRij+rRik*rRik;
+
+                    // the radial parts only depend on the cutoff and eta of the
+                    // symmetry functions, they are looked up once per value
+                    cutoff_ijk = eta_ijk = -1.0;
+
+                    for (int s=0; s < elem_nsyms; ++s) {
+                        if ((elem_params_i[s][0] == 4) &&
+                           (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                            ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) { // FIXME:
+
+                            if (elem_params_d[s][0] != cutoff_ijk || elem_params_d[s][1] != eta_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                eta_ijk = elem_params_d[s][1];
+                                precal[0] = tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, precal[1]);
+                                precal[2] = tabulated(elem_table[s], rRik, elem_inv_spacing[s], nintervals, precal[3]);
+                                precal[4] = tabulated(elem_table[s], rRjk, elem_inv_spacing[s], nintervals, precal[5]);
+                            }
+
+                            symf[ii][s] += G4_tab_noderiv(elem_powtwo[s], precal, elem_params_d[s]);
+                        }
+                        else if ((elem_params_i[s][0] == 5) &&
+                               (((elem_params_i[s][1] == nei_list_i[j*2]) && (elem_params_i[s][2] == nei_list_i[k*2])) ||
+                                ((elem_params_i[s][1] == nei_list_i[k*2]) && (elem_params_i[s][2] == nei_list_i[j*2]))) ) {
+
+                            if (elem_params_d[s][0] != cutoff_ijk || elem_params_d[s][1] != eta_ijk) {
+                                cutoff_ijk = elem_params_d[s][0];
+                                eta_ijk = elem_params_d[s][1];
+                                precal[0] = tabulated(elem_table[s], rRij, elem_inv_spacing[s], nintervals, precal[1]);
+                                precal[2] = tabulated(elem_table[s], rRik, elem_inv_spacing[s], nintervals, precal[3]);
+                                precal[4] = tabulated(elem_table[s], rRjk, elem_inv_spacing[s], nintervals, precal[5]);
+                            }
+
+                            symf[ii][s] += G5_tab_noderiv(elem_powtwo[s], precal, elem_params_d[s]);
+                        }
+                        else continue;
                     }
-                    else continue;
                 }
             }
         }
@@ -1255,12 +1300,110 @@ extern "C" int calculate_sf_poly_noderiv(double** cell, double** cart, double**
         delete[] nei_list_i;
     }
 
-    for (int i=0; i<natoms; i++) {
-        delete[] bin_i[i];
-    }
-    delete[] bin_i;
     delete[] powtwo;
+    delete[] inv_spacing;
     return 0;
 }
 
+extern "C" int calculate_sf_batch(double* cell_data, double* cart_data, double* scale_data, int* pbc_bools,
+                            int* atom_i, int nimages, int* atom_offsets, int* cal_atoms, int* cal_offsets,
+                            int* params_i_data, int params_i_stride, double* params_d_data, int params_d_stride,
+                            int* element_index_to_order, int* param_offsets, int nelements, int nsyms,
+                            int polynomial, double* symf_data, FpPrimeBuffer* dsymf, double threshold, double gamma,
+                            double* table_data, int table_stride, NeighborList** neighbor_lists, int cores) {
+    // batched version of the kernels above for a list of images. the 2D arrays are
+    // passed as flat C contiguous buffers and viewed by rows here
+    // cell: cell vectors of the images ([# of images * 3, 3])
+    // pbc_bools: periodicity of the images ([# of images * 3])
+    // cart, scale, atom_i: concatenated over the images ([# of atoms, 3] for cart and scale),
+    //                      image k holds the atoms atom_offsets[k] to atom_offsets[k+1]
+    // cal_atoms: center atoms of the images (indices within each image),
+    //            image k holds the center atoms cal_offsets[k] to cal_offsets[k+1]
+    // params_i, params_d, element_index_to_order, param_offsets, nelements:
+    //            symmetry functions of all the elements, see calculate_sf_cos
+    //            ([param_offsets[nelements], params_i_stride or params_d_stride])
+    // symf: fingerprints of all the center atoms ([# of center atoms, nsyms])
+    // dsymf: one derivative buffer per image, rows and columns are indexed within
+    //        the image (or contracting into the forces of the image, see fp_prime.h).
+    //        NULL when the derivatives are not needed
+    // table: tabulated radial parts of the symmetry functions (see calculate_sf_tab), the
+    //        cutoff function is then taken from the table. NULL to compute them exactly
+    // neighbor_lists: Verlet neighbor list of each image (or NULL entries), NULL when
+    //                 the neighbors are searched from scratch
+    // the images are split over the threads, a single image is split over its center atoms
+
+    RowView<double> cell_rows(cell_data, nimages * 3, 3);
+    RowView<double> cart_rows(cart_data, atom_offsets[nimages], 3);
+    RowView<double> scale_rows(scale_data, atom_offsets[nimages], 3);
+    RowView<int> params_i_rows(params_i_data, param_offsets[nelements], params_i_stride);
+    RowView<double> params_d_rows(params_d_data, param_offsets[nelements], params_d_stride);
+    RowView<double> symf_rows(symf_data, cal_offsets[nimages], nsyms);
+    double **cell = cell_rows.ptr(), **cart = cart_rows.ptr(), **scale = scale_rows.ptr();
+    int** params_i = params_i_rows.ptr();
+    double** params_d = params_d_rows.ptr();
+    double** symf = symf_rows.ptr();
+    RowView<double> table_rows(table_data, table_data == NULL ? 0 : param_offsets[nelements], table_stride);
+    double** table = table_rows.ptr();
+    int nintervals = table_stride / 2 - 1;
+
+    if (cores < 1) cores = 1;
+    int image_cores = nimages > 1 ? 1 : cores;
+    int error = 0;
+
+    #pragma omp parallel for schedule(dynamic) num_threads(cores) if(nimages > 1) reduction(max:error)
+    for (int k=0; k < nimages; ++k) {
+        int a = atom_offsets[k], c = cal_offsets[k];
+        int natoms = atom_offsets[k+1] - a, cal_num = cal_offsets[k+1] - c;
+        if (cal_num == 0) continue;
+
+        NeighborList* image_neighbor_list = neighbor_lists == NULL ? NULL : neighbor_lists[k];
+        int image_error;
+        if (dsymf == NULL && table_data != NULL)
+            image_error = calculate_sf_tab_noderiv(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, table, nintervals, image_neighbor_list, image_cores);
+        else if (table_data != NULL)
+            image_error = calculate_sf_tab(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, &dsymf[k], threshold, table, nintervals, image_neighbor_list, image_cores);
+        else if (dsymf == NULL && polynomial)
+            image_error = calculate_sf_poly_noderiv(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, gamma, image_neighbor_list, image_cores);
+        else if (dsymf == NULL)
+            image_error = calculate_sf_cos_noderiv(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, image_neighbor_list, image_cores);
+        else if (polynomial)
+            image_error = calculate_sf_poly(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, &dsymf[k], threshold, gamma, image_neighbor_list, image_cores);
+        else
+            image_error = calculate_sf_cos(
+                cell + k*3, cart + a, scale + a, pbc_bools + k*3,
+                atom_i + a, natoms, cal_atoms + c, cal_num,
+                params_i, params_d, element_index_to_order,
+                param_offsets, nelements, nsyms,
+                symf + c, &dsymf[k], threshold, image_neighbor_list, image_cores);
+        if (image_error > error) error = image_error;
+    }
+
+    return error;
+}
+
 void PyInit_libsymf(void) { } // for windows
@@ -6,24 +6,41 @@
 
 #include <math.h>
 //#include "mpi.h"
+#include "fp_prime.h"
+#include "neighbor_list.h"
 #include "symmetry_functions.h"
 
 extern "C" int calculate_sf_cos(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double**);
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, NeighborList*, int);
 
 extern "C" int calculate_sf_cos_noderiv(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**);
+                            int**, double **, int*, int*, int, int,
+                            double**, NeighborList*, int);
 
 extern "C" int calculate_sf_poly(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double**, double);
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, double, NeighborList*, int);
 
 extern "C" int calculate_sf_poly_noderiv(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double);
+                            int**, double **, int*, int*, int, int,
+                            double**, double, NeighborList*, int);
+
+extern "C" int calculate_sf_tab(double **, double **, double **, int*,
+                            int *, int, int*, int,
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, double**, int, NeighborList*, int);
+
+extern "C" int calculate_sf_tab_noderiv(double **, double **, double **, int*,
+                            int *, int, int*, int,
+                            int**, double **, int*, int*, int, int,
+                            double**, double**, int, NeighborList*, int);
+
+extern "C" int calculate_sf_batch(double *, double *, double *, int*,
+                            int *, int, int*, int*, int*,
+                            int*, int, double *, int, int*, int*, int, int,
+                            int, double*, FpPrimeBuffer*, double, double, double*, int, NeighborList**, int);
@@ -1,36 +1,84 @@
+import sys
+
 import cffi
 
 ffibuilder = cffi.FFI()
 ffibuilder.cdef(
-    """int calculate_sf_cos(double **, double **, double **, int*,
+    """typedef struct {
+            void* val;
+            int* row;
+            int* col;
+            long nnz;
+            long capacity;
+            int single;
+            const double* grad;
+            double* forces;
+            double* virial;
+            const int* free_atoms;
+            int error;
+        } FpPrimeBuffer;
+
+        void free_fp_prime_buffer(FpPrimeBuffer*);
+
+        typedef struct NeighborList NeighborList;
+        NeighborList* new_neighbor_list(double);
+        void free_neighbor_list(NeighborList*);
+        int neighbor_list_num_builds(NeighborList*);
+        long neighbor_pairs(double*, double*, double*, int*, int, double,
+                            int*, int*, double*, long);
+
+        int calculate_sf_cos(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double**);
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, NeighborList*, int);
 
        int calculate_sf_cos_noderiv(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**);
+                            int**, double **, int*, int*, int, int,
+                            double**, NeighborList*, int);
 
        int calculate_sf_poly(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double**, double);
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, double, NeighborList*, int);
 
        int calculate_sf_poly_noderiv(double **, double **, double **, int*,
                             int *, int, int*, int,
-                            int**, double **, int,
-                            double**, double);"""
+                            int**, double **, int*, int*, int, int,
+                            double**, double, NeighborList*, int);
+
+       int calculate_sf_tab(double **, double **, double **, int*,
+                            int *, int, int*, int,
+                            int**, double **, int*, int*, int, int,
+                            double**, FpPrimeBuffer*, double, double**, int, NeighborList*, int);
+
+       int calculate_sf_tab_noderiv(double **, double **, double **, int*,
+                            int *, int, int*, int,
+                            int**, double **, int*, int*, int, int,
+                            double**, double**, int, NeighborList*, int);
+
+       int calculate_sf_batch(double *, double *, double *, int*,
+                           int *, int, int*, int*, int*,
+                           int*, int, double *, int, int*, int*, int, int,
+                           int, double*, FpPrimeBuffer*, double, double, double*, int, NeighborList**, int);"""
 )
+# the kernels are parallelized over center atoms with OpenMP, the default
+# compiler on macOS does not support it and the kernels then run serially
+openmp_args = [] if sys.platform == "darwin" else ["-fopenmp"]
+
 ffibuilder.set_source(
     "amptorch.descriptor.Gaussian._libsymf",
     '#include "calculate_sf.h"',
     sources=[
         "amptorch/descriptor/Gaussian/calculate_sf.cpp",
         "amptorch/descriptor/Gaussian/symmetry_functions.cpp",
+        "amptorch/descriptor/neighbor_list.cpp",
+        "amptorch/descriptor/fp_prime.cpp",
     ],
     source_extension=".cpp",
-    include_dirs=["amptorch/descriptor/Gaussian/"],
+    include_dirs=["amptorch/descriptor/Gaussian/", "amptorch/descriptor/"],
+    extra_compile_args=openmp_args,
+    extra_link_args=openmp_args,
 )
 
 if __name__ == "__main__":
@@ -56,12 +56,13 @@ double G2(double Rij, double *precal, double *par, double &deriv) {
 
 double G4(double Rij, double Rik, double Rjk, double powtwo, \
           double *precal, double *par, double *deriv) {
+    // precal[12] = exp(-eta*(Rij^2 + Rik^2 + Rjk^2))
     // cosv: cos(theta)
     // par[0] = cutoff_dist
     // par[1] = eta
     // par[2] = zeta
     // par[3] = lambda
-    double expl = exp(-par[1]*precal[6]) * powtwo;
+    double expl = precal[12] * powtwo;
     double cosv = 1 + par[3]*precal[7];
     //double powcos = pow_int(cosv, par[2]-1);
     double powcos = pow(fabs(cosv), fabs(par[2]-1));
@@ -81,12 +82,13 @@ double G4(double Rij, double Rik, double Rjk, double powtwo, \
 
 double G5(double Rij, double Rik, double powtwo, \
           double *precal, double *par, double *deriv) {
+    // precal[13] = exp(-eta*(Rij^2 + Rik^2))
     // cosv: cos(theta)
     // par[0] = cutoff_dist
     // par[1] = eta
     // par[2] = zeta
     // par[3] = lambda
-    double expl = exp(-par[1]*precal[11]) * powtwo;
+    double expl = precal[13] * powtwo;
     double cosv = 1 + par[3]*precal[7];
     //double powcos = pow_int(cosv, par[2]-1);
     double powcos = pow(fabs(cosv), fabs(par[2]-1));
@@ -120,7 +122,7 @@ double G4_noderiv(double Rij, double Rik, double Rjk, double powtwo, \
     // par[1] = eta
     // par[2] = zeta
     // par[3] = lambda
-    double expl = exp(-par[1]*precal[6]) * powtwo;
+    double expl = precal[12] * powtwo;
     double cosv = 1 + par[3]*precal[7];
     //double powcos = pow_int(cosv, par[2]-1);
     double powcos = pow(fabs(cosv), fabs(par[2]-1));
@@ -135,10 +137,60 @@ double G5_noderiv(double Rij, double Rik, double powtwo, \
     // par[1] = eta
     // par[2] = zeta
     // par[3] = lambda
-    double expl = exp(-par[1]*precal[11]) * powtwo;
+    double expl = precal[13] * powtwo;
     double cosv = 1 + par[3]*precal[7];
     //double powcos = pow_int(cosv, par[2]-1);
     double powcos = pow(fabs(cosv), fabs(par[2]-1));
 
     return powcos*cosv * expl * precal[0] * precal[2];
 }
+
+
+// with a tabulation, precal[0..5] hold the radial parts (gaussian times cutoff
+// function) of ij, ik and jk and their derivatives instead of the cutoff function
+
+double G4_tab(double powtwo, double *precal, double *par, double *deriv) {
+    // par[2] = zeta
+    // par[3] = lambda
+    double cosv = 1 + par[3]*precal[7];
+    double powcos = pow(fabs(cosv), fabs(par[2]-1)) * powtwo;
+
+    deriv[0] = powcos*precal[2]*precal[4] * \
+               (precal[1]*cosv + par[2]*par[3]*precal[0]*precal[8]); // ij
+    deriv[1] = powcos*precal[0]*precal[4] * \
+               (precal[3]*cosv + par[2]*par[3]*precal[2]*precal[9]); // ik
+    deriv[2] = powcos*precal[0]*precal[2] * \
+               (precal[5]*cosv - par[2]*par[3]*precal[4]*precal[10]); // jk
+
+    return powcos*cosv * precal[0] * precal[2] * precal[4];
+}
+
+double G5_tab(double powtwo, double *precal, double *par, double *deriv) {
+    // par[2] = zeta
+    // par[3] = lambda
+    double cosv = 1 + par[3]*precal[7];
+    double powcos = pow(fabs(cosv), fabs(par[2]-1)) * powtwo;
+
+    deriv[0] = powcos*precal[2] * \
+               (precal[1]*cosv + par[2]*par[3]*precal[0]*precal[8]); // ij
+    deriv[1] = powcos*precal[0] * \
+               (precal[3]*cosv + par[2]*par[3]*precal[2]*precal[9]); // ik
+    deriv[2] = powcos*precal[0]*precal[2] * \
+               -par[2]*par[3]*precal[10]; // jk
+
+    return powcos*cosv * precal[0] * precal[2];
+}
+
+double G4_tab_noderiv(double powtwo, double *precal, double *par) {
+    double cosv = 1 + par[3]*precal[7];
+    double powcos = pow(fabs(cosv), fabs(par[2]-1)) * powtwo;
+
+    return powcos*cosv * precal[0] * precal[2] * precal[4];
+}
+
+double G5_tab_noderiv(double powtwo, double *precal, double *par) {
+    double cosv = 1 + par[3]*precal[7];
+    double powcos = pow(fabs(cosv), fabs(par[2]-1)) * powtwo;
+
+    return powcos*cosv * precal[0] * precal[2];
+}
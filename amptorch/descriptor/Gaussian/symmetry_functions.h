@@ -17,6 +17,25 @@ static inline double pow_int(const double &x, const double n) {
     return (n > 0) ? res : 1.0/res;
 }
 
+static inline double tabulated(const double *row, double r, double inv_spacing, int nintervals, double &deriv) {
+    // row: [value, derivative] of a function of the distance at the nodes k / inv_spacing,
+    //      k = 0 .. nintervals (the last node is the cutoff)
+    // the function is zero beyond the cutoff, in between it is interpolated by
+    // the cubic Hermite polynomial of the two closest nodes
+    double x = r * inv_spacing;
+    int k = (int) x;
+    if (k >= nintervals) {
+        deriv = 0.0;
+        return 0.0;
+    }
+    double t = x - k, spacing = 1.0 / inv_spacing;
+    const double *node = row + 2*k;
+    double df = node[0] - node[2];
+    double d0 = node[1]*spacing, d1 = node[3]*spacing;
+    deriv = ((6*t - 6)*t*df + ((3*t - 4)*t + 1)*d0 + (3*t - 2)*t*d1) * inv_spacing;
+    return node[0] + t*(d0 + t*(-3*df - 2*d0 - d1 + t*(2*df + d0 + d1)));
+}
+
 double sigm(double, double &);
 double cutf(double);
 double dcutf(double, double);
@@ -26,6 +45,11 @@ double G2(double, double *, double *, double &);
 double G4(double, double, double, double, double *, double *, double *);
 double G5(double, double, double, double *, double *, double *);
 
+double G4_tab(double, double *, double *, double *);
+double G5_tab(double, double *, double *, double *);
+
 double G2_noderiv(double, double *, double *, double &);
 double G4_noderiv(double, double, double, double, double *, double *, double *);
 double G5_noderiv(double, double, double, double *, double *, double *);
+double G4_tab_noderiv(double, double *, double *);
+double G5_tab_noderiv(double, double *, double *);
@@ -1,17 +1,43 @@
+import hashlib
 import os
 from abc import ABC, abstractmethod
 
-import h5py
 import numpy as np
 from tqdm import tqdm
 
-from .util import get_hash, list_symbols_to_indices, validate_image
+from .environment import EnvironmentClasses, _ase_neighbor_pairs
+from .fingerprint_store import FingerprintStore
+from .util import (
+    _atom_selection,
+    get_hash,
+    list_symbols_to_indices,
+    validate_image,
+)
+
+
+def _selection_hash(center_atoms, free_atoms):
+    # suffix of the database file of an image whose fingerprints are
+    # restricted to some center atoms or derivative columns, empty otherwise
+    if center_atoms is None and free_atoms is None:
+        return ""
+    string = ""
+    for atoms in (center_atoms, free_atoms):
+        atoms = np.asarray(atoms) if atoms is not None else None
+        if atoms is not None and atoms.dtype == bool:
+            atoms = np.flatnonzero(atoms)
+        string += "all" if atoms is None else ",".join(str(int(a)) for a in atoms)
+        string += ";"
+    return "-" + hashlib.md5(string.encode("utf-8")).hexdigest()
 
 
 class BaseDescriptor(ABC):
+    # whether calculate_image_forces_batch is implemented
+    supports_force_contraction = False
+
     def __init__(self):
         super().__init__()
         self.fp_database = "processed/descriptors/"
+        self.fp_store = None
 
         # To Be specified/calculated
         self.descriptor_type = "default"
@@ -20,8 +46,96 @@ class BaseDescriptor(ABC):
         self.elements = []
 
     @abstractmethod
-    def calculate_fingerprints(self, image, params_set, calculate_derivatives=True):
+    def calculate_fingerprints_batch(
+        self,
+        images,
+        element,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+    ):
+        # images is a list of snapshots, the fingerprints of the atoms of
+        # element are returned per image. neighbor_lists is an optional
+        # NeighborList per image, dtype the precision of the results
+        pass
+
+    def calculate_fingerprints(
+        self,
+        image,
+        element,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_list=None,
+        dtype=np.float64,
+    ):
         # image is a single snapshot
+        return self.calculate_fingerprints_batch(
+            [image],
+            element,
+            calc_derivatives,
+            log,
+            cores=cores,
+            neighbor_lists=[neighbor_list],
+            dtype=dtype,
+        )[0]
+
+    @abstractmethod
+    def calculate_image_fingerprints_batch(
+        self,
+        images,
+        calc_derivatives,
+        log,
+        cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+    ):
+        # the fingerprints of all the atoms of each image, the rows are the
+        # atoms of the image and the derivative rows are indexed accordingly.
+        # center_atoms optionally restricts the rows of each image to the
+        # given atoms (in that order), free_atoms the derivative columns of
+        # each image to the columns of the given atoms (None for all the atoms
+        # of an image, indices or a boolean mask otherwise)
+        pass
+
+    def calculate_image_forces_batch(
+        self,
+        images,
+        fingerprint_grads,
+        cores=1,
+        neighbor_lists=None,
+        calc_virial=False,
+        free_atoms=None,
+    ):
+        # forces of each image ([# of atoms, 3]) from the gradient of the
+        # energy with respect to the fingerprints of its atoms, contracted with
+        # the fingerprint derivatives without storing them. With calc_virial
+        # the virial of each image ([3, 3], -dE/dstrain) is returned as well.
+        # The forces of the atoms not in free_atoms (optional, per image) are
+        # left at zero.
+        # Only descriptors with supports_force_contraction implement it
+        raise NotImplementedError
+
+    def _neighbor_pairs(self, image, cutoff):
+        # pairs of atoms of image closer than cutoff, each atom being paired
+        # with itself: the center atoms, the neighbors and the displacements
+        # from the centers to the neighbors. The descriptors with kernels use
+        # their own neighbor search
+        return _ase_neighbor_pairs(image, cutoff)
+
+    @abstractmethod
+    def get_num_descriptors(self, element):
+        # number of fingerprints of the atoms of element
+        pass
+
+    @abstractmethod
+    def get_cutoff(self):
+        # largest distance at which a neighbor contributes to the fingerprints
+        # of an atom
         pass
 
     @abstractmethod
@@ -39,339 +153,135 @@ class BaseDescriptor(ABC):
         pass
 
     def prepare_fingerprints(
-        self, images, calc_derivatives, save_fps, verbose, cores, log
+        self,
+        images,
+        calc_derivatives,
+        save_fps,
+        verbose,
+        cores,
+        log,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+        environment_tolerance=None,
     ):
-        images_descriptor_list = []
+        # center_atoms and free_atoms optionally restrict the fingerprints of
+        # each image, see calculate_image_fingerprints_batch. With
+        # environment_tolerance, the fingerprints of the atoms with the same
+        # environment up to a translation are computed once, see
+        # EnvironmentClasses
+        center_atoms = center_atoms or [None] * len(images)
+        free_atoms = free_atoms or [None] * len(images)
 
         # if save is true, create directories if not exist
         self._setup_fingerprint_database(save_fps=save_fps)
 
-        for image in tqdm(
-            images,
+        # fingerprints saved by a previous run are loaded, the remaining images
+        # are computed together with a single kernel call
+        results = [None] * len(images)
+        image_hashes = [None] * len(images)
+        with tqdm(
             total=len(images),
             desc="Computing fingerprints",
             disable=not verbose,
-        ):
-            validate_image(image)
-            image_hash = get_hash(image)
-            image_db_filename = "{}/{}.h5".format(self.desc_fp_database_dir, image_hash)
-
-            # if save, then read/write from db as needed
-            if save_fps:
-                try:
-                    temp_descriptor_list = self._compute_fingerprints(
-                        image,
-                        image_db_filename,
-                        calc_derivatives=calc_derivatives,
-                        save_fps=save_fps,
-                        cores=cores,
-                        log=log,
+        ) as pbar:
+            for idx, image in enumerate(images):
+                validate_image(image)
+                if save_fps:
+                    image_hashes[idx] = get_hash(image) + _selection_hash(
+                        center_atoms[idx], free_atoms[idx]
                     )
-                except Exception:
-                    print(
-                        "File {} not loaded properly\nProceed to compute in run-time".format(
-                            image_db_filename
+            if save_fps:
+                results = self.fp_store.get_many(
+                    image_hashes,
+                    calc_derivatives,
+                    dtype,
+                    legacy_images=[
+                        image if centers is None and free is None else None
+                        for image, centers, free in zip(
+                            images, center_atoms, free_atoms
                         )
-                    )
-                    temp_descriptor_list = self._compute_fingerprints_nodb(
-                        image,
-                        image_db_filename,
-                        calc_derivatives=calc_derivatives,
-                        save_fps=save_fps,
-                        cores=cores,
-                        log=log,
-                    )
-
-            # if not save, compute fps on-the-fly
-            else:
-                temp_descriptor_list = self._compute_fingerprints_nodb(
-                    image,
-                    image_db_filename,
+                    ],
+                )
+                pbar.update(sum(result is not None for result in results))
+
+            pending = [idx for idx, result in enumerate(results) if result is None]
+            if pending:
+                pending_centers = [center_atoms[idx] for idx in pending]
+                if environment_tolerance is not None:
+                    classes = [
+                        EnvironmentClasses(
+                            images[idx],
+                            self.get_cutoff(),
+                            environment_tolerance,
+                            center_atoms[idx],
+                            free_atoms[idx],
+                            self._neighbor_pairs,
+                        )
+                        for idx in pending
+                    ]
+                    pending_centers = [c.representatives for c in classes]
+                computed = self.calculate_image_fingerprints_batch(
+                    [images[idx] for idx in pending],
                     calc_derivatives=calc_derivatives,
-                    save_fps=save_fps,
-                    cores=cores,
                     log=log,
+                    cores=cores,
+                    neighbor_lists=None
+                    if neighbor_lists is None
+                    else [neighbor_lists[idx] for idx in pending],
+                    dtype=dtype,
+                    center_atoms=pending_centers,
+                    free_atoms=[free_atoms[idx] for idx in pending],
                 )
-
-            images_descriptor_list += temp_descriptor_list
-
-        return images_descriptor_list
-
-    def _compute_fingerprints(
-        self, image, image_db_filename, calc_derivatives, save_fps, cores, log
-    ):
-        descriptor_list = []
-
-        with h5py.File(image_db_filename, "a") as db:
-            image_dict = {}
-
-            symbol_arr = np.array(image.get_chemical_symbols())
-            image_dict["atomic_numbers"] = list_symbols_to_indices(symbol_arr)
-            num_atoms = len(symbol_arr)
-            image_dict["num_atoms"] = num_atoms
-
-            try:
-                current_snapshot_grp = db[str(0)]
-            except Exception:
-                current_snapshot_grp = db.create_group(str(0))
-
-            num_desc_list = []
-            index_arr_dict = {}
-            num_desc_dict = {}
-            fp_dict = {}
-
-            fp_prime_val_dict = {}
-            fp_prime_row_dict = {}
-            fp_prime_col_dict = {}
-            fp_prime_size_dict = {}
-
-            for element in self.elements:
-                if element in image.get_chemical_symbols():
-                    index_arr = np.arange(num_atoms)[symbol_arr == element]
-                    index_arr_dict[element] = index_arr
-
-                    try:
-                        current_element_grp = current_snapshot_grp[element]
-                    except Exception:
-                        current_element_grp = current_snapshot_grp.create_group(element)
-
-                    if calc_derivatives:
-                        try:
-                            size_info = np.array(current_element_grp["size_info"])
-                            fps = np.array(current_element_grp["fps"])
-                            fp_primes_val = np.array(
-                                current_element_grp["fp_primes_val"]
-                            )
-                            fp_primes_row = np.array(
-                                current_element_grp["fp_primes_row"]
-                            )
-                            fp_primes_col = np.array(
-                                current_element_grp["fp_primes_col"]
-                            )
-                            fp_primes_size = np.array(
-                                current_element_grp["fp_primes_size"]
-                            )
-                        except Exception:
-                            (
-                                size_info,
-                                fps,
-                                fp_primes_val,
-                                fp_primes_row,
-                                fp_primes_col,
-                                fp_primes_size,
-                            ) = self.calculate_fingerprints(
-                                image,
-                                element,
-                                calc_derivatives=calc_derivatives,
-                                log=log,
-                            )
-
-                            if save_fps:
-                                current_element_grp.create_dataset(
-                                    "size_info", data=size_info
-                                )
-                                current_element_grp.create_dataset("fps", data=fps)
-                                current_element_grp.create_dataset(
-                                    "fp_primes_val", data=fp_primes_val
-                                )
-                                current_element_grp.create_dataset(
-                                    "fp_primes_row", data=fp_primes_row
-                                )
-                                current_element_grp.create_dataset(
-                                    "fp_primes_col", data=fp_primes_col
-                                )
-                                current_element_grp.create_dataset(
-                                    "fp_primes_size", data=fp_primes_size
-                                )
-
-                        num_desc_list.append(size_info[2])
-                        num_desc_dict[element] = size_info[2]
-                        fp_dict[element] = fps
-
-                        fp_prime_val_dict[element] = fp_primes_val
-                        fp_prime_row_dict[element] = fp_primes_row
-                        fp_prime_col_dict[element] = fp_primes_col
-                        fp_prime_size_dict[element] = fp_primes_size
-
-                    else:
-                        try:
-                            size_info = np.array(current_element_grp["size_info"])
-                            fps = np.array(current_element_grp["fps"])
-                        except Exception:
-                            size_info, fps, _, _, _, _ = self.calculate_fingerprints(
-                                image,
-                                element,
-                                calc_derivatives=calc_derivatives,
-                                log=log,
-                            )
-
-                            if save_fps:
-                                current_element_grp.create_dataset(
-                                    "size_info", data=size_info
-                                )
-                                current_element_grp.create_dataset("fps", data=fps)
-
-                        num_desc_list.append(size_info[2])
-                        num_desc_dict[element] = size_info[2]
-                        fp_dict[element] = fps
-
-                else:
-                    pass
-                    # print("element not in current image: {}".format(element))
-
-            num_desc_max = np.max(num_desc_list)
-            image_fp_array = np.zeros((num_atoms, num_desc_max))
-            for element in fp_dict.keys():
-                image_fp_array[
-                    index_arr_dict[element], : num_desc_dict[element]
-                ] = fp_dict[element]
-
-            image_dict["descriptors"] = image_fp_array
-            image_dict["num_descriptors"] = num_desc_dict
-
-            if calc_derivatives:
-                descriptor_prime_dict = {}
-                descriptor_prime_dict["size"] = np.array(
-                    [num_desc_max * num_atoms, 3 * num_atoms]
-                )
-                descriptor_prime_row_list = []
-                descriptor_prime_col_list = []
-                descriptor_prime_val_list = []
-                for element in fp_prime_val_dict.keys():
-                    descriptor_prime_row_list.append(
-                        self._fp_prime_element_row_index_to_image_row_index(
-                            fp_prime_row_dict[element],
-                            index_arr_dict[element],
-                            num_desc_dict[element],
-                            num_desc_max,
-                        )
+                if environment_tolerance is not None:
+                    computed = [
+                        c.broadcast(result) for c, result in zip(classes, computed)
+                    ]
+                for idx, result in zip(pending, computed):
+                    results[idx] = result
+                if save_fps:
+                    self.fp_store.put_many(
+                        [image_hashes[idx] for idx in pending], computed
                     )
-                    descriptor_prime_col_list.append(fp_prime_col_dict[element])
-                    descriptor_prime_val_list.append(fp_prime_val_dict[element])
-                descriptor_prime_dict["row"] = np.concatenate(descriptor_prime_row_list)
-                descriptor_prime_dict["col"] = np.concatenate(descriptor_prime_col_list)
-                descriptor_prime_dict["val"] = np.concatenate(descriptor_prime_val_list)
-                image_dict["descriptor_primes"] = descriptor_prime_dict
-
-            descriptor_list.append(image_dict)
+            pbar.update(len(pending))
 
-        return descriptor_list
-
-    def _compute_fingerprints_nodb(
-        self, image, image_db_filename, calc_derivatives, save_fps, cores, log
-    ):
-        descriptor_list = []
+        return [
+            self._image_descriptor_dict(image, result, calc_derivatives, centers)
+            for image, result, centers in zip(images, results, center_atoms)
+        ]
 
+    def _image_descriptor_dict(self, image, result, calc_derivatives, centers=None):
         image_dict = {}
 
-        symbol_arr = np.array(image.get_chemical_symbols())
-        image_dict["atomic_numbers"] = list_symbols_to_indices(symbol_arr)
-        num_atoms = len(symbol_arr)
-        image_dict["num_atoms"] = num_atoms
-
-        num_desc_list = []
-        index_arr_dict = {}
-        num_desc_dict = {}
-        fp_dict = {}
-
-        fp_prime_val_dict = {}
-        fp_prime_row_dict = {}
-        fp_prime_col_dict = {}
-        fp_prime_size_dict = {}
-
-        for element in self.elements:
-            if element in image.get_chemical_symbols():
-                index_arr = np.arange(num_atoms)[symbol_arr == element]
-                index_arr_dict[element] = index_arr
-
-                if calc_derivatives:
-                    (
-                        size_info,
-                        fps,
-                        fp_primes_val,
-                        fp_primes_row,
-                        fp_primes_col,
-                        fp_primes_size,
-                    ) = self.calculate_fingerprints(
-                        image,
-                        element,
-                        calc_derivatives=calc_derivatives,
-                        log=log,
-                    )
-
-                    num_desc_list.append(size_info[2])
-                    num_desc_dict[element] = size_info[2]
-                    fp_dict[element] = fps
-
-                    fp_prime_val_dict[element] = fp_primes_val
-                    fp_prime_row_dict[element] = fp_primes_row
-                    fp_prime_col_dict[element] = fp_primes_col
-                    fp_prime_size_dict[element] = fp_primes_size
-
-                else:
-                    size_info, fps, _, _, _, _ = self.calculate_fingerprints(
-                        image, element, calc_derivatives=calc_derivatives, log=log
-                    )
-
-                    num_desc_list.append(size_info[2])
-                    num_desc_dict[element] = size_info[2]
-                    fp_dict[element] = fps
-
-            else:
-                pass
-                # print("element not in current image: {}".format(element))
-
-        num_desc_max = np.max(num_desc_list)
-        image_fp_array = np.zeros((num_atoms, num_desc_max))
-        for element in fp_dict.keys():
-            image_fp_array[index_arr_dict[element], : num_desc_dict[element]] = fp_dict[
-                element
-            ]
-
-        image_dict["descriptors"] = image_fp_array
-        image_dict["num_descriptors"] = num_desc_dict
+        symbols = image.get_chemical_symbols()
+        image_dict["atomic_numbers"] = list_symbols_to_indices(symbols)
+        image_dict["num_atoms"] = len(symbols)
+        if centers is not None:
+            # the rows of the fingerprints are the selected center atoms
+            image_dict["center_atoms"] = _atom_selection(centers, len(symbols))
+            symbols = [symbols[i] for i in image_dict["center_atoms"]]
+
+        _, fps, fp_primes_val, fp_primes_row, fp_primes_col, fp_primes_size = result
+        image_dict["descriptors"] = fps
+        image_dict["num_descriptors"] = {
+            element: self.get_num_descriptors(element)
+            for element in self.elements
+            if element in symbols
+        }
 
         if calc_derivatives:
-            descriptor_prime_dict = {}
-            descriptor_prime_dict["size"] = np.array(
-                [num_desc_max * num_atoms, 3 * num_atoms]
-            )
-            descriptor_prime_row_list = []
-            descriptor_prime_col_list = []
-            descriptor_prime_val_list = []
-            for element in fp_prime_val_dict.keys():
-                descriptor_prime_row_list.append(
-                    self._fp_prime_element_row_index_to_image_row_index(
-                        fp_prime_row_dict[element],
-                        index_arr_dict[element],
-                        num_desc_dict[element],
-                        num_desc_max,
-                    )
-                )
-                descriptor_prime_col_list.append(fp_prime_col_dict[element])
-                descriptor_prime_val_list.append(fp_prime_val_dict[element])
-            descriptor_prime_dict["row"] = np.concatenate(descriptor_prime_row_list)
-            descriptor_prime_dict["col"] = np.concatenate(descriptor_prime_col_list)
-            descriptor_prime_dict["val"] = np.concatenate(descriptor_prime_val_list)
-            image_dict["descriptor_primes"] = descriptor_prime_dict
-
-        descriptor_list.append(image_dict)
-        return descriptor_list
-
-    def _fp_prime_element_row_index_to_image_row_index(
-        self, original_rows, index_arr, num_desc, num_desc_max
-    ):
-        atom_indices_for_specific_element, desc_indices = np.divmod(
-            original_rows, num_desc
-        )
-
-        atom_indices_in_image = index_arr[atom_indices_for_specific_element]
+            image_dict["descriptor_primes"] = {
+                "size": fp_primes_size,
+                "row": fp_primes_row,
+                "col": fp_primes_col,
+                "val": fp_primes_val,
+            }
 
-        new_row = atom_indices_in_image * num_desc_max + desc_indices
-        return new_row
+        return image_dict
 
     def _setup_fingerprint_database(self, save_fps):
-        self.get_descriptor_setup_hash()
+        # self.descriptor_setup_hash is set with the parameters, in __init__
         self.desc_type_database_dir = "{}/{}".format(
             self.fp_database, self.descriptor_type
         )
@@ -380,7 +290,11 @@ class BaseDescriptor(ABC):
             self.desc_type_database_dir, self.descriptor_setup_hash
         )
 
-        if save_fps:
+        # the images of the setup are saved in a single store, the per image
+        # files of earlier versions in its directory are migrated. The
+        # directory is only set up once per store
+        store_path = "{}/fingerprints.lmdb".format(self.desc_fp_database_dir)
+        if save_fps and (self.fp_store is None or self.fp_store.path != store_path):
             os.makedirs(self.fp_database, exist_ok=True)
             os.makedirs(self.desc_type_database_dir, exist_ok=True)
             os.makedirs(self.desc_fp_database_dir, exist_ok=True)
@@ -389,6 +303,9 @@ class BaseDescriptor(ABC):
                 self.desc_fp_database_dir, descriptor_setup_filename
             )
             self.save_descriptor_setup(descriptor_setup_path)
+            self.fp_store = FingerprintStore(
+                store_path, legacy_dir=self.desc_fp_database_dir
+            )
 
     def _get_element_list(self):
         return self.elements
@@ -12,6 +12,11 @@ class DescriptorCalculator:
         save_fps=True,
         verbose=True,
         cores=1,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+        environment_tolerance=None,
     ):
         assert isinstance(
             descriptor, BaseDescriptor
@@ -23,6 +28,11 @@ class DescriptorCalculator:
         self.save_fps = save_fps
         self.cores = cores
         self.verbose = verbose
+        self.neighbor_lists = neighbor_lists
+        self.dtype = dtype
+        self.center_atoms = center_atoms
+        self.free_atoms = free_atoms
+        self.environment_tolerance = environment_tolerance
 
         self.element_list = self.descriptor._get_element_list()
         self.descriptors_ready = False
@@ -35,6 +45,11 @@ class DescriptorCalculator:
             cores=self.cores,
             verbose=self.verbose,
             log=None,
+            neighbor_lists=self.neighbor_lists,
+            dtype=self.dtype,
+            center_atoms=self.center_atoms,
+            free_atoms=self.free_atoms,
+            environment_tolerance=self.environment_tolerance,
         )
 
         self.descriptors_ready = True
@@ -0,0 +1,173 @@
+"""
+Center atoms of an image with the same local environment, e.g. the atoms of a
+supercell built by repeating a unit cell, whose fingerprints are computed once.
+"""
+
+import numpy as np
+from ase.neighborlist import neighbor_list
+
+from .util import _atom_selection
+
+
+def _ase_neighbor_pairs(image, cutoff):
+    # pairs of atoms of image closer than cutoff from ase, each atom being
+    # paired with itself: the center atoms, the neighbors and the
+    # displacements from the centers to the neighbors
+    natoms = len(image)
+    i, j, D = neighbor_list("ijD", image, cutoff)
+    return (
+        np.concatenate([i, np.arange(natoms)]),
+        np.concatenate([j, np.arange(natoms)]),
+        np.concatenate([D, np.zeros((natoms, 3))]),
+    )
+
+
+class EnvironmentClasses:
+    """
+    Groups the center atoms of an image whose neighbors within the cutoff are
+    the same up to a translation: the same elements at the same displacements,
+    to within tolerance (in Angstrom). The fingerprints of a class are
+    computed for its first atom (its representative) and copied to the other
+    ones, the derivative columns of the neighbors of the representative are
+    mapped to the corresponding neighbors of each atom.
+
+    The environment of an atom is hashed from the sorted displacements of its
+    neighbors rounded to multiples of tolerance, together with their elements
+    and whether their derivative columns are kept (free_atoms). Equivalent
+    atoms whose displacements round differently are merely left in separate
+    classes.
+
+    Args:
+        image [ase.Atoms] : the structure.
+        cutoff [float] : cutoff of the descriptor.
+        tolerance [float] : largest difference of the displacements of the
+        neighbors of two atoms of a class.
+        center_atoms : optional center atoms of the image (indices or a
+        boolean mask), all the atoms by default.
+        free_atoms : optional atoms whose derivative columns are kept (indices
+        or a boolean mask), all the atoms by default.
+        neighbor_pairs : function returning the pairs of atoms of an image
+        closer than a cutoff, see BaseDescriptor._neighbor_pairs. Searched
+        with ase by default.
+    """
+
+    def __init__(
+        self,
+        image,
+        cutoff,
+        tolerance,
+        center_atoms=None,
+        free_atoms=None,
+        neighbor_pairs=_ase_neighbor_pairs,
+    ):
+        if tolerance <= 0.0:
+            raise ValueError("The environment tolerance must be > 0.")
+        natoms = len(image)
+        self.num_atoms = natoms
+        self.center_atoms = (
+            np.arange(natoms)
+            if center_atoms is None
+            else _atom_selection(center_atoms, natoms)
+        )
+        free = np.ones(natoms, dtype=bool)
+        if free_atoms is not None:
+            free[:] = False
+            free[_atom_selection(free_atoms, natoms)] = True
+
+        # the neighbors up to the cutoff plus the tolerance, each atom being
+        # part of its own environment at zero displacement
+        i, j, D = neighbor_pairs(image, cutoff + tolerance)
+        q = np.rint(D / tolerance).astype(np.int64)
+        species = 2 * image.get_atomic_numbers().astype(np.int64) + free
+        order = np.lexsort((q[:, 2], q[:, 1], q[:, 0], species[j], i))
+        i, j = i[order], j[order]
+        keys = np.column_stack([species[j], q[order]])
+        starts = np.searchsorted(i, np.arange(natoms + 1))
+
+        # index of the representative of each center atom in
+        # self.representatives, and for the other atoms of a class the
+        # neighbors of the representative (sorted) with the corresponding
+        # neighbors of the atom
+        self.representatives = []
+        self.classes = np.empty(len(self.center_atoms), dtype=np.int64)
+        self.column_maps = [None] * len(self.center_atoms)
+        representatives = {}
+        for row, atom in enumerate(self.center_atoms):
+            env = slice(starts[atom], starts[atom + 1])
+            key = keys[env].tobytes()
+            if key in representatives:
+                rep = representatives[key]
+                rep_atom = self.representatives[rep]
+                column_map = self._column_map(
+                    j[starts[rep_atom] : starts[rep_atom + 1]], j[env]
+                )
+                if column_map is not None:
+                    self.classes[row] = rep
+                    self.column_maps[row] = column_map
+                    continue
+            else:
+                representatives[key] = len(self.representatives)
+            self.classes[row] = len(self.representatives)
+            self.representatives.append(atom)
+        self.representatives = np.array(self.representatives, dtype=np.int64)
+
+    @staticmethod
+    def _column_map(rep_neighbors, neighbors):
+        # neighbors of the representative (unique, sorted) and the
+        # corresponding neighbors of the atom, None when the correspondence is
+        # not one to one, e.g. the periodic images of a neighbor of the
+        # representative matching different atoms
+        order = np.argsort(rep_neighbors, kind="stable")
+        rep_neighbors, neighbors = rep_neighbors[order], neighbors[order]
+        repeated = rep_neighbors[1:] == rep_neighbors[:-1]
+        if np.any(neighbors[1:][repeated] != neighbors[:-1][repeated]):
+            return None
+        first = np.concatenate([[True], ~repeated])
+        rep_neighbors, neighbors = rep_neighbors[first], neighbors[first]
+        if len(np.unique(neighbors)) != len(neighbors):
+            return None
+        return rep_neighbors, neighbors
+
+    @property
+    def num_classes(self):
+        return len(self.representatives)
+
+    def broadcast(self, result):
+        """
+        Result of calculate_image_fingerprints_batch for the center atoms from
+        the one computed for the representatives.
+        """
+        if self.num_classes == len(self.center_atoms):
+            # no two center atoms share their environment
+            return result
+        _, fps, val, row, col, _ = result
+        num = fps.shape[1]
+        ncenters = len(self.center_atoms)
+        size_info = np.array([self.num_atoms, ncenters, num])
+        fps = fps[self.classes]
+        if val is None:
+            return size_info, fps, None, None, None, None
+
+        # the derivative entries of each representative
+        rep_rows = row // num
+        order = np.argsort(rep_rows, kind="stable")
+        val, row, col = val[order], row[order], col[order]
+        rep_starts = np.searchsorted(rep_rows[order], np.arange(self.num_classes + 1))
+
+        vals, rows, cols = [], [], []
+        for center_row, rep in enumerate(self.classes):
+            entries = slice(rep_starts[rep], rep_starts[rep + 1])
+            rep_row, rep_col = row[entries], col[entries]
+            vals.append(val[entries])
+            rows.append(rep_row + (center_row - rep) * num)
+            if self.column_maps[center_row] is None:
+                cols.append(rep_col)
+            else:
+                rep_neighbors, neighbors = self.column_maps[center_row]
+                atoms = neighbors[np.searchsorted(rep_neighbors, rep_col // 3)]
+                cols.append(atoms * 3 + rep_col % 3)
+        val = np.concatenate([val[:0]] + vals)
+        row = np.concatenate([row[:0]] + rows).astype(row.dtype, copy=False)
+        col = np.concatenate([col[:0]] + cols).astype(col.dtype, copy=False)
+        size = np.array([ncenters * num, self.num_atoms * 3])
+        return size_info, fps, val, row, col, size
@@ -0,0 +1,365 @@
+"""
+Fingerprint database of a descriptor setup: a single LMDB file keyed by image
+hash, instead of one HDF5 file per image.
+"""
+
+import atexit
+import os
+import pickle
+import queue
+import threading
+from contextlib import contextmanager
+
+import h5py
+import lmdb
+import numpy as np
+
+from .util import get_legacy_hash
+
+# arrays saved per image, in the order returned by calculate_fingerprints and
+# calculate_image_fingerprints_batch
+FP_DATASET_KEYS = (
+    "size_info",
+    "fps",
+    "fp_primes_val",
+    "fp_primes_row",
+    "fp_primes_col",
+    "fp_primes_size",
+)
+
+# LMDB environments opened by this process, with their map lock, by path and
+# process id. A file must only be opened once per process, and a forked
+# process opens its own
+_environments = {}
+
+
+class _MapLock:
+    """
+    Lock of an environment held shared by its transactions, and exclusively to
+    resize its map, which LMDB only allows while the process has no active
+    transaction.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._shared = 0
+
+    @contextmanager
+    def shared(self):
+        with self._condition:
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._shared -= 1
+                if not self._shared:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        # new transactions wait on the condition meanwhile
+        with self._condition:
+            self._condition.wait_for(lambda: not self._shared)
+            yield
+
+
+class FingerprintStore:
+    """
+    Fingerprints of the images computed with a descriptor setup, stored in the
+    LMDB file path.
+
+    The records are keyed by image hash, the B-tree of LMDB being the index,
+    and the images of a call are read in one transaction and written in
+    another. Readers are only blocked while the map is grown and see the
+    records committed by other processes (e.g. other training jobs) from their
+    next read, writers are serialized by the lock file of LMDB. The lock
+    requires the processes writing to a store to run on the same host, stores
+    on a network filesystem can be read from other hosts.
+
+    The records are written behind by a thread of the process, so that the
+    kernels are not stalled by the disk (e.g. a network filesystem): put_many
+    serializes the records and queues them, the thread writes the batches
+    queued meanwhile in a single transaction. put_many blocks while
+    max_pending batches are queued. The queued records are read by get_many
+    as the saved ones, and are written at the latest when the process exits
+    (see flush). A transaction is committed entirely or not at all, so a
+    crash only loses the records still queued, which are computed again.
+
+    Args:
+        path [str] : path of the LMDB file.
+        legacy_dir [str] : optional directory of the per image HDF5 files
+        saved by earlier versions, named by get_legacy_hash. The images
+        missing from the store are read from them and added to the store.
+        write_behind [bool] : whether the records are written by the thread,
+        put_many writes them itself otherwise.
+    """
+
+    # the map is sparse, only the records use disk space. It is doubled if
+    # ever filled
+    map_size = 2**40
+    # batches of records queued for the writer thread before put_many blocks
+    max_pending = 16
+
+    def __init__(self, path, legacy_dir=None, write_behind=True):
+        self.path = path
+        self.write_behind = write_behind
+        self._reset_writer()
+        # the per image files are only looked up when the directory has any,
+        # so that a miss does not cost a file lookup otherwise
+        self.legacy_dir = legacy_dir if _has_legacy_files(legacy_dir) else None
+
+    def _environment(self):
+        key = (os.path.abspath(self.path), os.getpid())
+        if key not in _environments:
+            env = lmdb.open(
+                self.path,
+                subdir=False,
+                map_size=self.map_size,
+                readahead=False,
+                meminit=False,
+                max_readers=1024,
+            )
+            _environments[key] = (env, _MapLock())
+        return _environments[key]
+
+    @contextmanager
+    def _transaction(self, **kwargs):
+        # transaction of the environment, never active while its map is resized
+        env, map_lock = self._environment()
+        while True:
+            with map_lock.shared():
+                try:
+                    txn = env.begin(**kwargs)
+                except lmdb.MapResizedError:
+                    txn = None
+                if txn is not None:
+                    with txn:
+                        yield txn
+                    return
+            # the map was grown by another process
+            with map_lock.exclusive():
+                env.set_mapsize(0)
+
+    def _reset_writer(self):
+        # writer state of the process, a forked process starts its own writer
+        # thread. The records queued by the parent are written by the parent
+        self._writer_pid = os.getpid()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._queue = None
+        self._error = None
+
+    def _check_process(self):
+        if self._writer_pid != os.getpid():
+            self._reset_writer()
+
+    def _write_loop(self, pending):
+        # writer thread: the batches queued meanwhile are written together
+        while True:
+            batches = [pending.get()]
+            while True:
+                try:
+                    batches.append(pending.get_nowait())
+                except queue.Empty:
+                    break
+            values = [value for batch in batches for value in batch]
+            try:
+                self._write(values)
+            except Exception as error:
+                # raised by the next put_many or flush, the records are lost
+                self._error = error
+            with self._lock:
+                for key, value in values:
+                    if self._pending.get(key) is value:
+                        del self._pending[key]
+            for _ in batches:
+                pending.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(
+                "Fingerprints could not be saved to {}".format(self.path)
+            ) from error
+
+    def flush(self):
+        """Wait until the queued records are written."""
+        self._check_process()
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def get_many(self, image_hashes, calc_derivatives, dtype, legacy_images=None):
+        """
+        Results of the images (see FP_DATASET_KEYS), None for the images
+        missing from the store, saved without the derivatives when
+        calc_derivatives or saved with another precision.
+
+        legacy_images optionally holds the image of each hash (None for the
+        images whose fingerprints are restricted to some atoms, which earlier
+        versions did not save). The images missing from the store are looked
+        up in the legacy files by their legacy hash.
+        """
+        self._check_process()
+        keys = [image_hash.encode("ascii") for image_hash in image_hashes]
+        with self._lock:
+            queued = {key: self._pending[key] for key in keys if key in self._pending}
+
+        results = [None] * len(image_hashes)
+        with self._transaction(buffers=True) as txn:
+            missing = []
+            for k, key in enumerate(keys):
+                value = queued.get(key)
+                if value is None:
+                    value = txn.get(key)
+                if value is None:
+                    missing.append(k)
+                else:
+                    results[k] = _decode(pickle.loads(value), calc_derivatives, dtype)
+
+        migrated = []
+        if self.legacy_dir is not None and legacy_images is not None:
+            for k in missing:
+                image = legacy_images[k]
+                if image is None:
+                    continue
+                record = _load_legacy(
+                    os.path.join(self.legacy_dir, get_legacy_hash(image) + ".h5"),
+                    image.get_chemical_symbols(),
+                )
+                if record is not None:
+                    migrated.append((image_hashes[k], record))
+                    results[k] = _decode(record, calc_derivatives, dtype)
+        if migrated:
+            self._put_records(migrated)
+        return results
+
+    def put_many(self, image_hashes, results):
+        """Queue the results of the images, written in a single transaction."""
+        self._put_records(
+            [
+                (
+                    image_hash,
+                    {
+                        key: data
+                        for key, data in zip(FP_DATASET_KEYS, result)
+                        if data is not None
+                    },
+                )
+                for image_hash, result in zip(image_hashes, results)
+            ]
+        )
+
+    def _put_records(self, records):
+        # the records are serialized here, so that the caller can change
+        # their arrays once queued
+        values = [
+            (image_hash.encode("ascii"), pickle.dumps(record, protocol=4))
+            for image_hash, record in records
+        ]
+        self._check_process()
+        self._raise_error()
+        if not self.write_behind:
+            self._write(values)
+            return
+        if self._queue is None:
+            self._queue = queue.Queue(self.max_pending)
+            threading.Thread(
+                target=self._write_loop, args=(self._queue,), daemon=True
+            ).start()
+            atexit.register(self.flush)
+        with self._lock:
+            self._pending.update(values)
+        self._queue.put(values)
+
+    def _write(self, values):
+        while True:
+            try:
+                with self._transaction(write=True) as txn:
+                    for key, value in values:
+                        txn.put(key, value)
+                return
+            except lmdb.MapFullError:
+                # the transaction is aborted, the map is grown once the
+                # transactions of the other threads (e.g. get_many) are done
+                env, map_lock = self._environment()
+                with map_lock.exclusive():
+                    env.set_mapsize(2 * env.info()["map_size"])
+
+    def __len__(self):
+        self.flush()
+        return self._environment()[0].stat()["entries"]
+
+
+def _decode(record, calc_derivatives, dtype):
+    # result of an image from its record, None when it lacks the
+    # derivatives or was saved with another precision
+    if record["fps"].dtype != dtype:
+        return None
+    keys = FP_DATASET_KEYS if calc_derivatives else FP_DATASET_KEYS[:2]
+    if any(key not in record for key in keys):
+        return None
+    return tuple(record[key] if key in keys else None for key in FP_DATASET_KEYS)
+
+
+def _has_legacy_files(directory):
+    if directory is None or not os.path.isdir(directory):
+        return False
+    with os.scandir(directory) as entries:
+        return any(entry.name.endswith(".h5") for entry in entries)
+
+
+def _load_legacy(filename, symbols):
+    # record of an image saved in its own HDF5 file by earlier versions, None
+    # when missing, unreadable or incomplete. The file holds a group per
+    # element, whose rows are the atoms of the element in the order of the
+    # image, and the rows of the image record are padded to the largest
+    # number of fingerprints of the elements
+    if not os.path.exists(filename):
+        return None
+    try:
+        with h5py.File(filename, "r") as db:
+            snapshot = db[str(0)]
+            groups = {
+                element: {
+                    key: group[key][()] for key in FP_DATASET_KEYS if key in group
+                }
+                for element, group in snapshot.items()
+            }
+    except Exception:
+        print("File {} not loaded properly".format(filename))
+        return None
+
+    symbols = np.asarray(symbols)
+    elements = np.unique(symbols)
+    if any(
+        element not in groups or "fps" not in groups[element] for element in elements
+    ):
+        return None
+    groups = [
+        (np.flatnonzero(symbols == element), groups[element]) for element in elements
+    ]
+    natoms = len(symbols)
+    num = max(int(group["size_info"][2]) for _, group in groups)
+    fps = np.zeros((natoms, num), dtype=groups[0][1]["fps"].dtype)
+    for atoms, group in groups:
+        fps[atoms, : group["fps"].shape[1]] = group["fps"]
+    record = {"size_info": np.array([natoms, natoms, num]), "fps": fps}
+
+    if all(key in group for _, group in groups for key in FP_DATASET_KEYS[2:]):
+        rows = []
+        for atoms, group in groups:
+            element_atoms, fp_index = np.divmod(
+                group["fp_primes_row"].astype(np.int64), int(group["size_info"][2])
+            )
+            rows.append((atoms[element_atoms] * num + fp_index).astype(np.intc))
+        record["fp_primes_val"] = np.concatenate(
+            [group["fp_primes_val"] for _, group in groups]
+        )
+        record["fp_primes_row"] = np.concatenate(rows)
+        record["fp_primes_col"] = np.concatenate(
+            [group["fp_primes_col"].astype(np.intc) for _, group in groups]
+        )
+        record["fp_primes_size"] = np.array([natoms * num, natoms * 3])
+    return record
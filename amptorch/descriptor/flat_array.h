@@ -0,0 +1,28 @@
+/*
+ Row views of the flat arrays passed by Python to the batched kernels.
+ The 2D arrays (positions, cells, parameter tables, fingerprints) are handed
+ over as the buffer of a C contiguous numpy array and its row stride, without
+ any per-row marshalling on the Python side. The per-image kernels index
+ them by rows, the row pointers are built here once per call.
+ */
+
+#ifndef AMPTORCH_FLAT_ARRAY_H
+#define AMPTORCH_FLAT_ARRAY_H
+
+#include <vector>
+
+template <typename T>
+class RowView {
+public:
+    // nrows rows of stride elements starting at data
+    RowView(T* data, long nrows, long stride) : rows(nrows) {
+        for (long i = 0; i < nrows; ++i) rows[i] = data + i * stride;
+    }
+
+    T** ptr() { return rows.data(); }
+
+private:
+    std::vector<T*> rows;
+};
+
+#endif
@@ -0,0 +1,234 @@
+#include <math.h>
+#include <stdlib.h>
+#include <string.h>
+#include <algorithm>
+#include "fp_prime.h"
+
+extern "C" void free_fp_prime_buffer(FpPrimeBuffer* buffer) {
+    free(buffer->val);
+    free(buffer->row);
+    free(buffer->col);
+    buffer->val = NULL;
+    buffer->row = NULL;
+    buffer->col = NULL;
+    buffer->nnz = 0;
+    buffer->capacity = 0;
+}
+
+static size_t fp_prime_value_size(const FpPrimeBuffer* buffer) {
+    return buffer->single ? sizeof(float) : sizeof(double);
+}
+
+static bool fp_prime_buffer_reserve(FpPrimeBuffer* buffer, long size) {
+    // false when the arrays could not be grown, they are then kept as they
+    // are (with their entries) and the error of the buffer is set
+    if (size <= buffer->capacity)
+        return true;
+
+    long capacity = buffer->capacity > 0 ? buffer->capacity : 1024;
+    while (capacity < size)
+        capacity *= 2;
+
+    void* val = realloc(buffer->val, fp_prime_value_size(buffer) * capacity);
+    if (val != NULL)
+        buffer->val = val;
+    int* row = (int*) realloc(buffer->row, sizeof(int) * capacity);
+    if (row != NULL)
+        buffer->row = row;
+    int* col = (int*) realloc(buffer->col, sizeof(int) * capacity);
+    if (col != NULL)
+        buffer->col = col;
+    if (val == NULL || row == NULL || col == NULL) {
+        buffer->error = 1;
+        return false;
+    }
+    buffer->capacity = capacity;
+    return true;
+}
+
+void fp_prime_buffer_extend(FpPrimeBuffer* buffer, const FpPrimeBuffer* other) {
+    if (other->nnz == 0)
+        return;
+
+    // both buffers store the values with the same precision
+    size_t value_size = fp_prime_value_size(buffer);
+    if (!fp_prime_buffer_reserve(buffer, buffer->nnz + other->nnz))
+        return;
+    memcpy((char*) buffer->val + value_size * buffer->nnz, other->val, value_size * other->nnz);
+    memcpy(buffer->row + buffer->nnz, other->row, sizeof(int) * other->nnz);
+    memcpy(buffer->col + buffer->nnz, other->col, sizeof(int) * other->nnz);
+    buffer->nnz += other->nnz;
+}
+
+FpPrimeBuffer* new_thread_buffers(const FpPrimeBuffer* buffer, int nthreads, int natoms) {
+    FpPrimeBuffer* thread_buffers = new FpPrimeBuffer[nthreads]();
+    for (int t=0; t < nthreads; ++t) {
+        thread_buffers[t].single = buffer->single;
+        thread_buffers[t].free_atoms = buffer->free_atoms;
+        if (buffer->grad != NULL) {
+            thread_buffers[t].grad = buffer->grad;
+            thread_buffers[t].forces = new double[natoms * 3]();
+            if (buffer->virial != NULL)
+                thread_buffers[t].virial = new double[9]();
+        }
+    }
+    return thread_buffers;
+}
+
+void merge_thread_buffers(FpPrimeBuffer* buffer, FpPrimeBuffer* thread_buffers, int nthreads, int natoms) {
+    for (int t=0; t < nthreads; ++t) {
+        if (buffer->grad != NULL) {
+            for (int a=0; a < natoms * 3; ++a)
+                buffer->forces[a] += thread_buffers[t].forces[a];
+            delete[] thread_buffers[t].forces;
+            if (buffer->virial != NULL) {
+                for (int a=0; a < 9; ++a)
+                    buffer->virial[a] += thread_buffers[t].virial[a];
+                delete[] thread_buffers[t].virial;
+            }
+        }
+        else {
+            if (thread_buffers[t].error)
+                buffer->error = 1;
+            fp_prime_buffer_extend(buffer, &thread_buffers[t]);
+            free_fp_prime_buffer(&thread_buffers[t]);
+        }
+    }
+    delete[] thread_buffers;
+}
+
+FpPrimeAccumulator::FpPrimeAccumulator(int natoms, int max_nneigh, int nrows, bool virial)
+    : natoms(natoms), nrows(nrows), nslots(0), nei_disp(NULL), strain_deriv(NULL) {
+
+    // the center atom and at most one slot per neighbor
+    stride = 3 * (max_nneigh + 1);
+
+    atom_slot = new int[natoms];
+    for (int a=0; a < natoms; ++a)
+        atom_slot[a] = -1;
+    slot_atom = new int[max_nneigh + 1];
+    slot_order = new int[max_nneigh + 1];
+    nei_slot = new int[max_nneigh];
+    deriv = new double[(long) nrows * stride];
+    if (virial)
+        strain_deriv = new double[nrows * 9];
+}
+
+FpPrimeAccumulator::~FpPrimeAccumulator() {
+    delete[] atom_slot;
+    delete[] slot_atom;
+    delete[] slot_order;
+    delete[] nei_slot;
+    delete[] deriv;
+    delete[] strain_deriv;
+}
+
+void FpPrimeAccumulator::set_neighbors(int i, int nneigh, const int* nei_list_i, const double* nei_list_d) {
+    nei_disp = nei_list_d;
+
+    // release the slots of the previous center atom
+    for (int s=0; s < nslots; ++s)
+        atom_slot[slot_atom[s]] = -1;
+
+    atom_slot[i] = 0;
+    slot_atom[0] = i;
+    nslots = 1;
+
+    // periodic images of the same atom share a slot
+    for (int j=0; j < nneigh; ++j) {
+        int atom = nei_list_i[j*2 + 1];
+        if (atom_slot[atom] < 0) {
+            atom_slot[atom] = nslots;
+            slot_atom[nslots] = atom;
+            nslots++;
+        }
+        nei_slot[j] = atom_slot[atom];
+    }
+
+    for (int s=0; s < nslots; ++s)
+        slot_order[s] = s;
+    std::sort(slot_order, slot_order + nslots,
+              [this](int a, int b) { return slot_atom[a] < slot_atom[b]; });
+
+    for (int row=0; row < nrows; ++row)
+        zero(row);
+}
+
+void FpPrimeAccumulator::scale(int row, double factor) {
+    double* d = deriv + (long) row * stride;
+    for (int s=0; s < nslots * 3; ++s)
+        d[s] *= factor;
+    if (strain_deriv != NULL) {
+        for (int a=0; a < 9; ++a)
+            strain_deriv[row * 9 + a] *= factor;
+    }
+}
+
+void FpPrimeAccumulator::zero(int row) {
+    double* d = deriv + (long) row * stride;
+    for (int s=0; s < nslots * 3; ++s)
+        d[s] = 0.0;
+    if (strain_deriv != NULL) {
+        for (int a=0; a < 9; ++a)
+            strain_deriv[row * 9 + a] = 0.0;
+    }
+}
+
+void FpPrimeAccumulator::flush(FpPrimeBuffer* buffer, long row_offset, double threshold) const {
+    if (buffer->grad != NULL)
+        contract(buffer, row_offset);
+    else if (buffer->single)
+        flush_values<float>(buffer, row_offset, threshold);
+    else
+        flush_values<double>(buffer, row_offset, threshold);
+}
+
+template <typename T>
+void FpPrimeAccumulator::flush_values(FpPrimeBuffer* buffer, long row_offset, double threshold) const {
+    if (!fp_prime_buffer_reserve(buffer, buffer->nnz + (long) nrows * nslots * 3))
+        return;
+
+    T* values = (T*) buffer->val;
+    long nnz = buffer->nnz;
+    for (int row=0; row < nrows; ++row) {
+        const double* d = deriv + (long) row * stride;
+        for (int o=0; o < nslots; ++o) {
+            int s = slot_order[o];
+            if (buffer->free_atoms != NULL && !buffer->free_atoms[slot_atom[s]])
+                continue;
+            for (int a=0; a < 3; ++a) {
+                double val = d[s*3 + a];
+                if (val == 0.0 || fabs(val) < threshold)
+                    continue;
+                values[nnz] = (T) val;
+                buffer->row[nnz] = row_offset + row;
+                buffer->col[nnz] = slot_atom[s]*3 + a;
+                nnz++;
+            }
+        }
+    }
+    buffer->nnz = nnz;
+}
+
+void FpPrimeAccumulator::contract(FpPrimeBuffer* buffer, long row_offset) const {
+    // the derivatives are not thresholded, so that the forces and the virial
+    // are contracted from the same derivatives (the virial is then the sum of
+    // the positions times the forces of an image without periodic images)
+    for (int row=0; row < nrows; ++row) {
+        double g = buffer->grad[row_offset + row];
+        if (g == 0.0)
+            continue;
+        const double* d = deriv + (long) row * stride;
+        for (int s=0; s < nslots; ++s) {
+            if (buffer->free_atoms != NULL && !buffer->free_atoms[slot_atom[s]])
+                continue;
+            double* f = buffer->forces + slot_atom[s]*3;
+            for (int a=0; a < 3; ++a)
+                f[a] -= g * d[s*3 + a];
+        }
+        if (buffer->virial != NULL && strain_deriv != NULL) {
+            for (int a=0; a < 9; ++a)
+                buffer->virial[a] -= g * strain_deriv[row * 9 + a];
+        }
+    }
+}
@@ -0,0 +1,128 @@
+/*
+ Sparse fingerprint derivatives written by the descriptor kernels.
+ The derivatives of the fingerprints of a center atom are only nonzero for the
+ atoms within the cutoff, so the kernels accumulate them per center atom and
+ append the nonzero entries to a growable COO buffer (value, row, col) instead
+ of filling a dense [# of fingerprints, # of atoms * 3] matrix.
+ When the gradient of the energy with respect to the fingerprints is given,
+ the derivatives are contracted with it into the forces instead, and are
+ never stored.
+ */
+
+#ifndef AMPTORCH_FP_PRIME_H
+#define AMPTORCH_FP_PRIME_H
+
+// growable COO buffer, the arrays are allocated by the kernels and released
+// with free_fp_prime_buffer. the values are computed in double precision and
+// stored as double, or as float when single is set by the caller.
+// when grad is set by the caller, nothing is stored: the derivatives are
+// contracted with grad (dE/dG of each fingerprint row) and subtracted from
+// forces ([# of atoms * 3], owned by the caller). when virial ([3 * 3], owned
+// by the caller) is also set, the derivatives with respect to the neighbor
+// displacements r_ij are contracted into it as well, -sum dE/dr_ij^a r_ij^b.
+// when free_atoms ([# of atoms], owned by the caller) is set, only the
+// derivatives with respect to the atoms with a nonzero entry are stored or
+// contracted, the columns of the other atoms are left out.
+// error is set when the arrays could not be grown, the entries that did not
+// fit are then missing and the caller must discard the buffer
+typedef struct FpPrimeBuffer {
+    void* val;
+    int* row;
+    int* col;
+    long nnz;
+    long capacity;
+    int single;
+    const double* grad;
+    double* forces;
+    double* virial;
+    const int* free_atoms;
+    int error;
+} FpPrimeBuffer;
+
+extern "C" void free_fp_prime_buffer(FpPrimeBuffer* buffer);
+
+// append the entries of another buffer, the other buffer is left untouched
+void fp_prime_buffer_extend(FpPrimeBuffer* buffer, const FpPrimeBuffer* other);
+
+// empty buffers for nthreads threads, storing the values with the precision of
+// buffer and the columns of its free atoms, or contracting them with the gradient of buffer into zeroed forces
+// of natoms atoms (and a zeroed virial when buffer has one)
+FpPrimeBuffer* new_thread_buffers(const FpPrimeBuffer* buffer, int nthreads, int natoms);
+
+// merge the buffers of the threads into buffer in thread order and release them
+void merge_thread_buffers(FpPrimeBuffer* buffer, FpPrimeBuffer* thread_buffers, int nthreads, int natoms);
+
+class FpPrimeAccumulator {
+public:
+    // natoms: # of atoms
+    // max_nneigh: maximum # of neighbors of a center atom
+    // nrows: # of fingerprints accumulated at the same time
+    // virial: also accumulate the derivatives with respect to the strain
+    FpPrimeAccumulator(int natoms, int max_nneigh, int nrows, bool virial = false);
+    ~FpPrimeAccumulator();
+
+    // start a new center atom i and map its neighbors to unique atoms,
+    // all the derivatives are reset to zero. nei_list_d holds the displacement
+    // of each neighbor from the center atom (x, y, z, squared distance), it
+    // must stay valid until the next call
+    void set_neighbors(int i, int nneigh, const int* nei_list_i, const double* nei_list_d);
+
+    // derivative of fingerprint row with respect to the position of neighbor j.
+    // by translational invariance the center atom gets the opposite derivative
+    inline void add(int row, int j, double dx, double dy, double dz) {
+        double* d = deriv + (long) row * stride;
+        int s = nei_slot[j] * 3;
+        d[s]     += dx;
+        d[s + 1] += dy;
+        d[s + 2] += dz;
+        d[0] -= dx;
+        d[1] -= dy;
+        d[2] -= dz;
+        if (strain_deriv != NULL) {
+            // the fingerprints depend on the positions through the neighbor
+            // displacements only, dG/deps_ab = sum_j dG/dr_ij^a r_ij^b
+            double* e = strain_deriv + row * 9;
+            const double* r = nei_disp + j * 4;
+            for (int b=0; b < 3; ++b) {
+                e[b]     += dx * r[b];
+                e[3 + b] += dy * r[b];
+                e[6 + b] += dz * r[b];
+            }
+        }
+    }
+
+    void scale(int row, double factor);
+    void zero(int row);
+
+    // append the entries of rows [0, nrows) as rows row_offset + row, entries
+    // with an absolute value smaller than threshold (and exact zeros) are dropped.
+    // all the entries are contracted into the forces (and the virial) of a
+    // contracting buffer, the threshold only saves storage
+    void flush(FpPrimeBuffer* buffer, long row_offset, double threshold) const;
+
+private:
+    // flush storing the values as T
+    template <typename T>
+    void flush_values(FpPrimeBuffer* buffer, long row_offset, double threshold) const;
+
+    // flush into the forces of a contracting buffer
+    void contract(FpPrimeBuffer* buffer, long row_offset) const;
+
+    int natoms, nrows, nslots, stride;
+    // slot of each atom, -1 when the atom is not a neighbor of the center atom
+    int* atom_slot;
+    // atom of each slot, slot 0 is the center atom
+    int* slot_atom;
+    // slot of each entry of the neighbor list
+    int* nei_slot;
+    // slots sorted by atom index, so that the columns of a row are sorted
+    int* slot_order;
+    // derivatives [nrows, nslots * 3]
+    double* deriv;
+    // neighbor displacements of the current center atom, see set_neighbors
+    const double* nei_disp;
+    // derivatives with respect to the strain [nrows, 3 * 3], NULL when not needed
+    double* strain_deriv;
+};
+
+#endif
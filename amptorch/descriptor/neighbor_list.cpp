@@ -0,0 +1,384 @@
+#include <math.h>
+#include <vector>
+#include "flat_array.h"
+#include "neighbor_list.h"
+
+CellList::CellList(double** cell, double** cart, double** scale, int* pbc_bools,
+                   int* atom_i, int natoms, double cutoff)
+    : cell(cell), cart(cart), pbc_bools(pbc_bools), atom_i(atom_i), natoms(natoms) {
+
+    double vol, tmp;
+    double plane_d[3];
+    double cross[3][3], reci[3][3];
+
+    cutoff_sqr = cutoff * cutoff;
+
+    // calculate the distance between cell plane
+    cross[0][0] = cell[1][1]*cell[2][2] - cell[1][2]*cell[2][1];
+    cross[0][1] = cell[1][2]*cell[2][0] - cell[1][0]*cell[2][2];
+    cross[0][2] = cell[1][0]*cell[2][1] - cell[1][1]*cell[2][0];
+    cross[1][0] = cell[2][1]*cell[0][2] - cell[2][2]*cell[0][1];
+    cross[1][1] = cell[2][2]*cell[0][0] - cell[2][0]*cell[0][2];
+    cross[1][2] = cell[2][0]*cell[0][1] - cell[2][1]*cell[0][0];
+    cross[2][0] = cell[0][1]*cell[1][2] - cell[0][2]*cell[1][1];
+    cross[2][1] = cell[0][2]*cell[1][0] - cell[0][0]*cell[1][2];
+    cross[2][2] = cell[0][0]*cell[1][1] - cell[0][1]*cell[1][0];
+
+    vol = cross[0][0]*cell[0][0] + cross[0][1]*cell[0][1] + cross[0][2]*cell[0][2];
+
+    total_bins = 1;
+    for (int i=0; i<3; ++i) {
+        tmp = 0;
+        for (int j=0; j<3; ++j) {
+            reci[i][j] = cross[i][j]/vol;
+            tmp += reci[i][j]*reci[i][j];
+        }
+        // plane_d[i] is the height of the cell in dimension i
+        plane_d[i] = 1/sqrt(tmp);
+        // bins are at least one cutoff wide, so that (except for cells smaller
+        // than the cutoff) only the adjacent bins need to be searched
+        nbins[i] = (int) floor(plane_d[i]/cutoff);
+        if (nbins[i] < 1)
+            nbins[i] = 1;
+        // number of bins to search on each side of the center bin
+        bin_range[i] = ceil(cutoff * nbins[i] / plane_d[i]);
+        total_bins *= nbins[i];
+    }
+
+    // assign the bin index to each atom and count the atoms in each bin
+    atom_bin = new int[natoms * 3];
+    bin_start = new int[total_bins + 1];
+    bin_atoms = new int[natoms];
+    for (int b=0; b < total_bins + 1; ++b)
+        bin_start[b] = 0;
+
+    int* bin_index = new int[natoms];
+    for (int i=0; i < natoms; ++i) {
+        for (int a=0; a < 3; ++a) {
+            int b = (int) (scale[i][a] * (double) nbins[a]);
+            // scaled position of exactly 1.0 belongs to the last bin
+            if (b >= nbins[a]) b = nbins[a] - 1;
+            if (b < 0) b = 0;
+            atom_bin[i*3 + a] = b;
+        }
+        bin_index[i] = atom_bin[i*3] + nbins[0]*atom_bin[i*3 + 1] + nbins[0]*nbins[1]*atom_bin[i*3 + 2];
+        bin_start[bin_index[i] + 1]++;
+    }
+
+    // sort the atoms by bin (counting sort)
+    int max_atoms_bin = 0;
+    for (int b=0; b < total_bins; ++b) {
+        if (bin_start[b + 1] > max_atoms_bin)
+            max_atoms_bin = bin_start[b + 1];
+        bin_start[b + 1] += bin_start[b];
+    }
+
+    int* bin_fill = new int[total_bins];
+    for (int b=0; b < total_bins; ++b)
+        bin_fill[b] = bin_start[b];
+    for (int i=0; i < natoms; ++i)
+        bin_atoms[bin_fill[bin_index[i]]++] = i;
+
+    delete[] bin_fill;
+    delete[] bin_index;
+
+    max_nneigh = max_atoms_bin;
+    for (int a=0; a < 3; ++a)
+        max_nneigh *= 2*bin_range[a] + 1;
+}
+
+CellList::~CellList() {
+    delete[] atom_bin;
+    delete[] bin_start;
+    delete[] bin_atoms;
+}
+
+int CellList::find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i,
+                              int* nei_shift) const {
+    int nneigh = 0;
+    int min_bin[3], max_bin[3], pbc_bin[3], cell_shift[3];
+    double total_shift[3], tmp_r2;
+
+    for (int a=0; a < 3; ++a) {
+        max_bin[a] = atom_bin[i*3 + a] + bin_range[a];
+        min_bin[a] = atom_bin[i*3 + a] - bin_range[a];
+    }
+
+    for (int dx=min_bin[0]; dx < max_bin[0]+1; ++dx) {
+        pbc_bin[0] = (dx%nbins[0] + nbins[0]) % nbins[0];
+        cell_shift[0] = (dx-pbc_bin[0]) / nbins[0];
+        // take care of pbc
+        if (!pbc_bools[0] && cell_shift[0] != 0)
+            continue;
+
+        for (int dy=min_bin[1]; dy < max_bin[1]+1; ++dy) {
+            pbc_bin[1] = (dy%nbins[1] + nbins[1]) % nbins[1];
+            cell_shift[1] = (dy-pbc_bin[1]) / nbins[1];
+            if (!pbc_bools[1] && cell_shift[1] != 0)
+                continue;
+
+            for (int dz=min_bin[2]; dz < max_bin[2]+1; ++dz) {
+                pbc_bin[2] = (dz%nbins[2] + nbins[2]) % nbins[2];
+                cell_shift[2] = (dz-pbc_bin[2]) / nbins[2];
+                if (!pbc_bools[2] && cell_shift[2] != 0)
+                    continue;
+
+                bool same_image = !(cell_shift[0] || cell_shift[1] || cell_shift[2]);
+                int bin_num = pbc_bin[0] + nbins[0]*pbc_bin[1] + nbins[0]*nbins[1]*pbc_bin[2];
+
+                // only the atoms sorted into this bin are visited
+                for (int jj=bin_start[bin_num]; jj < bin_start[bin_num + 1]; ++jj) {
+                    int j = bin_atoms[jj];
+
+                    // same atom
+                    if (!include_self && same_image && (i == j))
+                        continue;
+
+                    for (int a=0; a < 3; ++a) {
+                        total_shift[a] = cell_shift[0]*cell[0][a] + cell_shift[1]*cell[1][a] + cell_shift[2]*cell[2][a]
+                                         + cart[j][a] - cart[i][a];
+                    }
+
+                    tmp_r2 = total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2];
+
+                    if (tmp_r2 < cutoff_sqr) {
+                        for (int a=0; a < 3; ++a)
+                            nei_list_d[nneigh*4 + a] = total_shift[a];
+                        nei_list_d[nneigh*4 + 3] = tmp_r2;
+                        nei_list_i[nneigh*2]    = atom_i[j];
+                        nei_list_i[nneigh*2 + 1] = j;
+                        if (nei_shift != NULL) {
+                            for (int a=0; a < 3; ++a)
+                                nei_shift[nneigh*3 + a] = cell_shift[a];
+                        }
+                        nneigh++;
+                    }
+                }
+            }
+        }
+    }
+
+    return nneigh;
+}
+
+NeighborList::NeighborList(double skin)
+    : skin(skin), cutoff(0.0), cutoff_sqr(0.0), natoms(0), max_nneigh(0), builds(0),
+      ref_cart(NULL), ref_atom_i(NULL), cell(NULL), cart(NULL), atom_i(NULL),
+      pair_start(NULL), pair_atom(NULL), pair_shift(NULL) {
+    if (this->skin < 0.0)
+        this->skin = 0.0;
+}
+
+NeighborList::~NeighborList() {
+    clear();
+}
+
+void NeighborList::clear() {
+    delete[] ref_cart;
+    delete[] ref_atom_i;
+    delete[] pair_start;
+    delete[] pair_atom;
+    delete[] pair_shift;
+    ref_cart = NULL;
+    ref_atom_i = NULL;
+    pair_start = NULL;
+    pair_atom = NULL;
+    pair_shift = NULL;
+}
+
+bool NeighborList::needs_build(double** cell, double** cart, int* pbc_bools,
+                               int* atom_i, int natoms, double cutoff) const {
+    if (builds == 0 || natoms != this->natoms || cutoff != this->cutoff)
+        return true;
+
+    for (int a=0; a < 3; ++a) {
+        if (pbc_bools[a] != ref_pbc[a])
+            return true;
+        for (int b=0; b < 3; ++b) {
+            if (cell[a][b] != ref_cell[a][b])
+                return true;
+        }
+    }
+
+    // the pairs stay valid as long as no two atoms came closer by more than
+    // the skin, i.e. no atom moved by more than half of the skin. atoms that
+    // were wrapped back into the cell moved by a cell vector
+    double max_disp_sqr = 0.25 * skin * skin;
+    for (int i=0; i < natoms; ++i) {
+        if (atom_i[i] != ref_atom_i[i])
+            return true;
+        double disp_sqr = 0.0;
+        for (int a=0; a < 3; ++a) {
+            double d = cart[i][a] - ref_cart[i*3 + a];
+            disp_sqr += d*d;
+        }
+        if (disp_sqr > max_disp_sqr)
+            return true;
+    }
+
+    return false;
+}
+
+void NeighborList::build(double** cell, double** cart, double** scale, int* pbc_bools,
+                         int* atom_i, int natoms, double cutoff) {
+    clear();
+    this->natoms = natoms;
+    this->cutoff = cutoff;
+    cutoff_sqr = cutoff * cutoff;
+
+    for (int a=0; a < 3; ++a) {
+        ref_pbc[a] = pbc_bools[a];
+        for (int b=0; b < 3; ++b)
+            ref_cell[a][b] = cell[a][b];
+    }
+    ref_cart = new double[natoms * 3];
+    ref_atom_i = new int[natoms];
+    for (int i=0; i < natoms; ++i) {
+        for (int a=0; a < 3; ++a)
+            ref_cart[i*3 + a] = cart[i][a];
+        ref_atom_i[i] = atom_i[i];
+    }
+
+    CellList cell_list(cell, cart, scale, pbc_bools, atom_i, natoms, cutoff + skin);
+    int max_pairs = cell_list.max_neighbors();
+    double* nei_list_d = new double[max_pairs * 4];
+    int*    nei_list_i = new int[max_pairs * 2];
+    int*    nei_shift = new int[max_pairs * 3];
+
+    std::vector<int> atoms, shifts;
+    pair_start = new int[natoms + 1];
+    pair_start[0] = 0;
+    max_nneigh = 0;
+    for (int i=0; i < natoms; ++i) {
+        // the center atom is kept, so that the list serves both kinds of kernels
+        int nneigh = cell_list.find_neighbors(i, true, nei_list_d, nei_list_i, nei_shift);
+        for (int j=0; j < nneigh; ++j) {
+            atoms.push_back(nei_list_i[j*2 + 1]);
+            for (int a=0; a < 3; ++a)
+                shifts.push_back(nei_shift[j*3 + a]);
+        }
+        pair_start[i + 1] = pair_start[i] + nneigh;
+        if (nneigh > max_nneigh)
+            max_nneigh = nneigh;
+    }
+
+    pair_atom = new int[atoms.size() + 1];
+    pair_shift = new int[shifts.size() + 1];
+    for (size_t p=0; p < atoms.size(); ++p)
+        pair_atom[p] = atoms[p];
+    for (size_t p=0; p < shifts.size(); ++p)
+        pair_shift[p] = shifts[p];
+
+    delete[] nei_list_d;
+    delete[] nei_list_i;
+    delete[] nei_shift;
+    builds++;
+}
+
+bool NeighborList::update(double** cell, double** cart, double** scale, int* pbc_bools,
+                          int* atom_i, int natoms, double cutoff) {
+    bool rebuilt = needs_build(cell, cart, pbc_bools, atom_i, natoms, cutoff);
+    if (rebuilt)
+        build(cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+
+    this->cell = cell;
+    this->cart = cart;
+    this->atom_i = atom_i;
+    return rebuilt;
+}
+
+int NeighborList::find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i) const {
+    int nneigh = 0;
+    double total_shift[3], tmp_r2;
+
+    for (int p=pair_start[i]; p < pair_start[i + 1]; ++p) {
+        int j = pair_atom[p];
+        int* shift = pair_shift + p*3;
+
+        // same atom
+        if (!include_self && (i == j) && !(shift[0] || shift[1] || shift[2]))
+            continue;
+
+        for (int a=0; a < 3; ++a) {
+            total_shift[a] = shift[0]*cell[0][a] + shift[1]*cell[1][a] + shift[2]*cell[2][a]
+                             + cart[j][a] - cart[i][a];
+        }
+
+        tmp_r2 = total_shift[0]*total_shift[0] + total_shift[1]*total_shift[1] + total_shift[2]*total_shift[2];
+
+        if (tmp_r2 < cutoff_sqr) {
+            for (int a=0; a < 3; ++a)
+                nei_list_d[nneigh*4 + a] = total_shift[a];
+            nei_list_d[nneigh*4 + 3] = tmp_r2;
+            nei_list_i[nneigh*2]    = atom_i[j];
+            nei_list_i[nneigh*2 + 1] = j;
+            nneigh++;
+        }
+    }
+
+    return nneigh;
+}
+
+extern "C" long neighbor_pairs(double* cell, double* cart, double* scale, int* pbc_bools,
+                               int natoms, double cutoff, int* pair_i, int* pair_j,
+                               double* pair_d, long capacity) {
+    RowView<double> cell_rows(cell, 3, 3), cart_rows(cart, natoms, 3), scale_rows(scale, natoms, 3);
+    // the elements of the atoms are not needed for the pairs
+    std::vector<int> atom_i(natoms, 0);
+    CellList cell_list(cell_rows.ptr(), cart_rows.ptr(), scale_rows.ptr(), pbc_bools,
+                       atom_i.data(), natoms, cutoff);
+    int max_nneigh = cell_list.max_neighbors();
+    std::vector<double> nei_list_d(max_nneigh * 4);
+    std::vector<int> nei_list_i(max_nneigh * 2);
+
+    long npairs = 0;
+    for (int i=0; i < natoms; ++i) {
+        int nneigh = cell_list.find_neighbors(i, true, nei_list_d.data(), nei_list_i.data());
+        for (int j=0; j < nneigh; ++j, ++npairs) {
+            if (npairs >= capacity)
+                continue;
+            pair_i[npairs] = i;
+            pair_j[npairs] = nei_list_i[j*2 + 1];
+            for (int a=0; a < 3; ++a)
+                pair_d[npairs*3 + a] = nei_list_d[j*4 + a];
+        }
+    }
+    return npairs;
+}
+
+extern "C" NeighborList* new_neighbor_list(double skin) {
+    return new NeighborList(skin);
+}
+
+extern "C" void free_neighbor_list(NeighborList* neighbor_list) {
+    delete neighbor_list;
+}
+
+extern "C" int neighbor_list_num_builds(NeighborList* neighbor_list) {
+    return neighbor_list->num_builds();
+}
+
+NeighborSearch::NeighborSearch(NeighborList* neighbor_list, double** cell, double** cart, double** scale,
+                               int* pbc_bools, int* atom_i, int natoms, double cutoff)
+    : neighbor_list(neighbor_list), cell_list(NULL) {
+    if (neighbor_list != NULL)
+        neighbor_list->update(cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+    else
+        cell_list = new CellList(cell, cart, scale, pbc_bools, atom_i, natoms, cutoff);
+}
+
+NeighborSearch::~NeighborSearch() {
+    delete cell_list;
+}
+
+int NeighborSearch::max_neighbors() const {
+    if (neighbor_list != NULL)
+        return neighbor_list->max_neighbors();
+    return cell_list->max_neighbors();
+}
+
+int NeighborSearch::find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i) const {
+    if (neighbor_list != NULL)
+        return neighbor_list->find_neighbors(i, include_self, nei_list_d, nei_list_i);
+    return cell_list->find_neighbors(i, include_self, nei_list_d, nei_list_i);
+}
@@ -0,0 +1,135 @@
+/*
+ Linked-cell neighbor search shared by the descriptor kernels.
+ The cell is cut into bins that are at least one cutoff wide and the atoms are
+ sorted by bin once per structure, so the neighbors of a center atom are found
+ by visiting only the atoms of the surrounding bins. The cost per center atom
+ therefore does not grow with the size of the cell.
+ */
+
+#ifndef AMPTORCH_NEIGHBOR_LIST_H
+#define AMPTORCH_NEIGHBOR_LIST_H
+
+#include <stddef.h>
+
+class CellList {
+public:
+    // cell: cell vectors of the structure
+    // cart: cartesian coordinates of atoms
+    // scale: fractional coordinates of atoms (wrapped into [0, 1])
+    // pbc_bools: periodicity along each cell vector
+    // atom_i: atom type index of each atom
+    // cutoff: the largest cutoff radius used by the descriptor
+    CellList(double** cell, double** cart, double** scale, int* pbc_bools,
+             int* atom_i, int natoms, double cutoff);
+    ~CellList();
+
+    // upper bound of the number of neighbors of any center atom,
+    // used to size the neighbor buffers
+    int max_neighbors() const { return max_nneigh; }
+
+    // fill the neighbor list of atom i and return the number of neighbors.
+    // nei_list_d: [dx, dy, dz, r^2] of each neighbor (4 per neighbor)
+    // nei_list_i: [atom type index, atom index] of each neighbor (2 per neighbor)
+    // include_self: keep the center atom itself (r^2 = 0) in the list
+    // nei_shift: optional, cell shift of each neighbor (3 per neighbor)
+    int find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i,
+                       int* nei_shift = NULL) const;
+
+private:
+    double** cell;
+    double** cart;
+    int* pbc_bools;
+    int* atom_i;
+    int natoms;
+    double cutoff_sqr;
+
+    int nbins[3], bin_range[3], total_bins, max_nneigh;
+    // bin coordinates of each atom ([natoms * 3])
+    int* atom_bin;
+    // atoms sorted by bin, bin b holds bin_atoms[bin_start[b]:bin_start[b+1]]
+    int* bin_start;
+    int* bin_atoms;
+};
+
+/*
+ Verlet neighbor list kept between kernel calls on the same structure.
+ The pairs within cutoff + skin are stored with their cell shifts, and the
+ neighbors within the cutoff are filtered from them with the current positions.
+ The pairs are only searched again when an atom moved by more than half of the
+ skin since the last build, or when the cell, the periodicity, the atoms or the
+ cutoff changed, so the neighbor search is amortized over many steps of a
+ molecular dynamics run or a geometry optimization.
+ */
+class NeighborList {
+public:
+    NeighborList(double skin);
+    ~NeighborList();
+
+    // make the list valid for the structure, the arguments are the ones of
+    // CellList. returns true when the pairs were searched again
+    bool update(double** cell, double** cart, double** scale, int* pbc_bools,
+                int* atom_i, int natoms, double cutoff);
+
+    // same as CellList, for the structure of the last update
+    int max_neighbors() const { return max_nneigh; }
+    int find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i) const;
+
+    // number of times the pairs were searched
+    int num_builds() const { return builds; }
+
+private:
+    bool needs_build(double** cell, double** cart, int* pbc_bools,
+                     int* atom_i, int natoms, double cutoff) const;
+    void build(double** cell, double** cart, double** scale, int* pbc_bools,
+               int* atom_i, int natoms, double cutoff);
+    void clear();
+
+    double skin, cutoff, cutoff_sqr;
+    int natoms, max_nneigh, builds;
+    // structure of the last build
+    double ref_cell[3][3];
+    int ref_pbc[3];
+    double* ref_cart;
+    int* ref_atom_i;
+    // structure of the last update
+    double** cell;
+    double** cart;
+    int* atom_i;
+    // pairs within cutoff + skin, atom i holds the pairs pair_start[i] to
+    // pair_start[i+1], with the neighbor pair_atom and the cell shift pair_shift
+    int* pair_start;
+    int* pair_atom;
+    int* pair_shift;
+};
+
+// pairs of atoms of a structure closer than cutoff, each atom being paired
+// with itself, ordered by center atom. The arrays are the flat C ordered
+// buffers of numpy arrays: cell [3, 3], cart and scale [natoms, 3]. pair_i,
+// pair_j and pair_d ([dx, dy, dz] from i to j) are filled with up to capacity
+// pairs, the number of pairs is returned and the buffers are left incomplete
+// when it exceeds capacity
+extern "C" long neighbor_pairs(double* cell, double* cart, double* scale, int* pbc_bools,
+                               int natoms, double cutoff, int* pair_i, int* pair_j,
+                               double* pair_d, long capacity);
+
+extern "C" NeighborList* new_neighbor_list(double skin);
+extern "C" void free_neighbor_list(NeighborList* neighbor_list);
+extern "C" int neighbor_list_num_builds(NeighborList* neighbor_list);
+
+// neighbor search of a kernel call, from the Verlet list when one is given
+// and from a cell list built for this call otherwise
+class NeighborSearch {
+public:
+    NeighborSearch(NeighborList* neighbor_list, double** cell, double** cart, double** scale,
+                   int* pbc_bools, int* atom_i, int natoms, double cutoff);
+    ~NeighborSearch();
+
+    int max_neighbors() const;
+    int find_neighbors(int i, bool include_self, double* nei_list_d, int* nei_list_i) const;
+
+private:
+    NeighborList* neighbor_list;
+    CellList* cell_list;
+};
+
+#endif
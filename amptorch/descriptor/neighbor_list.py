@@ -0,0 +1,38 @@
+class NeighborList:
+    """
+    Verlet neighbor list of a structure that is fingerprinted repeatedly, e.g.
+    along a molecular dynamics run or a geometry optimization.
+
+    The pairs of atoms within the cutoff plus the skin are searched once and
+    reused by the descriptor kernels, they are only searched again when an
+    atom moved by more than half of the skin, or when the cell, the
+    periodicity or the atoms changed. A list holds a single structure, use
+    one list per trajectory.
+
+    Args:
+        skin [float] : distance added to the cutoff of the descriptor for the
+        stored pairs. Default to 1.0.
+    """
+
+    def __init__(self, skin=1.0):
+        if skin < 0.0:
+            raise ValueError("skin must be >= 0.")
+        self.skin = skin
+        self._c_lists = {}
+
+    def _get_c_list(self, ffi, lib):
+        # the descriptor libraries are built separately, each one keeps its
+        # own list
+        if lib not in self._c_lists:
+            self._c_lists[lib] = ffi.gc(
+                lib.new_neighbor_list(self.skin), lib.free_neighbor_list
+            )
+        return self._c_lists[lib]
+
+    @property
+    def num_builds(self):
+        # number of times the pairs were searched, over all the descriptors
+        return sum(
+            lib.neighbor_list_num_builds(c_list)
+            for lib, c_list in self._c_lists.items()
+        )
@@ -0,0 +1,23 @@
+/*
+ OpenMP helpers shared by the descriptor kernels.
+ The kernels split the center atoms over `cores` threads. When the extension
+ is built without OpenMP (e.g. with the default clang on macOS) the pragmas
+ are ignored and the kernels run serially.
+ */
+
+#ifndef AMPTORCH_PARALLEL_H
+#define AMPTORCH_PARALLEL_H
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+inline int get_thread_num() {
+#ifdef _OPENMP
+    return omp_get_thread_num();
+#else
+    return 0;
+#endif
+}
+
+#endif
@@ -0,0 +1,89 @@
+/*
+ Per-thread scratch space of the descriptor kernels.
+ Each thread allocates its buffers once, sized from the largest number of
+ neighbors of a center atom, and reuses them for every center atom and every
+ probe, so the loops over the center atoms do not touch the heap.
+ */
+
+#ifndef AMPTORCH_SCRATCH_H
+#define AMPTORCH_SCRATCH_H
+
+#include <string.h>
+#include <algorithm>
+#include <vector>
+#include "neighbor_list.h"
+
+// bump allocator over blocks of doubles, the arrays taken since the last
+// reset stay valid until the next reset. the first block holds the capacity
+// reserved by the kernel, the arrays beyond it are taken from new blocks and
+// the next reset merges the blocks, so that a miscounted size only costs an
+// allocation
+class ScratchArena {
+public:
+    explicit ScratchArena(long capacity) : blocks(1, std::vector<double>(capacity)), used(0), taken(0) {}
+
+    // zeroed array of n doubles
+    double* zeros(long n) {
+        if (used + n > (long) blocks.back().size()) {
+            blocks.emplace_back(std::max(n, (long) blocks.front().size()));
+            used = 0;
+        }
+        double* block = blocks.back().data() + used;
+        used += n;
+        taken += n;
+        memset(block, 0, n * sizeof(double));
+        return block;
+    }
+
+    void reset() {
+        if (blocks.size() > 1) {
+            blocks.assign(1, std::vector<double>(taken));
+        }
+        used = 0;
+        taken = 0;
+    }
+
+private:
+    std::vector<std::vector<double> > blocks;
+    // doubles taken from the last block, and from all the blocks
+    long used, taken;
+};
+
+// neighbors of a center atom stored by coordinate (structure of arrays), so
+// that the loops over the neighbors read contiguous memory
+class NeighborArrays {
+public:
+    explicit NeighborArrays(int max_nneigh)
+        : x(max_nneigh), y(max_nneigh), z(max_nneigh), r_sqr(max_nneigh), order(max_nneigh),
+          list_d(max_nneigh * 4), list_i(max_nneigh * 2) {}
+
+    // find the neighbors of atom i (including itself) and return their number.
+    // order holds the order of the element of each neighbor
+    int find(const NeighborSearch& search, int i, const int* element_index_to_order) {
+        int nneigh = search.find_neighbors(i, true, list_d.data(), list_i.data());
+        for (int j = 0; j < nneigh; ++j) {
+            x[j] = list_d[j*4];
+            y[j] = list_d[j*4+1];
+            z[j] = list_d[j*4+2];
+            r_sqr[j] = list_d[j*4+3];
+            order[j] = element_index_to_order[list_i[j*2]];
+        }
+        return nneigh;
+    }
+
+    // [atom type index, atom index] of each neighbor, as filled by the search
+    const int* atoms() const { return list_i.data(); }
+
+    // [x, y, z, squared distance] of each neighbor, as filled by the search
+    const double* displacements() const { return list_d.data(); }
+
+    // displacement from the center atom, squared distance and element order
+    std::vector<double> x, y, z, r_sqr;
+    std::vector<int> order;
+
+private:
+    std::vector<double> list_d;
+    std::vector<int> list_i;
+};
+
+#endif
@@ -7,16 +7,324 @@ from .constants import ATOM_INDEX_TO_SYMBOL_DICT, ATOM_SYMBOL_TO_INDEX_DICT
 # from ase.io.trajectory import Trajectory
 
 
-def _gen_2Darray_for_ffi(arr, ffi, cdata="double"):
-    # Function to generate 2D pointer for cffi
-    shape = arr.shape
-    arr_p = ffi.new(cdata + " *[%d]" % shape[0])
-    for i in range(shape[0]):
-        arr_p[i] = ffi.cast(cdata + " *", arr[i].ctypes.data)
-    return arr_p
+def _flat_array_for_ffi(arr, ffi, cdata="double"):
+    # Function to pass a C contiguous array to cffi without copying, the
+    # kernels take 2D arrays as a flat buffer and a row stride. The returned
+    # pointer keeps arr alive
+    return ffi.from_buffer(cdata + "[]", arr)
+
+
+def _fp_prime_buffer_to_numpy(buffer, ffi, lib):
+    # Function to copy the sparse derivatives written by a kernel into numpy
+    # arrays (value, row, col) and release the buffer
+    try:
+        if buffer.error:
+            raise MemoryError("Could not allocate the fingerprint derivatives!")
+        nnz = buffer.nnz
+        dtype = np.dtype(np.float32 if buffer.single else np.float64)
+        if nnz == 0:
+            return (
+                np.zeros(0, dtype=dtype),
+                np.zeros(0, dtype=np.intc),
+                np.zeros(0, dtype=np.intc),
+            )
+        val = np.frombuffer(ffi.buffer(buffer.val, nnz * dtype.itemsize), dtype=dtype)
+        row = np.frombuffer(ffi.buffer(buffer.row, nnz * 4), dtype=np.intc)
+        col = np.frombuffer(ffi.buffer(buffer.col, nnz * 4), dtype=np.intc)
+        return val.copy(), row.copy(), col.copy()
+    finally:
+        lib.free_fp_prime_buffer(buffer)
+
+
+def _atom_selection(atoms, natoms, element_index=None, atom_indices=None):
+    # indices of a selection of the atoms of an image (indices or a boolean
+    # mask), keeping the atoms of element_index only when it is given
+    atoms = np.asarray(atoms)
+    if atoms.dtype == bool:
+        if len(atoms) != natoms:
+            raise ValueError("An atom mask must have one entry per atom!")
+        atoms = np.flatnonzero(atoms)
+    atoms = atoms.astype(np.intc).reshape(-1)
+    if np.any(atoms < 0) or np.any(atoms >= natoms):
+        raise ValueError("Atom indices out of range!")
+    if len(np.unique(atoms)) != len(atoms):
+        raise ValueError("Atom indices must be unique!")
+    if element_index is not None:
+        atoms = atoms[atom_indices[atoms] == element_index]
+    return atoms
+
+
+class _ImageBatch:
+    """
+    Structures of a list of images concatenated for the batched kernels.
+    The center atoms are the atoms of one element, or all the atoms when
+    element_index is None, their indices are local to each image. The numpy
+    arrays are kept as attributes so that the pointers handed to the kernels
+    stay valid. neighbor_lists holds an optional NeighborList per image.
+    The fingerprints and their derivatives are returned as dtype (float64 or
+    float32), the kernels compute them in double precision in both cases.
+    center_atoms optionally restricts the center atoms of each image to the
+    given indices (None for all the atoms of an image), in that order.
+    free_atoms optionally restricts the derivatives of each image to the
+    columns of the given atoms (None for all the atoms of an image).
+    """
+
+    def __init__(
+        self,
+        images,
+        element_index,
+        ffi,
+        lib,
+        neighbor_lists=None,
+        dtype=np.float64,
+        center_atoms=None,
+        free_atoms=None,
+    ):
+        atom_indices = [
+            list_symbols_to_indices(image.get_chemical_symbols()) for image in images
+        ]
+        if element_index is None:
+            cal_atoms = [np.arange(len(indices)) for indices in atom_indices]
+        else:
+            cal_atoms = [
+                np.flatnonzero(indices == element_index) for indices in atom_indices
+            ]
+        if center_atoms is not None:
+            cal_atoms = [
+                atoms
+                if centers is None
+                else _atom_selection(centers, len(indices), element_index, indices)
+                for atoms, centers, indices in zip(
+                    cal_atoms, center_atoms, atom_indices
+                )
+            ]
+
+        self.num_images = len(images)
+        self.dtype = np.dtype(dtype)
+        self.atom_nums = [len(indices) for indices in atom_indices]
+        self.cal_nums = [len(indices) for indices in cal_atoms]
+        self.atom_offsets = np.cumsum([0] + self.atom_nums).astype(np.intc)
+        self.cal_offsets = np.cumsum([0] + self.cal_nums).astype(np.intc)
+        self.cal_total = int(self.cal_offsets[-1])
+
+        self.atom_indices = np.concatenate(atom_indices).astype(np.intc)
+        self.cal_atoms = np.concatenate(cal_atoms).astype(np.intc)
+        # the kernels expect C ordered rows. The cartesian positions are the
+        # wrapped scaled positions times the cell, so that an atom is binned
+        # by the neighbor search where it is, ase can wrap a scaled position
+        # to 1.0 and its cartesian position to the other side of the cell
+        scaled = [image.get_scaled_positions(wrap=True) for image in images]
+        self.scale = np.ascontiguousarray(np.concatenate(scaled))
+        self.cart = np.ascontiguousarray(
+            np.concatenate(
+                [
+                    pos @ image.cell.complete().array
+                    for pos, image in zip(scaled, images)
+                ]
+            )
+        )
+        self.cell = np.ascontiguousarray(
+            np.concatenate([np.array(image.cell) for image in images])
+        )
+        self.pbc = np.concatenate([image.get_pbc() for image in images]).astype(np.intc)
+
+        self.cart_p = _flat_array_for_ffi(self.cart, ffi)
+        self.scale_p = _flat_array_for_ffi(self.scale, ffi)
+        self.cell_p = _flat_array_for_ffi(self.cell, ffi)
+        self.pbc_p = ffi.cast("int *", self.pbc.ctypes.data)
+        self.atom_indices_p = ffi.cast("int *", self.atom_indices.ctypes.data)
+        self.atom_offsets_p = ffi.cast("int *", self.atom_offsets.ctypes.data)
+        self.cal_atoms_p = ffi.cast("int *", self.cal_atoms.ctypes.data)
+        self.cal_offsets_p = ffi.cast("int *", self.cal_offsets.ctypes.data)
+
+        # nonzero for the atoms whose derivative columns are kept
+        if free_atoms is None or all(free is None for free in free_atoms):
+            self.free_atom_mask = None
+        else:
+            self.free_atom_mask = np.ones(self.atom_offsets[-1], dtype=np.intc)
+            for k, free in enumerate(free_atoms):
+                if free is not None:
+                    mask = self.free_atom_mask[
+                        self.atom_offsets[k] : self.atom_offsets[k + 1]
+                    ]
+                    mask[:] = 0
+                    mask[_atom_selection(free, self.atom_nums[k])] = 1
+
+        if neighbor_lists is None or all(nl is None for nl in neighbor_lists):
+            self.neighbor_lists_p = ffi.NULL
+        else:
+            self.neighbor_lists_p = ffi.new(
+                "NeighborList *[]",
+                [
+                    ffi.NULL if nl is None else nl._get_c_list(ffi, lib)
+                    for nl in neighbor_lists
+                ],
+            )
+
+    def split(self, arr):
+        # split an array over the center atoms of all images per image
+        return [
+            arr[self.cal_offsets[k] : self.cal_offsets[k + 1]]
+            for k in range(self.num_images)
+        ]
+
+    def new_fp_prime_buffers(self, ffi):
+        # one derivative buffer per image, storing the values as self.dtype
+        buffers = ffi.new("FpPrimeBuffer[]", self.num_images)
+        for k in range(self.num_images):
+            buffers[k].single = int(self.dtype == np.float32)
+        self._set_free_atoms(ffi, buffers)
+        return buffers
+
+    def _set_free_atoms(self, ffi, buffers):
+        if self.free_atom_mask is None:
+            return
+        mask_p = ffi.cast("int *", self.free_atom_mask.ctypes.data)
+        for k in range(self.num_images):
+            buffers[k].free_atoms = mask_p + int(self.atom_offsets[k])
+
+    def new_force_buffers(self, ffi, fingerprint_grads, calc_virial=False):
+        # one buffer per image contracting the derivatives with the gradient
+        # of the energy with respect to the fingerprints of its center atoms
+        # ([# of center atoms, # of fingerprints]), into self.forces and, with
+        # calc_virial, into self.virials
+        self.fingerprint_grads = np.ascontiguousarray(
+            np.concatenate(fingerprint_grads), dtype=np.float64
+        )
+        if self.fingerprint_grads.shape[0] != self.cal_total:
+            raise ValueError("One gradient row per center atom is required!")
+        self.forces = np.zeros([self.atom_offsets[-1], 3], dtype=np.float64)
+        num = self.fingerprint_grads.shape[1]
+        grads_p = ffi.cast("double *", self.fingerprint_grads.ctypes.data)
+        forces_p = ffi.cast("double *", self.forces.ctypes.data)
+
+        self.virials = np.zeros([self.num_images, 3, 3], dtype=np.float64)
+        virials_p = ffi.cast("double *", self.virials.ctypes.data)
+
+        buffers = ffi.new("FpPrimeBuffer[]", self.num_images)
+        for k in range(self.num_images):
+            buffers[k].grad = grads_p + int(self.cal_offsets[k]) * num
+            buffers[k].forces = forces_p + int(self.atom_offsets[k]) * 3
+            if calc_virial:
+                buffers[k].virial = virials_p + k * 9
+        self._set_free_atoms(ffi, buffers)
+        return buffers
+
+    def force_results(self, calc_virial=False):
+        # forces contracted by the kernels ([# of atoms, 3]) of each image,
+        # and the virial of each image ([3, 3]) with calc_virial
+        forces = [
+            self.forces[self.atom_offsets[k] : self.atom_offsets[k + 1]]
+            for k in range(self.num_images)
+        ]
+        if calc_virial:
+            return forces, list(self.virials)
+        return forces
+
+    def fp_prime_buffers_to_numpy(self, buffers, ffi, lib):
+        # copy and release the derivative buffer of each image, all of them
+        # are released when one fails
+        try:
+            return [
+                _fp_prime_buffer_to_numpy(buffers + k, ffi, lib)
+                for k in range(self.num_images)
+            ]
+        finally:
+            for k in range(self.num_images):
+                lib.free_fp_prime_buffer(buffers + k)
+
+    def fingerprint_results(self, x, fp_primes=None):
+        # (size_info, fps, fp_primes_val, fp_primes_row, fp_primes_col,
+        # fp_primes_size) of each image, the derivatives are None when
+        # fp_primes is not given
+        num = x.shape[1]
+        x = x.astype(self.dtype, copy=False)
+        results = []
+        for k, fp in enumerate(self.split(x)):
+            atom_num, cal_num = self.atom_nums[k], self.cal_nums[k]
+            size_info = np.array([atom_num, cal_num, num])
+            if fp_primes is None:
+                results.append((size_info, fp, None, None, None, None))
+            else:
+                fp_prime_val, fp_prime_row, fp_prime_col = fp_primes[k]
+                results.append(
+                    (
+                        size_info,
+                        fp,
+                        fp_prime_val,
+                        fp_prime_row,
+                        fp_prime_col,
+                        np.array([cal_num * num, atom_num * 3]),
+                    )
+                )
+        return results
+
+
+def _neighbor_pairs(image, cutoff, ffi, lib):
+    # pairs of atoms of image closer than cutoff from the neighbor search of
+    # the kernels, each atom being paired with itself: the center atoms, the
+    # neighbors and the displacements from the centers to the neighbors
+    batch = _ImageBatch([image], None, ffi, lib)
+    natoms = len(image)
+    density = natoms / max(abs(image.cell.complete().volume), 1e-8)
+    capacity = int(natoms * (1.5 * 4.0 / 3.0 * np.pi * cutoff**3 * density + 8))
+    while True:
+        pair_i = np.empty(capacity, dtype=np.intc)
+        pair_j = np.empty(capacity, dtype=np.intc)
+        pair_d = np.empty([capacity, 3], dtype=np.float64)
+        npairs = lib.neighbor_pairs(
+            batch.cell_p,
+            batch.cart_p,
+            batch.scale_p,
+            batch.pbc_p,
+            natoms,
+            cutoff,
+            ffi.cast("int *", pair_i.ctypes.data),
+            ffi.cast("int *", pair_j.ctypes.data),
+            ffi.cast("double *", pair_d.ctypes.data),
+            capacity,
+        )
+        if npairs <= capacity:
+            return pair_i[:npairs], pair_j[:npairs], pair_d[:npairs]
+        capacity = npairs
+
+
+# the lengths (cell and positions, in Angstrom) are rounded to multiples of
+# HASH_RESOLUTION before hashing, so that the hash of an image does not depend
+# on the float noise below it, e.g. -0.0 or the last bits of a wrapped position
+HASH_RESOLUTION = 1e-10
+# hashed first, to be changed with the quantization or the layout of the bytes
+_HASH_VERSION = b"amptorch-geometry-2"
+
+
+def _quantize(lengths):
+    return np.rint(np.asarray(lengths, dtype=np.float64) / HASH_RESOLUTION).astype(
+        "<i8"
+    )
 
 
 def get_hash(image):
+    """
+    Hash of the geometry of image: the MD5 of the bytes of its pbc, cell,
+    atomic numbers and wrapped positions, the lengths rounded to multiples of
+    HASH_RESOLUTION. The arrays are hashed as little endian integers, so the
+    hash is the same on every platform.
+    """
+    try:
+        cell = image.cell.array
+    except AttributeError:  # older ASE
+        cell = image.cell
+    md5 = hashlib.md5(_HASH_VERSION)
+    md5.update(np.asarray(image.pbc, dtype=np.uint8).tobytes())
+    md5.update(_quantize(cell).tobytes())
+    md5.update(np.asarray(image.get_atomic_numbers(), dtype="<i4").tobytes())
+    md5.update(_quantize(image.get_positions(wrap=True)).tobytes())
+    return md5.hexdigest()
+
+
+def get_legacy_hash(image):
+    # hash of the fingerprint databases saved before get_hash, from the text
+    # of the geometry, only used to migrate them
     string = ""
     string += str(image.pbc)
     try:
@@ -37,12 +345,12 @@ def get_hash(image):
 
 
 def validate_image(image):
-    for number in image.get_scaled_positions(wrap=True).flatten():
-        if number > 1.0 or number < 0.0:
-            raise ValueError(
-                "****ERROR: scaled position not strictly between [0, 1]"
-                "Please check atom position and system cell size are set up correctly"
-            )
+    scaled_positions = image.get_scaled_positions(wrap=True)
+    if np.any((scaled_positions > 1.0) | (scaled_positions < 0.0)):
+        raise ValueError(
+            "****ERROR: scaled position not strictly between [0, 1]"
+            "Please check atom position and system cell size are set up correctly"
+        )
     return
 
 
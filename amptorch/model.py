@@ -177,19 +177,9 @@ class BPNN(nn.Module):
         if isinstance(batch, list):
             batch = batch[0]
         with torch.enable_grad():
-            atomic_numbers = batch.atomic_numbers
             fingerprints = batch.fingerprint
             fingerprints.requires_grad = True
-            image_idx = batch.batch
-            mask = self.element_mask(atomic_numbers)
-            o = torch.sum(
-                mask
-                * torch.cat(
-                    [net(fingerprints) for net in self.elementwise_models], dim=1
-                ),
-                dim=1,
-            )
-            energy = scatter(o, image_idx, dim=0)
+            energy = self.energy(batch, fingerprints)
 
             if self.get_forces:
                 gradients = grad(
@@ -208,6 +198,33 @@ class BPNN(nn.Module):
 
             return energy, forces
 
+    def atomic_energies(self, batch, fingerprints):
+        # energy of each atom of batch from its fingerprints
+        mask = self.element_mask(batch.atomic_numbers)
+        return torch.sum(
+            mask
+            * torch.cat([net(fingerprints) for net in self.elementwise_models], dim=1),
+            dim=1,
+        )
+
+    def energy(self, batch, fingerprints):
+        # energy of each image of batch from the fingerprints of its atoms
+        return scatter(self.atomic_energies(batch, fingerprints), batch.batch, dim=0)
+
+    def energy_gradients(self, batch):
+        """
+        Energy of each image of batch and its gradient with respect to the
+        fingerprints, with which the descriptor kernels contract the
+        fingerprint derivatives into the forces.
+        """
+        with torch.enable_grad():
+            fingerprints = batch.fingerprint.detach().requires_grad_()
+            energy = self.energy(batch, fingerprints)
+            gradients = grad(
+                energy, fingerprints, grad_outputs=torch.ones_like(energy)
+            )[0]
+        return energy.detach(), gradients
+
     @property
     def num_params(self):
         return sum(p.numel() for p in self.parameters())
@@ -281,10 +298,7 @@ class SingleNN(nn.Module):
         with torch.enable_grad():
             fingerprints = batch.fingerprint
             fingerprints.requires_grad = True
-            image_idx = batch.batch
-            sorted_image_idx = torch.unique_consecutive(image_idx)
-            o = torch.sum(self.model(fingerprints), dim=1)
-            energy = scatter(o, image_idx, dim=0)
+            energy = self.energy(batch, fingerprints)
 
             if self.get_forces:
                 gradients = grad(
@@ -303,6 +317,28 @@ class SingleNN(nn.Module):
 
             return energy, forces
 
+    def atomic_energies(self, batch, fingerprints):
+        # energy of each atom of batch from its fingerprints
+        return torch.sum(self.model(fingerprints), dim=1)
+
+    def energy(self, batch, fingerprints):
+        # energy of each image of batch from the fingerprints of its atoms
+        return scatter(self.atomic_energies(batch, fingerprints), batch.batch, dim=0)
+
+    def energy_gradients(self, batch):
+        """
+        Energy of each image of batch and its gradient with respect to the
+        fingerprints, with which the descriptor kernels contract the
+        fingerprint derivatives into the forces.
+        """
+        with torch.enable_grad():
+            fingerprints = batch.fingerprint.detach().requires_grad_()
+            energy = self.energy(batch, fingerprints)
+            gradients = grad(
+                energy, fingerprints, grad_outputs=torch.ones_like(energy)
+            )[0]
+        return energy.detach(), gradients
+
     @property
     def num_params(self):
         return sum(p.numel() for p in self.parameters())
@@ -1,4 +1,5 @@
 from .atoms_to_data import AtomsToData
+from .fingerprint_cache import FingerprintCache
 from .utils import (
     FeatureScaler,
     TargetScaler,
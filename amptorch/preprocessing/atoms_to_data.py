@@ -2,6 +2,7 @@ import ase.db.sqlite
 import ase.io.trajectory
 import numpy as np
 import torch
+from ase.constraints import FixAtoms
 from torch_geometric.data import Data
 
 from amptorch.descriptor.descriptor_calculator import DescriptorCalculator
@@ -25,19 +26,43 @@ class AtomsToData:
         save_fps=True,
         fprimes=True,
         cores=1,
+        free_atoms_only=False,
+        environment_tolerance=None,
     ):
+        """
+        free_atoms_only (bool): Only compute the fingerprint derivatives with
+        respect to the atoms not fixed by a FixAtoms constraint, the
+        derivative columns of the fixed atoms are left out. The target forces
+        of the fixed atoms are set to zero, as the ones predicted from the
+        derivatives.
+
+        environment_tolerance (float): Compute the fingerprints of the atoms
+        whose neighbors are the same up to a translation, to within this
+        tolerance (in Angstrom), only once, e.g. for the atoms of supercells.
+        By default the fingerprints of every atom are computed.
+        """
         self.r_energy = r_energy
         self.r_forces = r_forces
         self.descriptor = descriptor
         self.save_fps = save_fps
         self.fprimes = fprimes
         self.cores = cores
+        self.free_atoms_only = free_atoms_only
+        self.environment_tolerance = environment_tolerance
 
     def convert(
         self,
         atoms,
         idx,
+        neighbor_list=None,
+        center_atoms=None,
     ):
+        """
+        center_atoms (list of int or boolean mask): Optional atoms of the
+        structure to fingerprint, the rows of the fingerprints are then these
+        atoms in that order. By default all the atoms are fingerprinted.
+        """
+        free_atoms = self._free_atoms(atoms)
         descriptor_calculator = DescriptorCalculator(
             images=[atoms],
             descriptor=self.descriptor,
@@ -45,15 +70,49 @@ class AtomsToData:
             save_fps=self.save_fps,
             cores=self.cores,
             verbose=False,
+            neighbor_lists=[neighbor_list],
+            dtype=self._fp_dtype(),
+            center_atoms=[center_atoms],
+            free_atoms=[free_atoms],
+            environment_tolerance=self.environment_tolerance,
         )
         self.descriptor_data = descriptor_calculator.prepare_descriptors()
 
+        return self._to_data(atoms, self.descriptor_data[0], free_atoms)
+
+    def _free_atoms(self, atoms):
+        # mask of the atoms not fixed by a FixAtoms constraint when the
+        # derivatives are restricted to them, None for all the atoms
+        if not (self.fprimes and self.free_atoms_only):
+            return None
+        fixed = np.zeros(len(atoms), dtype=bool)
+        for constraint in atoms.constraints:
+            if isinstance(constraint, FixAtoms):
+                fixed[constraint.get_indices()] = True
+        if not fixed.any():
+            return None
+        return ~fixed
+
+    @staticmethod
+    def _fp_dtype():
+        # fingerprints are stored in the precision of the model, single
+        # precision halves their memory and disk footprint
+        if torch.get_default_dtype() == torch.float32:
+            return np.float32
+        return np.float64
+
+    def _to_data(self, atoms, image_data, free_atoms=None):
         natoms = len(atoms)
-        image_data = self.descriptor_data[0]
         atomic_numbers = torch.LongTensor(atoms.get_atomic_numbers())
         image_fingerprint = torch.tensor(
             image_data["descriptors"], dtype=torch.get_default_dtype()
         )
+        center_atoms = image_data.get("center_atoms")
+        if center_atoms is not None:
+            # the nodes are the center atoms, the derivative columns (and the
+            # forces) still span all the atoms
+            atomic_numbers = atomic_numbers[torch.LongTensor(center_atoms)]
+            natoms = len(center_atoms)
 
         # put the minimum data in torch geometric data object
         data = Data(
@@ -71,6 +130,8 @@ class AtomsToData:
                 atoms.get_forces(apply_constraint=False),
                 dtype=torch.get_default_dtype(),
             )
+            if free_atoms is not None:
+                forces[torch.from_numpy(~free_atoms)] = 0.0
             data.forces = forces
         if self.fprimes:
             fp_prime_val = image_data["descriptor_primes"]["val"]
@@ -93,6 +154,9 @@ class AtomsToData:
         self,
         atoms_collection,
         disable_tqdm=False,
+        batch_size=256,
+        neighbor_lists=None,
+        center_atoms=None,
     ):
         """Convert all atoms objects in a list or in an ase.db to graphs.
 
@@ -100,6 +164,16 @@ class AtomsToData:
             atoms_collection (list of ase.atoms.Atoms or ase.db.sqlite.SQLite3Database):
             Either a list of ASE atoms objects or an ASE database.
 
+            batch_size (int): Number of images fingerprinted together, the
+            fingerprints of a batch are computed with one kernel call.
+
+            neighbor_lists (list of amptorch.descriptor.neighbor_list.NeighborList):
+            Optional Verlet neighbor list of each structure, kept between calls
+            on moving atoms.
+
+            center_atoms (list of list of int): Optional atoms to fingerprint in
+            each structure (None for all the atoms of a structure), see convert.
+
         Returns:
             data_list (list of torch_geometric.data.Data):
             A list of torch geometric data objects containing molecular graph info and properties.
@@ -118,17 +192,64 @@ class AtomsToData:
 
         # list for all data
         data_list = []
-        for idx, atoms in tqdm(
-            enumerate(atoms_iter),
+        batch = []
+        start = 0
+        with tqdm(
             desc="converting ASE atoms collection to Data objects",
             total=len(atoms_collection),
             unit=" systems",
             disable=disable_tqdm,
-        ):
-            # check if atoms is an ASE Atoms object this for the ase.db case
-            if not isinstance(atoms, ase.atoms.Atoms):
-                atoms = atoms.toatoms()
-            data = self.convert(atoms, idx)
-            data_list.append(data)
+        ) as pbar:
+            for atoms in atoms_iter:
+                # check if atoms is an ASE Atoms object this for the ase.db case
+                if not isinstance(atoms, ase.atoms.Atoms):
+                    atoms = atoms.toatoms()
+                batch.append(atoms)
+                if len(batch) == batch_size:
+                    data_list += self._convert_batch(
+                        batch,
+                        self._batch_items(neighbor_lists, start, batch),
+                        self._batch_items(center_atoms, start, batch),
+                    )
+                    pbar.update(len(batch))
+                    start += len(batch)
+                    batch = []
+            if batch:
+                data_list += self._convert_batch(
+                    batch,
+                    self._batch_items(neighbor_lists, start, batch),
+                    self._batch_items(center_atoms, start, batch),
+                )
+                pbar.update(len(batch))
 
         return data_list
+
+    @staticmethod
+    def _batch_items(items, start, batch):
+        # entries of a per structure list (neighbor lists, center atoms) for
+        # the structures of a batch
+        if items is None:
+            return None
+        return items[start : start + len(batch)]
+
+    def _convert_batch(self, images, neighbor_lists=None, center_atoms=None):
+        free_atoms = [self._free_atoms(atoms) for atoms in images]
+        descriptor_calculator = DescriptorCalculator(
+            images=images,
+            descriptor=self.descriptor,
+            calc_derivatives=self.fprimes,
+            save_fps=self.save_fps,
+            cores=self.cores,
+            verbose=False,
+            neighbor_lists=neighbor_lists,
+            dtype=self._fp_dtype(),
+            center_atoms=center_atoms,
+            free_atoms=free_atoms,
+            environment_tolerance=self.environment_tolerance,
+        )
+        descriptor_data = descriptor_calculator.prepare_descriptors()
+
+        return [
+            self._to_data(atoms, image_data, free)
+            for atoms, image_data, free in zip(images, descriptor_data, free_atoms)
+        ]
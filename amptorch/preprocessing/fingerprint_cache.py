@@ -0,0 +1,94 @@
+"""
+In-memory cache of the data predicted on by a trainer, so that the geometries
+evaluated again (e.g. by an optimizer, a vibrational analysis or a NEB) are
+not fingerprinted again.
+"""
+
+from collections import OrderedDict
+
+import torch
+
+
+def _data_nbytes(data):
+    # bytes of the tensors of a torch geometric data object
+    nbytes = 0
+    for _, item in data:
+        if not torch.is_tensor(item):
+            continue
+        if item.is_sparse:
+            for tensor in (item._indices(), item._values()):
+                nbytes += tensor.element_size() * tensor.nelement()
+        else:
+            nbytes += item.element_size() * item.nelement()
+    return nbytes
+
+
+class FingerprintCache:
+    """
+    Least recently used cache of the data of images, with their scaled
+    fingerprints (and fingerprint derivatives) ready for collation, keyed by
+    the hash of their geometry.
+
+    Args:
+        max_bytes [int] : budget of the tensors held, the least recently used
+        data are evicted beyond it. The data larger than the budget are never
+        cached.
+
+    Attributes:
+        hits, misses, evictions [int] : counts of the lookups finding their
+        data, of the lookups missing it and of the data evicted.
+    """
+
+    def __init__(self, max_bytes):
+        if max_bytes <= 0:
+            raise ValueError("The fingerprint cache budget must be > 0 bytes.")
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """The data of key, None when it is not cached."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, data):
+        nbytes = _data_nbytes(data)
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (data, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        """Drop the cached data, the statistics are kept."""
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Hit and miss statistics and the memory held."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -120,7 +120,7 @@ class FeatureScaler:
                             element_fp * self.scales[element]["scale"]
                         ) + self.scales[element]["offset"]
                     fingerprint[element_idx] = element_fp
-                if self.forcetraining:
+                if self.forcetraining and hasattr(data, "fprimes"):
                     base_atoms = torch.repeat_interleave(
                         atomic_numbers, data.fingerprint.shape[1]
                     )
@@ -163,7 +163,7 @@ class FeatureScaler:
                     ]
                 data.fingerprint = fingerprint
 
-                if self.forcetraining:
+                if self.forcetraining and hasattr(data, "fprimes"):
                     fp_idx = data.fprimes._indices()[0]
                     fp_idx_to_scale = fp_idx % data.fingerprint.shape[1]
                     _values = data.fprimes._values()
@@ -179,6 +179,28 @@ class FeatureScaler:
 
         return data_list
 
+    def norm_gradients(self, gradients, atomic_numbers):
+        """
+        Gradient with respect to the unscaled fingerprints of an image from the
+        gradient with respect to its scaled fingerprints, the scaling applied
+        by norm to the fingerprint derivatives.
+        """
+        gradients = gradients.clone()
+        if self.elementwise:
+            for element in self.unique:
+                element_idx = torch.where(atomic_numbers == element)
+                scale = self.scales[element]["scale"]
+                if self.transform == "standardize":
+                    gradients[element_idx] /= scale
+                else:
+                    gradients[element_idx] *= scale
+        else:
+            if self.transform == "standardize":
+                gradients /= self.scale["scale"]
+            else:
+                gradients *= self.scale["scale"]
+        return gradients
+
 
 class TargetScaler:
     """
@@ -223,7 +245,7 @@ class TargetScaler:
     def denorm(self, tensor, pred="energy"):
         if pred == "energy":
             tensor = (tensor * self.target_std) + self.target_mean
-        elif pred == "forces":
+        elif pred in ("forces", "stress"):
             tensor = tensor * self.target_std
 
         return tensor
@@ -0,0 +1,399 @@
+import multiprocessing
+import os
+import tempfile
+import time
+
+import h5py
+import numpy as np
+import torch
+from ase import Atoms
+from ase.build import bulk, fcc111
+from ase.calculators.emt import EMT
+from ase.constraints import FixAtoms
+from scipy import sparse
+
+from amptorch.dataset import construct_descriptor
+from amptorch.descriptor.Gaussian import Gaussian
+from amptorch.descriptor.environment import EnvironmentClasses
+from amptorch.descriptor.fingerprint_store import FP_DATASET_KEYS, FingerprintStore
+from amptorch.descriptor.util import HASH_RESOLUTION, get_hash, get_legacy_hash
+from amptorch.preprocessing import AtomsToData
+
+Gs = {
+    "default": {
+        "G2": {"etas": [0.05, 0.5], "rs_s": [0]},
+        "G4": {"etas": [0.005], "zetas": [1.0, 4.0], "gammas": [1.0, -1.0]},
+        "cutoff": 6.0,
+    },
+}
+
+MCSHs = {
+    "MCSHs": {"orders": [0, 1, 2], "sigmas": [0.5, 1.0]},
+    "atom_gaussians": {
+        "C": "amptorch/tests/GMP_params/C_pseudodensity_4.g",
+        "O": "amptorch/tests/GMP_params/O_pseudodensity_4.g",
+        "Cu": "amptorch/tests/GMP_params/Cu_pseudodensity_4.g",
+    },
+    "cutoff": 6.0,
+}
+
+elements = ["Cu", "C", "O"]
+
+
+def get_images():
+    images = []
+    for dist in np.linspace(1.5, 3.0, 5):
+        image = Atoms(
+            "CuCO",
+            [(-dist, 0.5, 0.2), (0, 0, 0), (dist, 0.3, 0)],
+            cell=[10, 10, 10],
+            pbc=True,
+        )
+        image.wrap()
+        images.append(image)
+    # images without some of the elements and a periodic crystal
+    images.append(Atoms("CO", [(0, 0, 0), (1.2, 0, 0)], cell=[8, 8, 8]))
+    crystal = bulk("Cu", "fcc", a=3.6, cubic=True)
+    crystal.rattle(0.05, seed=1)
+    crystal.wrap()
+    images.append(crystal)
+    return images
+
+
+def test_batch_fingerprints():
+    images = get_images()
+    for descriptor_setup in [
+        ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements),
+        ("gmpordernorm", MCSHs, {}, elements),
+    ]:
+        a2d = AtomsToData(
+            descriptor=construct_descriptor(descriptor_setup),
+            save_fps=False,
+            fprimes=True,
+        )
+        # one image at a time vs. all the images fingerprinted together
+        single = [a2d.convert(image, idx) for idx, image in enumerate(images)]
+        batched = a2d.convert_all(images, disable_tqdm=True, batch_size=4)
+
+        assert len(single) == len(batched)
+        for data_single, data_batched in zip(single, batched):
+            assert torch.equal(data_single.fingerprint, data_batched.fingerprint)
+            assert torch.equal(
+                data_single.fprimes.to_dense(), data_batched.fprimes.to_dense()
+            ), "Batched fingerprint derivatives are inconsistent!"
+
+
+def test_image_fingerprints():
+    # the elements have different numbers of symmetry functions, all the
+    # atoms of an image are computed together and the rows are padded
+    Gs_elements = {
+        "Cu": {"G2": {"etas": [0.05, 0.5], "rs_s": [0]}, "cutoff": 5.0},
+        "default": Gs["default"],
+    }
+    descriptor = Gaussian(Gs=Gs_elements, elements=elements)
+    image = get_images()[0]
+    symbols = np.array(image.get_chemical_symbols())
+
+    (result,) = descriptor.calculate_image_fingerprints_batch(
+        [image], calc_derivatives=True, log=None
+    )
+    _, fps, val, row, col, size = result
+    fp_primes = sparse.coo_matrix((val, (row, col)), shape=tuple(size)).toarray()
+    num_desc_max = fps.shape[1]
+
+    for element in elements:
+        _, element_fps, val, row, col, size = descriptor.calculate_fingerprints(
+            image, element, calc_derivatives=True, log=None
+        )
+        element_fp_primes = sparse.coo_matrix((val, (row, col)), shape=tuple(size))
+        index_arr = np.flatnonzero(symbols == element)
+        num_desc = descriptor.get_num_descriptors(element)
+        rows = (index_arr[:, None] * num_desc_max + np.arange(num_desc)).flatten()
+
+        assert np.array_equal(fps[index_arr, :num_desc], element_fps)
+        assert not np.any(fps[index_arr, num_desc:])
+        assert np.array_equal(fp_primes[rows], element_fp_primes.toarray())
+
+
+def test_single_precision_fingerprints():
+    images = get_images()
+    for descriptor_setup in [
+        ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements),
+        ("gmpordernorm", MCSHs, {}, elements),
+    ]:
+        a2d = AtomsToData(
+            descriptor=construct_descriptor(descriptor_setup),
+            save_fps=False,
+            fprimes=True,
+        )
+        # the precision follows the default dtype of torch
+        default_dtype = torch.get_default_dtype()
+        try:
+            torch.set_default_dtype(torch.float64)
+            double = a2d.convert_all(images, disable_tqdm=True)
+            torch.set_default_dtype(torch.float32)
+            single = a2d.convert_all(images, disable_tqdm=True)
+        finally:
+            torch.set_default_dtype(default_dtype)
+
+        for data_double, data_single in zip(double, single):
+            assert data_single.fingerprint.dtype == torch.float32
+            assert data_single.fprimes.dtype == torch.float32
+            assert torch.allclose(
+                data_single.fingerprint.double(),
+                data_double.fingerprint,
+                rtol=1e-6,
+                atol=1e-7,
+            )
+            assert torch.allclose(
+                data_single.fprimes.to_dense().double(),
+                data_double.fprimes.to_dense(),
+                rtol=1e-6,
+                atol=1e-7,
+            ), "Single precision fingerprint derivatives are inconsistent!"
+
+
+def test_restricted_fingerprints():
+    # a slab with fixed bottom layers, the fingerprints of a few center atoms
+    # and the derivatives with respect to the free atoms are a subset of the
+    # full ones
+    slab = fcc111("Cu", (2, 2, 4), vacuum=6.0)
+    slab.rattle(0.05, seed=1)
+    slab.symbols[[12, 15]] = "O"
+    slab.set_constraint(FixAtoms(indices=[atom.index for atom in slab if atom.tag > 2]))
+    slab.calc = EMT()
+    free = np.array([atom.tag <= 2 for atom in slab])
+    centers = [13, 12, 2]
+    free_columns = np.repeat(free, 3)
+
+    for descriptor_setup in [
+        ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements),
+        ("gmpordernorm", MCSHs, {}, elements),
+    ]:
+        a2d = AtomsToData(
+            descriptor=construct_descriptor(descriptor_setup),
+            r_forces=True,
+            save_fps=False,
+            fprimes=True,
+        )
+        full = a2d.convert(slab, 0)
+        a2d.free_atoms_only = True
+        restricted, free_only = a2d.convert_all(
+            [slab, slab], disable_tqdm=True, center_atoms=[centers, None]
+        )
+
+        num = full.fingerprint.shape[1]
+        rows = (np.array(centers)[:, None] * num + np.arange(num)).flatten()
+        fp_primes = full.fprimes.to_dense()
+        assert torch.equal(restricted.fingerprint, full.fingerprint[centers])
+        assert torch.equal(restricted.atomic_numbers, full.atomic_numbers[centers])
+        assert torch.equal(
+            restricted.fprimes.to_dense(),
+            fp_primes[rows] * torch.from_numpy(free_columns),
+        )
+        assert torch.equal(
+            free_only.fprimes.to_dense(), fp_primes * torch.from_numpy(free_columns)
+        )
+        assert torch.equal(free_only.forces[free], full.forces[free])
+        assert not torch.any(free_only.forces[~free])
+
+        # the contracted forces of the fixed atoms are left at zero
+        grads = np.random.RandomState(0).rand(*full.fingerprint.shape)
+        (forces,) = a2d.descriptor.calculate_image_forces_batch([slab], [grads])
+        (free_forces,) = a2d.descriptor.calculate_image_forces_batch(
+            [slab], [grads], free_atoms=[free]
+        )
+        assert np.allclose(free_forces, np.where(free[:, None], forces, 0.0))
+
+
+def test_environment_deduplication():
+    # the fingerprints of the atoms with the same environment up to a
+    # translation are computed once, and equal the ones of every atom
+    cell = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((3, 3, 3))
+    assert EnvironmentClasses(cell, 6.0, 1e-6).num_classes == 1
+    cell.symbols[5] = "O"
+    cell.calc = EMT()
+    slab = fcc111("Cu", (3, 3, 4), vacuum=6.0)
+    slab.symbols[0] = "O"
+    slab.set_constraint(FixAtoms(indices=[atom.index for atom in slab if atom.tag > 3]))
+    slab.calc = EMT()
+
+    for descriptor_setup in [
+        ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements),
+        ("gmpordernorm", MCSHs, {}, elements),
+    ]:
+        descriptor = construct_descriptor(descriptor_setup)
+        a2d = AtomsToData(
+            descriptor=descriptor, save_fps=False, fprimes=True, free_atoms_only=True
+        )
+        images = [cell, slab, slab]
+        center_atoms = [None, None, [30, 3, 21, 12, 0]]
+        full = a2d.convert_all(images, disable_tqdm=True, center_atoms=center_atoms)
+        a2d.environment_tolerance = 1e-6
+        dedup = a2d.convert_all(images, disable_tqdm=True, center_atoms=center_atoms)
+        for image, data, dedup_data in zip(images, full, dedup):
+            assert torch.allclose(dedup_data.fingerprint, data.fingerprint)
+            assert torch.allclose(
+                dedup_data.fprimes.to_dense(), data.fprimes.to_dense()
+            )
+            classes = EnvironmentClasses(
+                image, descriptor.get_cutoff(), 1e-6, free_atoms=a2d._free_atoms(image)
+            )
+            assert classes.num_classes < len(image)
+
+
+def _read_store(path, image_hashes, hits):
+    # reader of a store in another process
+    results = FingerprintStore(path).get_many(image_hashes, True, np.float64)
+    hits.value = sum(result is not None for result in results)
+
+
+def test_fingerprint_store():
+    # the fingerprints of all the images of a descriptor setup are saved in a
+    # single store, from which they are loaded by later calls and read by
+    # other processes
+    images = get_images()
+    kwargs = dict(save_fps=True, verbose=False, cores=1, log=None)
+    with tempfile.TemporaryDirectory() as tmp:
+        descriptor = construct_descriptor(
+            ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements)
+        )
+        descriptor.fp_database = tmp
+        computed = descriptor.prepare_fingerprints(
+            images[:-1], calc_derivatives=True, **kwargs
+        )
+        store = descriptor.fp_store
+        assert len(store) == len(images) - 1
+        assert not any(
+            name.endswith(".h5") for name in os.listdir(descriptor.desc_fp_database_dir)
+        )
+
+        # an image saved in its own file by an earlier version, in a group per
+        # element, is migrated
+        legacy_image = Atoms(
+            "OCuCCuO",
+            [(0, 0, 0), (1.2, 0.3, 0), (2.5, 0, 0.4), (3.6, 0.2, 0), (4.8, 0, 0)],
+            cell=[10, 10, 10],
+            pbc=True,
+        )
+        filename = os.path.join(
+            descriptor.desc_fp_database_dir, get_legacy_hash(legacy_image) + ".h5"
+        )
+        with h5py.File(filename, "w") as db:
+            snapshot = db.create_group("0")
+            for element in ["Cu", "C", "O"]:
+                group = snapshot.create_group(element)
+                result = descriptor.calculate_fingerprints(
+                    legacy_image, element, calc_derivatives=True, log=None
+                )
+                for key, data in zip(FP_DATASET_KEYS, result):
+                    group.create_dataset(key, data=data)
+        expected = descriptor.calculate_image_fingerprints_batch(
+            [legacy_image], calc_derivatives=True, log=None
+        )[0]
+
+        descriptor = construct_descriptor(
+            ("gaussian", Gs, {"cutoff_func": "Cosine"}, elements)
+        )
+        descriptor.fp_database = tmp
+
+        def no_kernels(*args, **kwargs):
+            raise AssertionError("the fingerprints should be loaded")
+
+        descriptor.calculate_image_fingerprints_batch = no_kernels
+        loaded = descriptor.prepare_fingerprints(
+            images[:-1] + [legacy_image], calc_derivatives=True, **kwargs
+        )
+        for image_dict, computed_dict in zip(loaded, computed):
+            assert np.array_equal(
+                image_dict["descriptors"], computed_dict["descriptors"]
+            )
+        migrated = loaded[-1]
+        assert np.array_equal(migrated["descriptors"], expected[1])
+        primes = migrated["descriptor_primes"]
+        assert np.array_equal(primes["size"], expected[5])
+        assert np.allclose(
+            sparse.coo_matrix(
+                (primes["val"], (primes["row"], primes["col"])),
+                shape=tuple(primes["size"]),
+            ).toarray(),
+            sparse.coo_matrix(
+                (expected[2], (expected[3], expected[4])), shape=tuple(expected[5])
+            ).toarray(),
+        )
+        assert len(descriptor.fp_store) == len(images)
+
+        context = multiprocessing.get_context("spawn")
+        hits = context.Value("i", 0)
+        reader = context.Process(
+            target=_read_store,
+            args=(
+                descriptor.fp_store.path,
+                [get_hash(image) for image in images[:-1] + [legacy_image]],
+                hits,
+            ),
+        )
+        reader.start()
+        reader.join()
+        assert hits.value == len(images)
+
+    # the records queued for the writer thread are read back before they are
+    # written, put_many blocks while the queue is full
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FingerprintStore(os.path.join(tmp, "fingerprints.lmdb"))
+        store.max_pending = 1
+        image_hashes = [str(k) for k in range(20)]
+        primes = (np.ones(1), np.zeros(1, np.intc), np.zeros(1, np.intc), [3, 3])
+        for image_hash in image_hashes:
+            fps = np.full((1, 3), float(image_hash))
+            store.put_many([image_hash], [(np.array([1, 1, 3]), fps) + primes])
+            result = store.get_many([image_hash], True, np.float64)[0]
+            assert np.array_equal(result[1], fps)
+        store.flush()
+        assert not store._pending
+
+        context = multiprocessing.get_context("spawn")
+        hits = context.Value("i", 0)
+        reader = context.Process(
+            target=_read_store, args=(store.path, image_hashes, hits)
+        )
+        reader.start()
+        reader.join()
+        assert hits.value == len(image_hashes)
+
+        # a map filled by the writer thread is only grown once the
+        # transactions of the other threads are done
+        store = FingerprintStore(os.path.join(tmp, "small.lmdb"))
+        store.map_size = 2**16
+        fps = np.ones((1, 2**14))
+        with store._transaction(buffers=True):
+            store.put_many(["large"], [(np.array([1, 1, 2**14]), fps) + primes])
+            time.sleep(0.5)
+            assert store._environment()[0].info()["map_size"] == 2**16
+        store.flush()
+        assert store._environment()[0].info()["map_size"] > 2**16
+        reader = context.Process(target=_read_store, args=(store.path, ["large"], hits))
+        reader.start()
+        reader.join()
+        assert hits.value == 1
+
+
+def test_geometry_hash():
+    # the hash is unchanged by a lattice translation or by a displacement much
+    # smaller than HASH_RESOLUTION, and changed by an element
+    image = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 2, 2))
+    image.rattle(0.05, seed=1)
+    image_hash = get_hash(image)
+    translated = image.copy()
+    translated.positions[3] += translated.cell[0] - translated.cell[2]
+    assert get_hash(translated) == image_hash
+    moved = image.copy()
+    moved.positions[0, 0] = HASH_RESOLUTION * np.rint(
+        moved.positions[0, 0] / HASH_RESOLUTION
+    )
+    noisy = moved.copy()
+    noisy.positions[0, 0] += 1e-3 * HASH_RESOLUTION
+    assert get_hash(noisy) == get_hash(moved)
+    substituted = image.copy()
+    substituted.numbers[5] = 79
+    assert get_hash(substituted) != image_hash
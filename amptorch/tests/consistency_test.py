@@ -1,8 +1,10 @@
 import numpy as np
 import torch
 from ase import Atoms
+from ase.build import bulk
 from ase.calculators.emt import EMT
-from amptorch import AtomsTrainer, AmpTorch
+from amptorch import AtomsTrainer, AmpTorch, IncrementalEnergy
+from amptorch.preprocessing import FingerprintCache
 
 
 # adapted from https://gitlab.com/ase/ase/-/blob/master/ase/calculators/test.py#L186-202
@@ -155,6 +157,153 @@ def test_energy_force_consistency():
         f, fn = gradient_test(image)
 
 
+def test_incremental_energy():
+    """Energies of Monte Carlo trials updated from the moved atoms match the
+    energies predicted from all the atoms."""
+    rng = np.random.RandomState(0)
+    cell = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((3, 3, 3))
+    cell.symbols[rng.choice(len(cell), 20, replace=False)] = "Pd"
+    images = []
+    for _ in range(3):
+        image = cell.copy()
+        image.rattle(0.05, seed=rng.randint(1000))
+        image.set_calculator(EMT())
+        images.append(image)
+
+    Gs = {
+        "default": {
+            "G2": {"etas": [0.2, 1.0], "rs_s": [0]},
+            "G4": {"etas": [0.4], "zetas": [1], "gammas": [1, -1]},
+            "cutoff": 4.0,
+        },
+    }
+    config = {
+        "model": {"get_forces": False, "num_layers": 2, "num_nodes": 5},
+        "optim": {"lr": 1e-2, "batch_size": 32, "epochs": 2, "gpus": 0},
+        "dataset": {
+            "raw_data": images,
+            "val_split": 0,
+            "fp_scheme": "gaussian",
+            "fp_params": Gs,
+            "save_fps": False,
+            "scaling": {"type": "normalize", "range": (-1, 1)},
+        },
+        "cmd": {
+            "debug": False,
+            "run_dir": "./",
+            "seed": 1,
+            "identifier": "test",
+            "verbose": False,
+            "logger": False,
+            "dtype": torch.DoubleTensor,
+        },
+    }
+
+    torch.set_num_threads(1)
+    trainer = AtomsTrainer(config)
+    trainer.train()
+    evaluator = IncrementalEnergy(trainer)
+
+    atoms = images[0].copy()
+    state = evaluator.evaluate(atoms)
+    assert np.isclose(state.energy, trainer.predict([atoms])["energy"][0])
+    for trial in range(6):
+        previous = atoms.copy()
+        moved = rng.choice(len(atoms), trial % 3 + 1, replace=False)
+        if trial == 3:
+            # swap move, the elements of two atoms are exchanged
+            atoms.numbers[moved] = atoms.numbers[moved[::-1]]
+        else:
+            atoms.positions[moved] += rng.uniform(-0.3, 0.3, (len(moved), 3))
+        new_state = evaluator.update(state, atoms, moved)
+        energy = trainer.predict([atoms])["energy"][0]
+        assert np.isclose(new_state.energy, energy, rtol=0, atol=1e-8), trial
+        if trial % 2:
+            # rejected, the previous state is kept
+            atoms = previous
+        else:
+            state = new_state
+    # the moved atoms found by comparing with the previous state
+    atoms.positions[7] += 0.2
+    energy = trainer.predict([atoms])["energy"][0]
+    assert np.isclose(evaluator.update(state, atoms).energy, energy, atol=1e-8)
+
+    # the descriptor, the converter and the fingerprint cache are the ones of
+    # the predictions of the trainer
+    assert evaluator.descriptor is trainer.descriptor
+    assert evaluator.a2d is trainer.predict_converters[False, False]
+    trainer.fp_cache = FingerprintCache(2**20)
+    state = evaluator.evaluate(atoms)
+    energy = trainer.predict([atoms])["energy"][0]
+    assert np.isclose(state.energy, energy, rtol=0, atol=1e-8)
+    assert trainer.fp_cache.hits == 1
+    atoms.positions[3] += 0.2
+    for _ in range(2):
+        new_state = evaluator.update(state, atoms, [3])
+    assert trainer.fp_cache.hits == 2
+    energy = trainer.predict([atoms])["energy"][0]
+    assert np.isclose(new_state.energy, energy, rtol=0, atol=1e-8)
+
+
+def test_fingerprint_cache():
+    """Predictions on geometries seen before use the cached data and match the
+    ones computed again."""
+    images = []
+    for seed in range(3):
+        image = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 2, 2))
+        image.rattle(0.05, seed=seed)
+        image.set_calculator(EMT())
+        images.append(image)
+
+    Gs = {
+        "default": {
+            "G2": {"etas": [0.2, 1.0], "rs_s": [0]},
+            "G4": {"etas": [0.4], "zetas": [1], "gammas": [1, -1]},
+            "cutoff": 4.0,
+        },
+    }
+    config = {
+        "model": {"get_forces": True, "num_layers": 2, "num_nodes": 5},
+        "optim": {"lr": 1e-2, "batch_size": 32, "epochs": 2, "gpus": 0},
+        "dataset": {
+            "raw_data": images,
+            "val_split": 0,
+            "fp_scheme": "gaussian",
+            "fp_params": Gs,
+            "save_fps": False,
+            "fp_cache_size": 2**20,
+        },
+        "cmd": {
+            "debug": False,
+            "run_dir": "./",
+            "seed": 1,
+            "identifier": "test",
+            "verbose": False,
+            "logger": False,
+            "dtype": torch.DoubleTensor,
+        },
+    }
+
+    trainer = AtomsTrainer(config)
+    trainer.train()
+    cache = trainer.fp_cache
+    first = trainer.predict(images[:2])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 2)
+    again = trainer.predict(images[::-1])
+    assert (cache.hits, cache.misses, len(cache)) == (2, 3, 3)
+    for k in range(2):
+        assert np.allclose(first["energy"][k], again["energy"][2 - k])
+        assert np.allclose(first["forces"][k], again["forces"][2 - k])
+
+    # the least recently used data are evicted beyond the budget
+    trainer.fp_cache = FingerprintCache(cache.nbytes // 3 * 2)
+    trainer.predict(images)
+    trainer.predict(images[2:])
+    stats = trainer.fp_cache.stats()
+    assert (stats["hits"], stats["entries"], stats["evictions"]) == (1, 2, 1)
+    assert stats["nbytes"] <= stats["max_bytes"]
+
+
 if __name__ == "__main__":
     print("\n\n--------- Gaussian Consistency Test ---------\n")
     test_energy_force_consistency()
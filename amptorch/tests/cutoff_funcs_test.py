@@ -2,8 +2,11 @@ import copy
 import numpy as np
 import torch
 from ase import Atoms
+from ase.build import bulk
 from ase.calculators.emt import EMT
+from scipy import sparse
 
+from amptorch.descriptor.Gaussian import Gaussian
 from amptorch.trainer import AtomsTrainer
 
 ### Construct test data
@@ -113,6 +116,38 @@ def test_cutoff_funcs():
     print("E_MAE: %f, F_MAE: %f" % get_performance_metrics(config_2))
 
 
+def test_tabulated_cutoff_funcs():
+    # the interpolated radial parts must reproduce the exact fingerprints and
+    # derivatives, up to the tolerance times the number of neighbors
+    atoms = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 2, 1))
+    atoms.rattle(0.1, seed=1)
+    atoms.symbols[[0, 5]] = "O"
+    tab_Gs = copy.deepcopy(Gs)
+    tab_Gs["default"]["G2"]["rs_s"] = [0, 1.5]
+    tab_Gs["default"]["G5"] = {"etas": [0.005], "zetas": [2.0], "gammas": [1.0, -1.0]}
+
+    def get_fingerprints(descriptor):
+        (
+            (_, fps, val, row, col, size),
+        ) = descriptor.calculate_image_fingerprints_batch([atoms], True, None)
+        return fps, sparse.coo_matrix((val, (row, col)), shape=tuple(size)).toarray()
+
+    for cutoff_params in [
+        {"cutoff_func": "cosine"},
+        {"cutoff_func": "polynomial", "gamma": 2.0},
+    ]:
+        exact = Gaussian(tab_Gs, ["Cu", "O"], **cutoff_params)
+        tabulated = Gaussian(
+            tab_Gs, ["Cu", "O"], tabulation_tolerance=1e-8, **cutoff_params
+        )
+        assert exact.descriptor_setup_hash != tabulated.descriptor_setup_hash
+        exact_fps, exact_primes = get_fingerprints(exact)
+        fps, primes = get_fingerprints(tabulated)
+        assert np.allclose(fps, exact_fps, rtol=0.0, atol=1e-6)
+        assert np.allclose(primes, exact_primes, rtol=0.0, atol=1e-6)
+
+
 if __name__ == "__main__":
     print("\n\n--------- Gaussian Cutoff Functions Test ---------\n")
     test_cutoff_funcs()
+    test_tabulated_cutoff_funcs()
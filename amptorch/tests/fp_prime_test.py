@@ -0,0 +1,210 @@
+import multiprocessing
+import resource
+
+import numpy as np
+from ase import Atoms
+from ase.build import bulk
+from scipy import sparse
+
+from amptorch.descriptor.GMPOrderNorm import GMPOrderNorm
+
+
+def get_descriptor(square, prime_threshold):
+    MCSHs = {
+        "MCSHs": {"orders": [0, 1, 2], "sigmas": [0.5, 1.0]},
+        "atom_gaussians": {"Cu": "amptorch/tests/GMP_params/Cu_pseudodensity_4.g"},
+        "cutoff": 6.0,
+        "square": square,
+        "prime_threshold": prime_threshold,
+    }
+    return GMPOrderNorm(MCSHs, ["Cu"])
+
+
+def get_fp_primes(descriptor, atoms):
+    _, fps, val, row, col, size = descriptor.calculate_fingerprints(
+        atoms, "Cu", calc_derivatives=True, log=None
+    )
+    return fps, sparse.coo_matrix((val, (row, col)), shape=tuple(size))
+
+
+def numeric_fp_primes(descriptor, atoms, d=1e-5):
+    num_fps = len(atoms) * descriptor.params_set["num"]
+    fp_primes = np.zeros((num_fps, len(atoms) * 3))
+    for a in range(len(atoms)):
+        for i in range(3):
+            displaced = []
+            for step in [d, -d]:
+                image = atoms.copy()
+                image.positions[a, i] += step
+                _, fps, _, _, _, _ = descriptor.calculate_fingerprints(
+                    image, "Cu", calc_derivatives=False, log=None
+                )
+                displaced.append(fps.flatten())
+            fp_primes[:, a * 3 + i] = (displaced[0] - displaced[1]) / (2 * d)
+    return fp_primes
+
+
+def test_fp_primes():
+    # the cell is smaller than the cutoff, so the neighbor lists contain
+    # several periodic images of the same atom
+    atoms = bulk("Cu", "fcc", a=3.6, cubic=True)
+    atoms.rattle(0.1, seed=1)
+
+    for square in [True, False]:
+        descriptor = get_descriptor(square, prime_threshold=0.0)
+        _, fp_primes = get_fp_primes(descriptor, atoms)
+        assert np.allclose(
+            fp_primes.toarray(),
+            numeric_fp_primes(descriptor, atoms),
+            rtol=1e-5,
+            atol=1e-5,
+        ), "Fingerprint derivatives are inconsistent!"
+
+    # entries below the threshold are dropped by the kernel, the screened
+    # overlaps change the others by about the threshold
+    threshold = 1e-2
+    _, all_primes = get_fp_primes(get_descriptor(True, 0.0), atoms)
+    _, kept_primes = get_fp_primes(get_descriptor(True, threshold), atoms)
+    all_primes = all_primes.toarray()
+    assert np.all(np.abs(kept_primes.data) >= threshold)
+    assert np.allclose(
+        kept_primes.toarray(),
+        np.where(np.abs(all_primes) >= threshold, all_primes, 0.0),
+        rtol=0.0,
+        atol=2 * threshold,
+    )
+
+
+def test_fp_primes_cores():
+    # the center atoms are split over the threads, the results must not
+    # depend on the number of threads
+    atoms = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 2, 1))
+    atoms.rattle(0.1, seed=2)
+    descriptor = get_descriptor(True, prime_threshold=0.0)
+
+    results = []
+    for cores in [1, 3]:
+        _, fps, val, row, col, _ = descriptor.calculate_fingerprints(
+            atoms, "Cu", calc_derivatives=True, log=None, cores=cores
+        )
+        results.append((fps, val, row, col))
+
+    for serial, threaded in zip(*results):
+        assert np.array_equal(serial, threaded), "Threaded fingerprints differ!"
+
+
+def test_force_contraction():
+    # the forces contracted by the kernels from the gradient of the energy with
+    # respect to the fingerprints match the product with the stored derivatives,
+    # all of them being contracted
+    images = [bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 1, 1)) for _ in range(2)]
+    for seed, atoms in enumerate(images):
+        atoms.rattle(0.1, seed=seed)
+
+    for square in [True, False]:
+        descriptor = get_descriptor(square, prime_threshold=1e-5)
+        # the overlaps are screened by the threshold, the derivatives are
+        # stored without dropping any
+        descriptor.params_set["prime_threshold"] = 0.0
+        results = descriptor.calculate_image_fingerprints_batch(images, True, None)
+        descriptor.params_set["prime_threshold"] = 1e-5
+        # the fingerprints the gradient is taken at (computed without the
+        # derivatives) are the ones of the derivative kernel, including the
+        # norms zeroed below 1e-2 without square
+        fps = descriptor.calculate_image_fingerprints_batch(images, False, None)
+        for result, image_fps in zip(results, fps):
+            assert np.array_equal(result[1], image_fps[1]), "Fingerprints differ!"
+        if not square:
+            assert any(np.any(result[1] == 0.0) for result in results)
+
+        rng = np.random.default_rng(0)
+        grads = [rng.normal(size=result[1].shape) for result in results]
+        for cores in [1, 3]:
+            forces = descriptor.calculate_image_forces_batch(images, grads, cores=cores)
+            for result, grad, image_forces in zip(results, grads, forces):
+                _, _, val, row, col, size = result
+                fp_primes = sparse.coo_matrix((val, (row, col)), shape=tuple(size))
+                assert np.allclose(
+                    image_forces.flatten(), -fp_primes.T @ grad.flatten(), atol=1e-12
+                ), "Contracted forces are inconsistent!"
+
+
+def test_virial():
+    # the virial contracted by the kernels is minus the derivative of the
+    # contracted fingerprints with respect to the strain
+    atoms = bulk("Cu", "fcc", a=3.6, cubic=True).repeat((2, 1, 1))
+    atoms.rattle(0.1, seed=3)
+    descriptor = get_descriptor(True, prime_threshold=0.0)
+
+    def contracted_fps(strain):
+        image = atoms.copy()
+        image.set_cell(np.dot(atoms.cell, np.eye(3) + strain), scale_atoms=True)
+        fps = descriptor.calculate_image_fingerprints_batch([image], False, None)
+        return np.sum(fps[0][1] * grad)
+
+    grad = np.random.default_rng(0).normal(
+        size=(len(atoms), descriptor.params_set["num"])
+    )
+    _, (virial,) = descriptor.calculate_image_forces_batch(
+        [atoms], [grad], calc_virial=True
+    )
+
+    d = 1e-6
+    numeric_virial = np.zeros((3, 3))
+    for a in range(3):
+        for b in range(3):
+            strain = np.zeros((3, 3))
+            strain[a, b] = d
+            numeric_virial[a, b] = -(
+                contracted_fps(strain) - contracted_fps(-strain)
+            ) / (2 * d)
+    assert np.allclose(
+        virial, numeric_virial, rtol=1e-5, atol=1e-5
+    ), "Virial is inconsistent!"
+
+
+def test_virial_forces():
+    # the virial and the forces are contracted from the same derivatives, all
+    # of them whatever the threshold. Without periodic images, the virial is
+    # the sum of the positions times the forces
+    rng = np.random.default_rng(1)
+    atoms = Atoms(
+        "Cu8", positions=rng.uniform(0.0, 5.0, (8, 3)) + 10.0, cell=[30, 30, 30]
+    )
+    for threshold in [0.0, 1e-2]:
+        descriptor = get_descriptor(True, prime_threshold=threshold)
+        grad = rng.normal(size=(len(atoms), descriptor.params_set["num"]))
+        (forces,), (virial,) = descriptor.calculate_image_forces_batch(
+            [atoms], [grad], calc_virial=True
+        )
+        assert np.allclose(
+            virial, forces.T @ atoms.positions, rtol=1e-10, atol=1e-10
+        ), "Virial and forces are inconsistent!"
+
+
+def _large_fp_primes(extra_bytes, failed):
+    # derivatives of a large image in a process whose address space is limited
+    # to extra_bytes beyond the memory in use, less than their buffer needs
+    descriptor = get_descriptor(True, prime_threshold=0.0)
+    atoms = bulk("Cu", "fcc", a=3.6, cubic=True)
+    descriptor.calculate_image_fingerprints_batch([atoms], True, None)
+    with open("/proc/self/statm") as statm:
+        in_use = int(statm.read().split()[0]) * resource.getpagesize()
+    resource.setrlimit(
+        resource.RLIMIT_AS, (in_use + extra_bytes, resource.RLIM_INFINITY)
+    )
+    try:
+        descriptor.calculate_image_fingerprints_batch([atoms.repeat(5)], True, None)
+    except MemoryError:
+        failed.value = 1
+
+
+def test_fp_prime_memory_error():
+    # a derivative buffer that cannot be grown raises a MemoryError, its
+    # arrays are kept and released
+    context = multiprocessing.get_context("spawn")
+    failed = context.Value("i", 0)
+    process = context.Process(target=_large_fp_primes, args=(8 * 2**20, failed))
+    process.start()
+    process.join()
+    assert process.exitcode == 0 and failed.value == 1
@@ -0,0 +1,169 @@
+import tempfile
+
+import numpy as np
+from ase import Atoms
+
+from amptorch.descriptor.GMP import GMP
+from amptorch.descriptor.GMPOrderNorm import GMPOrderNorm
+
+elements = ["Cu", "C", "O"]
+
+
+def get_descriptor(solid_harmonics, orders, sigmas=[0.5, 1.0], **cutoff):
+    MCSHs = {
+        "MCSHs": {"orders": orders, "sigmas": sigmas},
+        "atom_gaussians": {
+            element: "amptorch/tests/GMP_params/%s_pseudodensity_4.g" % element
+            for element in elements
+        },
+        "cutoff": 8.0,
+        "solid_harmonics": solid_harmonics,
+    }
+    MCSHs.update(cutoff)
+    return GMPOrderNorm(MCSHs, elements)
+
+
+def get_gmp_descriptor(orders, sigmas, **options):
+    # all the groups of the orders
+    MCSHs = {
+        "MCSHs": {
+            str(order): {"groups": list(range(1, max(order, 1) + 1)), "sigmas": sigmas}
+            for order in orders
+        },
+        "atom_gaussians": {
+            element: "amptorch/tests/GMP_params/%s_pseudodensity_4.g" % element
+            for element in elements
+        },
+        "cutoff": 8.0,
+    }
+    MCSHs.update(options)
+    return GMP(MCSHs, elements)
+
+
+def rotation_matrix(angles):
+    rotation = np.eye(3)
+    for axis, angle in enumerate(angles):
+        c, s = np.cos(angle), np.sin(angle)
+        i, j = [k for k in range(3) if k != axis]
+        step = np.eye(3)
+        step[i, i], step[i, j], step[j, i], step[j, j] = c, -s, s, c
+        rotation = step @ rotation
+    return rotation
+
+
+def test_mcsh_rotation_invariance():
+    # the fingerprints contract all the components of an order, so they do
+    # not change when the structure is rotated. orders above 9 are computed
+    # by the same recurrences as the lower ones
+    rng = np.random.RandomState(0)
+    positions = rng.uniform(-2.0, 2.0, (6, 3))
+    rotated = positions @ rotation_matrix([0.3, 1.1, -0.7]).T
+    images = [
+        Atoms("CuOCuCOCu", positions=pos + 10.0, cell=[20, 20, 20])
+        for pos in [positions, rotated]
+    ]
+
+    for solid_harmonics in [True, False]:
+        descriptor = get_descriptor(solid_harmonics, orders=[0, 3, 6, 9, 10])
+        fps = [
+            result[1]
+            for result in descriptor.calculate_image_fingerprints_batch(
+                images, calc_derivatives=False, log=None
+            )
+        ]
+        assert np.allclose(
+            fps[0], fps[1], rtol=1e-8, atol=1e-10
+        ), "MCSH fingerprints are not rotation invariant!"
+
+
+def test_probe_cutoffs():
+    # with a cutoff tolerance each sigma gets its own cutoff, and its
+    # fingerprints are the ones of a descriptor using that cutoff for all
+    # the probes
+    rng = np.random.RandomState(1)
+    image = Atoms(
+        "Cu4C4O4", positions=rng.uniform(0.0, 9.0, (12, 3)), cell=[9, 9, 9], pbc=True
+    )
+    orders, sigmas = [0, 1, 2, 4], [0.25, 0.5, 1.0]
+    descriptor = get_descriptor(True, orders, sigmas, cutoff_tolerance=1e-4)
+    cutoffs = descriptor.descriptor_setup[: len(sigmas), 7]
+    assert np.all(np.diff(cutoffs) > 0), "Probe cutoffs do not grow with sigma!"
+    assert cutoffs[-1] <= 8.0, "Probe cutoffs are not bounded by the cutoff!"
+
+    fps = descriptor.calculate_image_fingerprints_batch(
+        [image], calc_derivatives=False, log=None
+    )[0][1]
+    for k, (sigma, cutoff) in enumerate(zip(sigmas, cutoffs)):
+        single = get_descriptor(True, orders, [sigma], cutoff=cutoff)
+        single_fps = single.calculate_image_fingerprints_batch(
+            [image], calc_derivatives=False, log=None
+        )[0][1]
+        assert np.allclose(
+            fps[:, k :: len(sigmas)], single_fps, rtol=1e-10, atol=1e-12
+        ), "Fingerprints with probe cutoffs do not match!"
+
+
+def test_overlap_screening():
+    # the overlaps changing the components by less than prime_threshold are
+    # screened out, which only perturbs the fingerprints slightly
+    rng = np.random.RandomState(2)
+    image = Atoms(
+        "Cu4C4O4", positions=rng.uniform(0.0, 9.0, (12, 3)), cell=[9, 9, 9], pbc=True
+    )
+    fps = [
+        get_descriptor(
+            True, [0, 1, 2, 3], [0.25, 1.0, 2.0], prime_threshold=threshold
+        ).calculate_image_fingerprints_batch([image], calc_derivatives=False, log=None)[
+            0
+        ][
+            1
+        ]
+        for threshold in [0.0, 1e-4]
+    ]
+    assert np.allclose(
+        fps[0], fps[1], rtol=1e-5, atol=1e-6
+    ), "Screened fingerprints differ from the exact ones!"
+
+    # as are the ones of GMP, whose components are the surface harmonics
+    descriptors = [
+        get_gmp_descriptor([0, 1, 2, 3], [0.25, 1.0, 2.0], prime_threshold=threshold)
+        for threshold in [0.0, 1e-4]
+    ]
+    assert np.isfinite(descriptors[1].params_set["screening_radii_sqr"]).any()
+    fps = [
+        descriptor.calculate_image_fingerprints_batch(
+            [image], calc_derivatives=False, log=None
+        )[0][1]
+        for descriptor in descriptors
+    ]
+    assert np.allclose(
+        fps[0], fps[1], rtol=1e-5, atol=1e-6
+    ), "Screened GMP fingerprints differ from the exact ones!"
+
+
+def test_screened_fingerprint_stores():
+    # the screened fingerprints are saved apart from the exact ones, which
+    # are not served the fingerprints of another threshold
+    rng = np.random.RandomState(3)
+    image = Atoms(
+        "Cu4C4O4", positions=rng.uniform(0.0, 9.0, (12, 3)), cell=[9, 9, 9], pbc=True
+    )
+    kwargs = dict(
+        calc_derivatives=False, save_fps=True, verbose=False, cores=1, log=None
+    )
+    for get in [
+        lambda **options: get_descriptor(True, [0, 1, 2], [0.25, 1.0, 2.0], **options),
+        lambda **options: get_gmp_descriptor([0, 1, 2], [0.25, 1.0, 2.0], **options),
+    ]:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = set()
+            for options in [{"prime_threshold": 1e-4}, {"prime_threshold": 1e-3}, {}]:
+                descriptor = get(**options)
+                descriptor.fp_database = tmp
+                fps = descriptor.prepare_fingerprints([image], **kwargs)[0]
+                exact = descriptor.calculate_image_fingerprints_batch(
+                    [image], calc_derivatives=False, log=None
+                )[0][1]
+                assert np.array_equal(fps["descriptors"], exact)
+                paths.add(descriptor.fp_store.path)
+            assert len(paths) == 3, "Thresholds share a fingerprint store!"
@@ -0,0 +1,98 @@
+import time
+
+import numpy as np
+from ase.build import bulk
+
+from amptorch.descriptor.Gaussian import Gaussian
+from amptorch.descriptor.GMPOrderNorm import GMPOrderNorm
+from amptorch.descriptor.neighbor_list import NeighborList
+
+Gs = {
+    "default": {
+        "G2": {"etas": [0.5], "rs_s": [0]},
+        "G4": {"etas": [0.05], "zetas": [1.0], "gammas": [1.0]},
+        "cutoff": 4.0,
+    },
+}
+
+MCSHs = {
+    "MCSHs": {"orders": [0, 1, 2], "sigmas": [0.5, 1.0]},
+    "atom_gaussians": {"Cu": "amptorch/tests/GMP_params/Cu_pseudodensity_4.g"},
+    "cutoff": 4.0,
+}
+
+
+def time_per_atom(descriptor, atoms, repeats=3):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _, fps, _, _, _, _ = descriptor.calculate_fingerprints(
+            atoms, "Cu", calc_derivatives=False, log=None
+        )
+        best = min(best, time.perf_counter() - start)
+    return best / len(atoms), fps
+
+
+def test_neighbor_scaling():
+    descriptors = [Gaussian(Gs, ["Cu"]), GMPOrderNorm(MCSHs, ["Cu"])]
+    unit_cell = bulk("Cu", "fcc", a=3.6, cubic=True)
+    small = unit_cell.repeat(4)
+    large = unit_cell.repeat(9)
+
+    for descriptor in descriptors:
+        _, reference = descriptor.calculate_fingerprints(
+            unit_cell, "Cu", calc_derivatives=False, log=None
+        )[:2]
+        small_time, small_fps = time_per_atom(descriptor, small)
+        large_time, large_fps = time_per_atom(descriptor, large)
+
+        # every atom of a perfect fcc crystal has the same environment
+        for fps in [small_fps, large_fps]:
+            assert np.allclose(fps, reference[0], rtol=1e-8, atol=1e-10)
+
+        # 11x more atoms, the time per atom should stay roughly constant
+        assert large_time < 3 * small_time, (
+            "%s fingerprinting does not scale linearly: %.2e s/atom for %d atoms, "
+            "%.2e s/atom for %d atoms"
+            % (
+                descriptor.descriptor_type,
+                small_time,
+                len(small),
+                large_time,
+                len(large),
+            )
+        )
+
+
+def test_verlet_neighbor_list():
+    descriptors = [Gaussian(Gs, ["Cu"]), GMPOrderNorm(MCSHs, ["Cu"])]
+    crystal = bulk("Cu", "fcc", a=3.6, cubic=True).repeat(2)
+    crystal.translate([0.5, 0.5, 0.5])
+    rng = np.random.RandomState(0)
+
+    for descriptor in descriptors:
+        neighbor_list = NeighborList(skin=1.0)
+        for step in range(5):
+            # small vibrations around the lattice sites, well within the skin
+            atoms = crystal.copy()
+            atoms.positions += rng.uniform(-0.1, 0.1, size=atoms.positions.shape)
+            reference = descriptor.calculate_fingerprints(
+                atoms, "Cu", calc_derivatives=True, log=None
+            )
+            result = descriptor.calculate_fingerprints(
+                atoms,
+                "Cu",
+                calc_derivatives=True,
+                log=None,
+                neighbor_list=neighbor_list,
+            )
+            for ref, res in zip(reference, result):
+                assert np.allclose(ref, res, rtol=1e-10, atol=1e-12)
+        assert neighbor_list.num_builds == 1
+
+        # the atoms moved by more than half of the skin
+        atoms.positions[0] += 0.6
+        descriptor.calculate_fingerprints(
+            atoms, "Cu", calc_derivatives=False, log=None, neighbor_list=neighbor_list
+        )
+        assert neighbor_list.num_builds == 2
@@ -114,6 +114,11 @@ def test_pretrained_no_config():
     assert e_mae_1 == e_mae_2, "configless - pretrained energy metrics inconsistent!"
     assert f_mae_1 == f_mae_2, "configless - pretrained force metrics inconsistent!"
 
+    # the descriptor of the predictions is built once and reused
+    descriptor = trainer_2.descriptor
+    assert get_metrics(trainer_2) == (e_mae_2, f_mae_2)
+    assert trainer_2.descriptor is descriptor
+
 
 if __name__ == "__main__":
     print("\n\n--------- Pre Trained Test ---------\n")
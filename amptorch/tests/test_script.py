@@ -5,9 +5,37 @@ repository.
 
 import unittest
 
-from .consistency_test import test_energy_force_consistency
-from .cutoff_funcs_test import test_cutoff_funcs
+from .batch_fingerprint_test import (
+    test_batch_fingerprints,
+    test_environment_deduplication,
+    test_fingerprint_store,
+    test_geometry_hash,
+    test_image_fingerprints,
+    test_restricted_fingerprints,
+    test_single_precision_fingerprints,
+)
+from .consistency_test import (
+    test_energy_force_consistency,
+    test_fingerprint_cache,
+    test_incremental_energy,
+)
+from .cutoff_funcs_test import test_cutoff_funcs, test_tabulated_cutoff_funcs
+from .fp_prime_test import (
+    test_fp_primes,
+    test_fp_primes_cores,
+    test_force_contraction,
+    test_fp_prime_memory_error,
+    test_virial,
+    test_virial_forces,
+)
 from .gaussian_descriptor_set_test import test_gaussian_descriptor_set
+from .mcsh_test import (
+    test_mcsh_rotation_invariance,
+    test_overlap_screening,
+    test_probe_cutoffs,
+    test_screened_fingerprint_stores,
+)
+from .neighbor_scaling_test import test_neighbor_scaling, test_verlet_neighbor_list
 from .pretrained_test import test_pretrained, test_pretrained_no_config
 from .pretrained_test_lmdb import test_lmdb_pretrained, test_lmdb_pretrained_no_config
 from .training_test import test_training
@@ -18,13 +46,49 @@ from .cp_uncertainty_calibration_test import test_cp_uncertainty_calibration
 class TestMethods(unittest.TestCase):
     def test_energy_force_consistency(self):
         test_energy_force_consistency()
+        test_incremental_energy()
+        test_fingerprint_cache()
 
     def test_cosine_and_polynomial_cutoff_funcs(self):
         test_cutoff_funcs()
+        test_tabulated_cutoff_funcs()
+
+    def test_fp_primes(self):
+        test_fp_primes()
+        test_fp_primes_cores()
+        test_force_contraction()
+        test_virial()
+        test_virial_forces()
+        test_fp_prime_memory_error()
+
+    def test_batch_fingerprints(self):
+        test_batch_fingerprints()
+        test_image_fingerprints()
+        test_single_precision_fingerprints()
+        test_restricted_fingerprints()
+        test_environment_deduplication()
+        test_fingerprint_store()
+        test_geometry_hash()
+
+    def test_mcsh_rotation_invariance(self):
+        test_mcsh_rotation_invariance()
+
+    def test_probe_cutoffs(self):
+        test_probe_cutoffs()
+
+    def test_overlap_screening(self):
+        test_overlap_screening()
+
+    def test_screened_fingerprint_stores(self):
+        test_screened_fingerprint_stores()
 
     def test_gds(self):
         test_gaussian_descriptor_set()
 
+    def test_neighbor_scaling(self):
+        test_neighbor_scaling()
+        test_verlet_neighbor_list()
+
     def test_load_retrain(self):
         test_pretrained()
         test_pretrained_no_config()
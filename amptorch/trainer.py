@@ -6,6 +6,7 @@ import warnings
 import json
 
 import ase.io
+from ase.stress import full_3x3_to_voigt_6_stress
 import numpy as np
 import skorch.net
 import torch
@@ -19,10 +20,11 @@ from amptorch.dataset_lmdb import (
     PartialCacheSampler,
     get_lmdb_dataset,
 )
-from amptorch.descriptor.util import list_symbols_to_indices
+from amptorch.descriptor.base_descriptor import _selection_hash
+from amptorch.descriptor.util import get_hash, list_symbols_to_indices
 from amptorch.metrics import evaluator
 from amptorch.model import BPNN, SingleNN, CustomLoss
-from amptorch.preprocessing import AtomsToData
+from amptorch.preprocessing import AtomsToData, FingerprintCache
 from amptorch.utils import (
     to_tensor,
     train_end_load_best_loss,
@@ -43,6 +45,16 @@ except NameError:
     from tqdm import tqdm
 
 
+# precisions accepted for config["cmd"]["dtype"] besides the tensor types,
+# the fingerprints are computed and stored in the same precision
+TENSOR_TYPES = {
+    torch.float32: torch.FloatTensor,
+    "float32": torch.FloatTensor,
+    torch.float64: torch.DoubleTensor,
+    "float64": torch.DoubleTensor,
+}
+
+
 class AtomsTrainer:
     """
     Main trainer class to define the atomistic neural network force field for energy (and force prediction).
@@ -66,6 +78,7 @@ class AtomsTrainer:
         if load_dataset:
             self.load_dataset()
         self.load_model()
+        self.load_predictor()
         self.load_criterion()
         self.load_optimizer()
         self.load_logger()
@@ -77,7 +90,7 @@ class AtomsTrainer:
         Set up attributes from input configuration dictionary.
         """
         dtype = self.config["cmd"].get("dtype", torch.DoubleTensor)
-        torch.set_default_tensor_type(dtype)
+        torch.set_default_tensor_type(TENSOR_TYPES.get(dtype, dtype))
         self.timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
         self.identifier = self.config["cmd"].get("identifier", False)
         if self.identifier:
@@ -100,6 +113,11 @@ class AtomsTrainer:
             print(f"Results saved to {self.cp_dir}")
             os.makedirs(self.cp_dir, exist_ok=True)
 
+        # data of the geometries predicted on, kept in memory within a byte
+        # budget. It can also be set on a trainer loaded from a checkpoint
+        fp_cache_size = self.config["dataset"].get("fp_cache_size")
+        self.fp_cache = FingerprintCache(fp_cache_size) if fp_cache_size else None
+
     def load_rng_seed(self):
         """
         Load a fixed random seed for reproducibility.
@@ -164,6 +182,10 @@ class AtomsTrainer:
                 descriptor_setup=descriptor_setup,
                 forcetraining=self.forcetraining,
                 save_fps=self.config["dataset"].get("save_fps", True),
+                cores=self.config["dataset"].get("cores", 1),
+                environment_tolerance=self.config["dataset"].get(
+                    "environment_tolerance"
+                ),
                 scaling=self.config["dataset"].get(
                     "scaling",
                     {"type": "normalize", "range": (0, 1), "elementwise": True},
@@ -186,6 +208,21 @@ class AtomsTrainer:
             torch.save(self.config, os.path.join(self.cp_dir, "config.pt"))
         print("Loading dataset: {} images".format(len(self.train_dataset)))
 
+    def load_predictor(self):
+        """
+        Build the descriptor and the collater used by `predict` once, so that
+        repeated predictions (e.g. the steps of a molecular dynamics run) do
+        not set them up again. The data converters are built on first use.
+        """
+        descriptor_setup = self.config["dataset"].get("descriptor")
+        self.descriptor = (
+            None if descriptor_setup is None else construct_descriptor(descriptor_setup)
+        )
+        self.predict_converters = {}
+        self.predict_collater = DataCollater(
+            train=False, forcetraining=self.forcetraining
+        )
+
     def load_model(self):
         """
         Load the parameters for atomistic neural network models from config.
@@ -400,6 +437,8 @@ class AtomsTrainer:
         get_latent=None,
         get_descriptor=False,
         save_fps=False,
+        neighbor_lists=None,
+        get_stress=False,
     ):
         """
         Method used to make energy (and force) predictions for input images.
@@ -421,6 +460,12 @@ class AtomsTrainer:
         save_fps : bool
             Option to save the calculated fingerprints for accelerated computation.
 
+        neighbor_lists : List[amptorch.descriptor.neighbor_list.NeighborList] (default to None)
+            Optional Verlet neighbor list of each image, reused by repeated predictions on moving atoms.
+
+        get_stress : bool
+            Option to also predict the stress of the images, which must be periodic. The stress is computed with the forces by the descriptor kernels, and is added to the output dictionary as "stress", in the Voigt order of ase (xx, yy, zz, yz, xz, xy).
+
         Output:
         -------------------
         predictions : dict
@@ -430,27 +475,36 @@ class AtomsTrainer:
             warnings.warn("No images found!", stacklevel=2)
             return images
 
-        self.descriptor = construct_descriptor(self.config["dataset"]["descriptor"])
-
-        t0 = time.time()
-        a2d = AtomsToData(
-            descriptor=self.descriptor,
-            r_energy=False,
-            r_forces=False,
-            save_fps=save_fps,
-            fprimes=self.forcetraining,
-            cores=1,
+        self._predict_descriptor()
+
+        # the forces are contracted by the descriptor kernels from the gradient
+        # of the energy with respect to the fingerprints, so that the
+        # fingerprint derivatives are never stored. With a fingerprint cache
+        # the derivatives are cached with the fingerprints instead (unless the
+        # stress is requested), so that a cached geometry skips the kernels
+        contract_forces = (
+            self.forcetraining
+            and self.descriptor.supports_force_contraction
+            and hasattr(self.net.module, "energy_gradients")
+            and (self.fp_cache is None or get_stress)
         )
+        if get_stress and not contract_forces:
+            raise NotImplementedError(
+                "Stress requires a force model and a descriptor contracting the forces!"
+            )
 
-        data_list = a2d.convert_all(images, disable_tqdm=disable_tqdm)
+        t0 = time.time()
+        fprimes = self.forcetraining and not contract_forces
+        a2d = self._predict_converter(save_fps, fprimes)
 
-        self.feature_scaler.norm(data_list, disable_tqdm=disable_tqdm)
+        data_list = self._predict_data(a2d, images, disable_tqdm, neighbor_lists)
         t_fingerPrint = time.time() - t0
 
         self.net.module.eval()
-        collate_fn = DataCollater(train=False, forcetraining=self.forcetraining)
+        collate_fn = self.predict_collater
 
         predictions = {"energy": [], "forces": []}
+        fingerprint_grads = []
 
         t_forwardPass = 0
 
@@ -488,19 +542,59 @@ class AtomsTrainer:
             collated = collate_fn([data]).to(self.device)
 
             t0 = time.time()
-            energy, forces = self.net.module([collated])
+            if contract_forces:
+                energy, gradients = self.net.module.energy_gradients(collated)
+                fingerprint_grads.append(
+                    self.feature_scaler.norm_gradients(
+                        gradients.cpu(), data.atomic_numbers
+                    ).numpy()
+                )
+            else:
+                energy, forces = self.net.module([collated])
             energy = self.target_scaler.denorm(
                 energy.detach().cpu(), pred="energy"
             ).tolist()
             # if self.atomic_correction_scaler is not None:
             #     energy = self.atomic_correction_scaler.denorm(energy, data_list[idx])
-            forces = self.target_scaler.denorm(
-                forces.detach().cpu(), pred="forces"
-            ).numpy()
+            if not contract_forces:
+                forces = self.target_scaler.denorm(
+                    forces.detach().cpu(), pred="forces"
+                ).numpy()
+                predictions["forces"].append(forces)
             t_forwardPass += time.time() - t0
 
             predictions["energy"].extend(energy)
-            predictions["forces"].append(forces)
+
+        if contract_forces:
+            t0 = time.time()
+            forces = self.descriptor.calculate_image_forces_batch(
+                images,
+                fingerprint_grads,
+                cores=self.config["dataset"].get("cores", 1),
+                neighbor_lists=neighbor_lists,
+                calc_virial=get_stress,
+            )
+            if get_stress:
+                forces, virials = forces
+                predictions["stress"] = [
+                    self.target_scaler.denorm(
+                        torch.from_numpy(
+                            full_3x3_to_voigt_6_stress(
+                                -0.5 * (virial + virial.T) / image.get_volume()
+                            )
+                        ).to(torch.get_default_dtype()),
+                        pred="stress",
+                    ).numpy()
+                    for image, virial in zip(images, virials)
+                ]
+            predictions["forces"] = [
+                self.target_scaler.denorm(
+                    torch.from_numpy(image_forces).to(torch.get_default_dtype()),
+                    pred="forces",
+                ).numpy()
+                for image_forces in forces
+            ]
+            t_forwardPass += time.time() - t0
 
         # time fingerprinting and neural network passing
         predictions["t_fingerPrint"] = t_fingerPrint
@@ -508,6 +602,72 @@ class AtomsTrainer:
 
         return predictions
 
+    def _predict_descriptor(self):
+        # descriptor of predict, see load_predictor
+        if self.descriptor is None:
+            # the dataset of a debug run is not described in its config
+            self.descriptor = construct_descriptor(self.config["dataset"]["descriptor"])
+        return self.descriptor
+
+    def _predict_converter(self, save_fps, fprimes):
+        # data converter of predict, built on first use with the dataset
+        # options of the config
+        a2d = self.predict_converters.get((save_fps, fprimes))
+        if a2d is None:
+            a2d = AtomsToData(
+                descriptor=self._predict_descriptor(),
+                r_energy=False,
+                r_forces=False,
+                save_fps=save_fps,
+                fprimes=fprimes,
+                cores=self.config["dataset"].get("cores", 1),
+                environment_tolerance=self.config["dataset"].get(
+                    "environment_tolerance"
+                ),
+            )
+            self.predict_converters[save_fps, fprimes] = a2d
+        return a2d
+
+    def _predict_data(
+        self, a2d, images, disable_tqdm, neighbor_lists, center_atoms=None
+    ):
+        # scaled data of the images (restricted to center_atoms, optional list
+        # per image), the ones of the geometries seen by an earlier call are
+        # taken from self.fp_cache
+        fp_cache = self.fp_cache
+        if fp_cache is None:
+            data_list = a2d.convert_all(
+                images,
+                disable_tqdm=disable_tqdm,
+                neighbor_lists=neighbor_lists,
+                center_atoms=center_atoms,
+            )
+            self.feature_scaler.norm(data_list, disable_tqdm=disable_tqdm)
+            return data_list
+
+        center_atoms = center_atoms or [None] * len(images)
+        suffix = "-fprimes" if a2d.fprimes else ""
+        keys = [
+            get_hash(image) + _selection_hash(centers, None) + suffix
+            for image, centers in zip(images, center_atoms)
+        ]
+        data_list = [fp_cache.get(key) for key in keys]
+        pending = [idx for idx, data in enumerate(data_list) if data is None]
+        if pending:
+            computed = a2d.convert_all(
+                [images[idx] for idx in pending],
+                disable_tqdm=disable_tqdm,
+                neighbor_lists=None
+                if neighbor_lists is None
+                else [neighbor_lists[idx] for idx in pending],
+                center_atoms=[center_atoms[idx] for idx in pending],
+            )
+            self.feature_scaler.norm(computed, disable_tqdm=disable_tqdm)
+            for idx, data in zip(pending, computed):
+                data_list[idx] = data
+                fp_cache.put(keys[idx], data)
+        return data_list
+
     def load_pretrained(self, checkpoint_path=None, gpu2cpu=False):
         """
         Load pretrained model with configuration and parameters in the checkpoint.